@@ -1,7 +1,6 @@
 import streamlit as st
-import os
-import tempfile
-from utils import translate_text, text_to_speech
+from languages import LANGUAGES, LANGUAGE_NAMES
+from utils import translate_text, translate_fanout, text_to_speech_bytes, detect_source_language
 
 def main():
     # Page configuration with professional theme
@@ -415,28 +414,8 @@ def main():
     """, unsafe_allow_html=True)
     
     # Language options
-    languages = {
-        "🇺🇸 English": "en",
-        "🇪🇸 Spanish": "es", 
-        "🇫🇷 French": "fr",
-        "🇩🇪 German": "de",
-        "🇮🇹 Italian": "it",
-        "🇵🇹 Portuguese": "pt",
-        "🇷🇺 Russian": "ru",
-        "🇯🇵 Japanese": "ja",
-        "🇰🇷 Korean": "ko",
-        "🇨🇳 Chinese (Simplified)": "zh",
-        "🇸🇦 Arabic": "ar",
-        "🇮🇳 Hindi": "hi",
-        "🇳🇱 Dutch": "nl",
-        "🇸🇪 Swedish": "sv",
-        "🇳🇴 Norwegian": "no",
-        "🇩🇰 Danish": "da",
-        "🇫🇮 Finnish": "fi",
-        "🇵🇱 Polish": "pl",
-        "🇹🇷 Turkish": "tr",
-        "🇬🇷 Greek": "el"
-    }
+    languages = {f"{flag} {name}": code for code, name, flag in LANGUAGES}
+    auto_detect = "🔍 Detect language"
     
     # Language selection in columns
     col1, col2 = st.columns(2)
@@ -445,26 +424,44 @@ def main():
         st.markdown('<div class="language-selector">', unsafe_allow_html=True)
         source_lang_name = st.selectbox(
             "**From Language**",
-            options=list(languages.keys()),
-            index=0,
-            help="Select the source language"
+            options=[auto_detect] + list(languages.keys()),
+            index=1,
+            help="Select the source language, or let it be detected from the text"
         )
-        source_lang = languages[source_lang_name]
+        source_lang = "auto" if source_lang_name == auto_detect else languages[source_lang_name]
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col2:
         st.markdown('<div class="language-selector">', unsafe_allow_html=True)
-        target_lang_name = st.selectbox(
-            "**To Language**", 
-            options=list(languages.keys()),
-            index=1,
-            help="Select the target language"
-        )
-        target_lang = languages[target_lang_name]
+        multi_target = st.checkbox("Translate into several languages", help="Translate into many languages at once")
+        if multi_target:
+            target_lang_names = st.multiselect(
+                "**To Languages**",
+                options=[name for name in languages if name != source_lang_name],
+                default=[name for name in languages if name != source_lang_name],
+                help="Select the target languages"
+            )
+            target_langs = [languages[name] for name in target_lang_names]
+            target_lang_name, target_lang = (target_lang_names[0], target_langs[0]) if target_langs else ("", "")
+        else:
+            target_lang_name = st.selectbox(
+                "**To Language**", 
+                options=list(languages.keys()),
+                index=1,
+                help="Select the target language"
+            )
+            target_lang = languages[target_lang_name]
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Validation
-    if source_lang == target_lang:
+    if multi_target and not target_langs:
+        st.markdown("""
+        <div class="error-message">
+            ⚠️ Please select at least one target language.
+        </div>
+        """, unsafe_allow_html=True)
+        return
+    if not multi_target and source_lang == target_lang:
         st.markdown("""
         <div class="error-message">
             ⚠️ Source and target languages cannot be the same. Please select different languages.
@@ -495,8 +492,32 @@ def main():
             disabled=not input_text.strip()
         )
     
+    # Multi-language translation section
+    if multi_target and translate_button and input_text.strip():
+        try:
+            with st.spinner(f"🔄 Translating into {len(target_langs)} languages..."):
+                translations = translate_fanout(source_lang, target_langs, input_text.strip())
+            
+            rows = "".join(
+                f'<div class="language-indicator">{name.split(" ", 1)[1]}</div>'
+                f'<div class="translation-text">{translations[languages[name]]}</div>'
+                for name in target_lang_names
+            )
+            st.markdown(f"""
+            <div class="translation-result">
+                <h3 style="color: #2d3748; margin-bottom: 1rem;">✅ Translation Complete</h3>
+                {rows}
+            </div>
+            """, unsafe_allow_html=True)
+        except Exception as e:
+            st.markdown(f"""
+            <div class="error-message">
+                ❌ Translation failed: {str(e)}
+            </div>
+            """, unsafe_allow_html=True)
+    
     # Translation section
-    if translate_button and input_text.strip():
+    elif translate_button and input_text.strip():
         # Progress indicators
         progress_bar = st.progress(0)
         status_text = st.empty()
@@ -518,11 +539,17 @@ def main():
             progress_bar.empty()
             status_text.empty()
             
+            if source_lang == "auto":
+                detected = detect_source_language(input_text.strip())
+                source_label = f"{LANGUAGE_NAMES.get(detected, 'Unknown language')} (detected)"
+            else:
+                source_label = source_lang_name.split(' ')[1]
+            
             # Display translation result
             st.markdown(f"""
             <div class="translation-result">
                 <h3 style="color: #2d3748; margin-bottom: 1rem;">✅ Translation Complete</h3>
-                <div class="language-indicator">{source_lang_name.split(' ')[1]}</div>
+                <div class="language-indicator">{source_label}</div>
                 <span style="font-size: 1.5rem; color: #667eea;">→</span>
                 <div class="language-indicator">{target_lang_name.split(' ')[1]}</div>
                 <div class="translation-text">{translated_text}</div>
@@ -545,20 +572,8 @@ def main():
                 if st.button("🎵 Generate Audio", help="Generate audio file from translation"):
                     with st.spinner("🔊 Generating audio..."):
                         try:
-                            # Create temporary file
-                            with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as tmp_file:
-                                audio_file_path = tmp_file.name
-                            
-                            # Generate audio
-                            audio_file = text_to_speech(
-                                translated_text, 
-                                target_lang, 
-                                audio_file_path
-                            )
-                            
-                            # Read audio file
-                            with open(audio_file, "rb") as f:
-                                audio_bytes = f.read()
+                            # Generate audio in memory
+                            audio_bytes = text_to_speech_bytes(translated_text, target_lang)
                             
                             # Download button
                             st.markdown("""
@@ -574,12 +589,6 @@ def main():
                                 mime="audio/mpeg",
                                 help="Download the audio file"
                             )
-                            
-                            # Clean up
-                            try:
-                                os.unlink(audio_file)
-                            except:
-                                pass
                                 
                         except Exception as e:
                             st.markdown(f"""
@@ -0,0 +1,186 @@
+"""
+Content-addressed audio cache for the Language Translation Tool.
+Stores generated MP3 files under the hash of (normalized text, language, speed)
+so repeated text-to-speech requests are served from disk without any network call.
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
+import unicodedata
+from typing import List, Optional, Tuple
+
+DEFAULT_AUDIO_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "language-translation-tool", "audio"
+)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class AudioCache:
+    """
+    Directory of MP3 files named by content hash, evicted least recently used first.
+
+    Files are written to a temporary name and renamed into place, so several
+    processes can share one cache directory.
+    """
+
+    def __init__(self, directory: str = DEFAULT_AUDIO_CACHE_DIR, max_bytes: int = 200 * 1024 * 1024,
+                 link: bool = False):
+        """
+        Args:
+            directory (str): Cache directory
+            max_bytes (int): Total size the cache is trimmed down to on eviction
+            link (bool): Hard-link cached files to their destination instead of copying
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.link = link
+        self._lock = threading.Lock()
+        self._bytes_since_evict = 0
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(text: str, lang: str, slow: bool = False) -> str:
+        """Return the content hash for a TTS request."""
+        normalized = _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+        payload = "\0".join([normalized, lang, "slow" if slow else "normal"])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def path_for(self, key: str) -> str:
+        """Return the storage path for a content hash."""
+        return os.path.join(self.directory, key[:2], key + ".mp3")
+
+    def get(self, text: str, lang: str, slow: bool = False) -> Optional[str]:
+        """
+        Look up cached audio.
+
+        Returns:
+            str: Path of the cached MP3, or None on a miss
+        """
+        path = self.path_for(self.key(text, lang, slow))
+        try:
+            # Touching the file records the access for LRU eviction
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return path
+
+    def put_file(self, text: str, lang: str, slow: bool, source_path: str) -> str:
+        """Move a freshly generated MP3 into the cache and return its cached path."""
+        path = self.path_for(self.key(text, lang, slow))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        size = os.path.getsize(source_path)
+        os.replace(source_path, path)
+        self._account(size)
+        return path
+
+    def put_bytes(self, text: str, lang: str, slow: bool, data: bytes) -> str:
+        """Store MP3 bytes in the cache and return the cached path."""
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        return self.put_file(text, lang, slow, tmp_path)
+
+    def copy_to(self, cached_path: str, output_file: str) -> str:
+        """Place a cached MP3 at output_file by hard link (if enabled) or copy."""
+        if os.path.abspath(cached_path) == os.path.abspath(output_file):
+            return output_file
+        # output_file may be a hard link to another cached clip; writing into it would change that clip
+        if os.path.lexists(output_file):
+            os.unlink(output_file)
+        if self.link:
+            try:
+                os.link(cached_path, output_file)
+                return output_file
+            except OSError:
+                pass
+        shutil.copyfile(cached_path, output_file)
+        return output_file
+
+    def _account(self, size: int) -> None:
+        with self._lock:
+            self._bytes_since_evict += size
+            should_evict = self._bytes_since_evict >= self.max_bytes // 20
+            if should_evict:
+                self._bytes_since_evict = 0
+        if should_evict:
+            self.evict()
+
+    def _entries(self):
+        """Return (mtime, size, path) for every cached MP3."""
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(".mp3"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def hottest(self, limit: int) -> List[Tuple[str, str, float]]:
+        """
+        Return up to limit cached clips, most recently used first.
+
+        Returns:
+            list: (content hash, path, last use time) tuples
+        """
+        entries = sorted(self._entries(), reverse=True)[:limit]
+        return [(os.path.basename(path)[:-len(".mp3")], path, used_at) for used_at, _, path in entries]
+
+    def evict(self) -> int:
+        """
+        Remove the least recently used files until the cache fits in max_bytes.
+
+        Returns:
+            int: Number of files removed
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove every cached file and reset the counters."""
+        for _, _, path in self._entries():
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        with self._lock:
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the cache size on disk."""
+        entries = self._entries()
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "entries": len(entries),
+                "bytes": sum(size for _, size, _ in entries),
+            }
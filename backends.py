@@ -0,0 +1,292 @@
+"""
+Pluggable translation and text-to-speech backends for the Language Translation Tool.
+utils.translate_text and utils.text_to_speech dispatch through the active backends,
+so the Google services can be swapped for the deterministic local stand-ins
+(e.g. TRANSLATOR_BACKEND=local) to run tests and benchmarks offline.
+"""
+
+import hashlib
+import os
+import random
+import threading
+import time
+from typing import Callable, Dict, Iterator, Optional, Union
+
+from languages import LANGUAGE_CODES
+from resilience import time_remaining
+
+# Languages accepted by the local backends (the same 20 the front ends offer)
+LOCAL_LANGUAGES = set(LANGUAGE_CODES)
+
+# Phrases the local translation backend answers like the real service does
+DEFAULT_PHRASEBOOK = {
+    ("en", "es", "Hello"): "Hola",
+    ("en", "fr", "Hello"): "Bonjour",
+    ("en", "de", "Hello"): "Hallo",
+    ("es", "en", "Hola"): "Hello",
+    ("fr", "en", "Bonjour"): "Good morning",
+}
+
+
+class TranslationBackend:
+    """Interface every translation backend implements."""
+
+    name = "base"
+    # Longest text accepted in a single request
+    max_chars = 5000
+
+    def translate(self, source_lang: str, target_lang: str, text: str) -> str:
+        """Translate one (already stripped) text."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class TTSBackend:
+    """Interface every text-to-speech backend implements."""
+
+    name = "base"
+    # Longest text synthesized in a single request
+    max_chars = 100
+
+    def synthesize(self, text: str, lang: str, slow: bool = False) -> bytes:
+        """Return MP3 data for the text."""
+        raise NotImplementedError
+
+    def stream(self, text: str, lang: str, slow: bool = False) -> Iterator[bytes]:
+        """Yield MP3 data piece by piece (by default, all at once)."""
+        yield self.synthesize(text, lang, slow)
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class GoogleTranslateBackend(TranslationBackend):
+    """Google Translate through deep_translator, with pooled translators and connections."""
+
+    name = "google"
+
+    def __init__(self, pool_size: int = 32):
+        from translator_pool import TranslatorPool
+        self.pool = TranslatorPool(pool_size=pool_size)
+
+    def translate(self, source_lang: str, target_lang: str, text: str) -> str:
+        return self.pool.get(source_lang, target_lang).translate(text)
+
+    def close(self) -> None:
+        self.pool.close()
+
+
+class GoogleTTSBackend(TTSBackend):
+    """Google Text-to-Speech through gTTS."""
+
+    name = "google"
+
+    def __init__(self):
+        from gtts import gTTS
+        self._gTTS = gTTS
+        self.max_chars = gTTS.GOOGLE_TTS_MAX_CHARS
+
+    def synthesize(self, text: str, lang: str, slow: bool = False) -> bytes:
+        return b"".join(self.stream(text, lang, slow))
+
+    def stream(self, text: str, lang: str, slow: bool = False) -> Iterator[bytes]:
+        return self._gTTS(text=text, lang=lang, slow=slow).stream()
+
+
+class LocalTranslationBackend(TranslationBackend):
+    """
+    Deterministic offline translation backend.
+
+    Known phrases come from a phrasebook; anything else is echoed line by line
+    as "[<target>] <line>". An artificial latency can be added to every call
+    to stand in for network round-trips, and faults can be injected to test
+    retries and circuit breaking: random failures (failure_rate), the next few
+    calls failing (fail_next) or a full outage (down). A call whose latency
+    exceeds the caller's deadline times out like a network request would.
+    """
+
+    name = "local"
+
+    def __init__(self, phrasebook: Optional[Dict] = None, latency: float = 0.0,
+                 failure_rate: float = 0.0, seed: Optional[int] = None):
+        """
+        Args:
+            phrasebook (dict): Maps (source_lang, target_lang, text) to a translation
+            latency (float): Seconds each call sleeps before answering
+            failure_rate (float): Probability (0-1) that a call fails with ConnectionError
+            seed (int): Seed for the failure_rate draws
+        """
+        self.phrasebook = dict(DEFAULT_PHRASEBOOK if phrasebook is None else phrasebook)
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.down = False
+        self.calls = 0
+        self.failures = 0
+        self._pending_failures = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def fail_next(self, count: int = 1, error: Optional[Exception] = None) -> None:
+        """Make the next count calls raise error (a ConnectionError by default)."""
+        with self._lock:
+            self._pending_failures.extend([error or ConnectionError("Connection reset by local backend")] * count)
+
+    def _injected_fault(self) -> Optional[Exception]:
+        with self._lock:
+            if self._pending_failures:
+                return self._pending_failures.pop(0)
+            if self.down:
+                return ConnectionError("Connection refused by local backend (down)")
+            if self.failure_rate and self._random.random() < self.failure_rate:
+                return ConnectionError("Connection reset by local backend")
+        return None
+
+    def translate(self, source_lang: str, target_lang: str, text: str) -> str:
+        if source_lang != "auto" and source_lang not in LOCAL_LANGUAGES:
+            raise ValueError(f"{source_lang} --> No support for the provided language.")
+        if target_lang not in LOCAL_LANGUAGES:
+            raise ValueError(f"{target_lang} --> No support for the provided language.")
+        with self._lock:
+            self.calls += 1
+        fault = self._injected_fault()
+        if fault is not None:
+            with self._lock:
+                self.failures += 1
+            raise fault
+        if self.latency:
+            timeout = time_remaining()
+            if timeout is not None and timeout < self.latency:
+                time.sleep(timeout)
+                with self._lock:
+                    self.failures += 1
+                raise TimeoutError("Local backend request timed out")
+            time.sleep(self.latency)
+        return "\n".join(
+            self.phrasebook.get((source_lang, target_lang, line), f"[{target_lang}] {line}" if line else line)
+            for line in text.split("\n")
+        )
+
+
+class LocalTTSBackend(TTSBackend):
+    """
+    Deterministic offline text-to-speech backend.
+    Returns a fake MP3 payload whose size grows with the text length. Like gTTS,
+    it pays the latency once per max_chars segment of the text.
+    """
+
+    name = "local"
+
+    def __init__(self, latency: float = 0.0):
+        """
+        Args:
+            latency (float): Seconds each segment request sleeps before answering
+        """
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def synthesize(self, text: str, lang: str, slow: bool = False) -> bytes:
+        if lang not in LOCAL_LANGUAGES:
+            raise ValueError(f"Language not supported: {lang}")
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            segments = -(-len(text) // self.max_chars)
+            time.sleep(self.latency * max(1, segments))
+        digest = hashlib.sha256("\0".join([text, lang, str(slow)]).encode("utf-8")).digest()
+        frames = max(1, len(text) // 2)
+        return b"ID3" + digest * (32 + frames)
+
+
+_translation_factories: Dict[str, Callable[[], TranslationBackend]] = {
+    "google": GoogleTranslateBackend,
+    "local": LocalTranslationBackend,
+}
+_tts_factories: Dict[str, Callable[[], TTSBackend]] = {
+    "google": GoogleTTSBackend,
+    "local": LocalTTSBackend,
+}
+
+_active_translation: Optional[TranslationBackend] = None
+_active_tts: Optional[TTSBackend] = None
+_lock = threading.Lock()
+
+
+def register_translation_backend(name: str, factory: Callable[[], TranslationBackend]) -> None:
+    """Make a translation backend available by name (factory is called on first use)."""
+    _translation_factories[name] = factory
+
+
+def register_tts_backend(name: str, factory: Callable[[], TTSBackend]) -> None:
+    """Make a text-to-speech backend available by name (factory is called on first use)."""
+    _tts_factories[name] = factory
+
+
+def _create(factories: Dict, name: str, kind: str):
+    if name not in factories:
+        raise ValueError(f"Unknown {kind} backend: {name}. Available: {', '.join(sorted(factories))}")
+    return factories[name]()
+
+
+def set_translation_backend(backend: Union[str, TranslationBackend]) -> TranslationBackend:
+    """
+    Switch the translation backend used by utils.
+
+    Args:
+        backend (str or TranslationBackend): Registered name or backend instance
+
+    Returns:
+        TranslationBackend: The active backend
+    """
+    global _active_translation
+    if isinstance(backend, str):
+        backend = _create(_translation_factories, backend, "translation")
+    with _lock:
+        _active_translation = backend
+    return backend
+
+
+def set_tts_backend(backend: Union[str, TTSBackend]) -> TTSBackend:
+    """
+    Switch the text-to-speech backend used by utils.
+
+    Args:
+        backend (str or TTSBackend): Registered name or backend instance
+
+    Returns:
+        TTSBackend: The active backend
+    """
+    global _active_tts
+    if isinstance(backend, str):
+        backend = _create(_tts_factories, backend, "text-to-speech")
+    with _lock:
+        _active_tts = backend
+    return backend
+
+
+def get_translation_backend() -> TranslationBackend:
+    """Return the active translation backend (TRANSLATOR_BACKEND, default "google")."""
+    global _active_translation
+    backend = _active_translation
+    if backend is None:
+        with _lock:
+            if _active_translation is None:
+                name = os.environ.get("TRANSLATOR_BACKEND", "google")
+                _active_translation = _create(_translation_factories, name, "translation")
+            backend = _active_translation
+    return backend
+
+
+def get_tts_backend() -> TTSBackend:
+    """Return the active text-to-speech backend (TRANSLATOR_TTS_BACKEND, default TRANSLATOR_BACKEND)."""
+    global _active_tts
+    backend = _active_tts
+    if backend is None:
+        with _lock:
+            if _active_tts is None:
+                name = os.environ.get("TRANSLATOR_TTS_BACKEND", os.environ.get("TRANSLATOR_BACKEND", "google"))
+                _active_tts = _create(_tts_factories, name, "text-to-speech")
+            backend = _active_tts
+    return backend
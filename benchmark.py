@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the Language Translation Tool.
+Runs the translate/TTS hot paths against the local backends so results are
+reproducible without network access, and prints machine-readable JSON that
+can be compared between releases.
+
+Usage:
+    python -m benchmark [--texts 200] [--latency 0.02] [--workers 16] [--output results.json]
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+import unicodedata
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add the current directory to the Python path to import utils
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import utils
+import backends
+from cache import TranslationCache
+from backends import LocalTranslationBackend, LocalTTSBackend
+from engine import TranslationEngine
+
+@contextmanager
+def local_environment(latency: float, memory_size: int = 100000):
+    """
+    Swap in the local backends and fresh memory-only caches, restoring the originals afterwards.
+    Masking is off: the workloads number their texts, which masking would fold into one entry.
+    """
+    saved = (backends._active_translation, backends._active_tts, utils._translation_cache, utils._audio_cache,
+             utils._masker)
+    translation_backend = backends.set_translation_backend(LocalTranslationBackend(phrasebook={}, latency=latency))
+    tts_backend = backends.set_tts_backend(LocalTTSBackend(latency=latency))
+    utils._translation_cache = TranslationCache(path=None, memory_size=memory_size)
+    utils._audio_cache = None
+    utils.configure_masking(kinds=None)
+    try:
+        yield translation_backend, tts_backend
+    finally:
+        (backends._active_translation, backends._active_tts, utils._translation_cache, utils._audio_cache,
+         utils._masker) = saved
+
+@contextmanager
+def peak_memory(result: dict):
+    """Record the peak traced allocation of the block in result["peak_memory_kb"]."""
+    tracemalloc.start()
+    try:
+        yield
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result["peak_memory_kb"] = round(peak / 1024, 1)
+
+def _percentiles(samples: list) -> dict:
+    ordered = sorted(samples)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return {
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 4),
+        "p50_ms": round(pick(0.50) * 1000, 4),
+        "p99_ms": round(pick(0.99) * 1000, 4),
+    }
+
+def zipf_workload(num_requests: int, vocabulary: int, exponent: float = 1.1, seed: int = 42) -> list:
+    """Return num_requests texts drawn from a Zipf distribution over a fixed vocabulary."""
+    rng = random.Random(seed)
+    weights = [1 / (rank ** exponent) for rank in range(1, vocabulary + 1)]
+    ranks = rng.choices(range(vocabulary), weights=weights, k=num_requests)
+    return [f"phrase number {rank}" for rank in ranks]
+
+def near_duplicate_workload(num_requests: int, vocabulary: int, seed: int = 7) -> list:
+    """Zipf workload where each request is randomly re-cased or re-spaced, like user-generated text."""
+    rng = random.Random(seed)
+    variants = [
+        lambda t: t,
+        lambda t: t.capitalize(),
+        lambda t: t.upper(),
+        lambda t: t + " ",
+        lambda t: t.replace(" ", "\u00a0", 1),
+        lambda t: t.replace(" ", "  "),
+        lambda t: unicodedata.normalize("NFD", t.replace("phrase", "phrasé")),
+        lambda t: unicodedata.normalize("NFC", t.replace("phrase", "phrasé")),
+    ]
+    return [rng.choice(variants)(text) for text in zipf_workload(num_requests, vocabulary, seed=seed)]
+
+def bench_normalization_hit_ratio(num_requests: int, vocabulary: int) -> dict:
+    """Hit ratio of an unbounded cache on near-duplicate text, with and without normalization."""
+    from normalization import TextNormalizer, measure_hit_ratio
+    texts = near_duplicate_workload(num_requests, vocabulary)
+    return {
+        "requests": num_requests,
+        "vocabulary": vocabulary,
+        "strip_only": round(measure_hit_ratio(texts), 4),
+        "nfc_whitespace": round(measure_hit_ratio(texts, TextNormalizer()), 4),
+        "nfc_whitespace_casefold": round(measure_hit_ratio(texts, TextNormalizer(case_fold=True)), 4),
+    }
+
+def bench_translate_latency(num_texts: int, latency: float) -> dict:
+    """translate_text latency on a cold cache (backend call) vs. a warm cache (hit)."""
+    texts = [f"latency sample {i}" for i in range(num_texts)]
+    result = {"texts": num_texts, "backend_latency_s": latency}
+    with local_environment(latency), peak_memory(result):
+        cold, warm = [], []
+        for text in texts:
+            start = time.perf_counter()
+            utils.translate_text("en", "es", text)
+            cold.append(time.perf_counter() - start)
+        for text in texts:
+            start = time.perf_counter()
+            utils.translate_text("en", "es", text)
+            warm.append(time.perf_counter() - start)
+    result["cold"] = _percentiles(cold)
+    result["warm"] = _percentiles(warm)
+    return result
+
+def bench_zipf_hit_ratio(num_requests: int, vocabulary: int, memory_size: int) -> dict:
+    """Cache hit ratio for a Zipf-distributed workload with a bounded memory cache."""
+    texts = zipf_workload(num_requests, vocabulary)
+    result = {"requests": num_requests, "vocabulary": vocabulary, "cache_entries": memory_size}
+    with local_environment(0.0, memory_size=memory_size), peak_memory(result):
+        start = time.perf_counter()
+        for text in texts:
+            utils.translate_text("en", "es", text)
+        elapsed = time.perf_counter() - start
+        stats = utils.get_cache_stats()
+    result["hit_ratio"] = round(stats["hit_ratio"], 4)
+    result["requests_per_s"] = round(num_requests / elapsed, 1)
+    return result
+
+def bench_batch_throughput(num_texts: int, latency: float) -> dict:
+    """translate_many throughput vs. one translate_text call per text, on cold caches."""
+    texts = [f"catalog item {i}" for i in range(num_texts)]
+    result = {"texts": num_texts, "backend_latency_s": latency}
+    with local_environment(latency) as (backend, _):
+        start = time.perf_counter()
+        for text in texts:
+            utils.translate_text("en", "es", text)
+        single_seconds = time.perf_counter() - start
+    with local_environment(latency) as (backend, _), peak_memory(result):
+        start = time.perf_counter()
+        utils.translate_many("en", "es", texts)
+        batch_seconds = time.perf_counter() - start
+        result["backend_requests"] = backend.calls
+    result.update({
+        "single_s": round(single_seconds, 4),
+        "batch_s": round(batch_seconds, 4),
+        "batch_texts_per_s": round(num_texts / batch_seconds, 1),
+        "speedup": round(single_seconds / batch_seconds, 2),
+    })
+    return result
+
+def bench_engine_throughput(num_texts: int, latency: float, workers: int) -> dict:
+    """Compare serial translation with the concurrent engine on cold caches."""
+    texts = [f"sentence number {i}" for i in range(num_texts)]
+    result = {"texts": num_texts, "backend_latency_s": latency, "workers": workers}
+
+    with local_environment(latency):
+        start = time.perf_counter()
+        for text in texts:
+            utils.translate_text("en", "es", text)
+        serial_seconds = time.perf_counter() - start
+
+    with local_environment(latency), peak_memory(result):
+        with TranslationEngine(max_workers=workers) as engine:
+            start = time.perf_counter()
+            engine.translate("en", "es", texts)
+            engine_seconds = time.perf_counter() - start
+
+    result.update({
+        "serial_s": round(serial_seconds, 4),
+        "engine_s": round(engine_seconds, 4),
+        "serial_texts_per_s": round(num_texts / serial_seconds, 1),
+        "engine_texts_per_s": round(num_texts / engine_seconds, 1),
+        "speedup": round(serial_seconds / engine_seconds, 2),
+    })
+    return result
+
+def bench_tts_latency(latency: float, lengths=(10, 100, 1000)) -> dict:
+    """text_to_speech latency by text length, single request vs. parallel segments."""
+    result = {"backend_latency_s": latency, "by_length": {}}
+    with local_environment(latency), peak_memory(result):
+        for length in lengths:
+            text = ("word " * (length // 5 + 1))[:length].strip()
+            start = time.perf_counter()
+            audio_bytes = utils.text_to_speech_bytes(text, "en")
+            single_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            long_bytes = sum(len(piece) for piece in utils.text_to_speech_long_stream(text, "en", workers=8))
+            segmented_seconds = time.perf_counter() - start
+            result["by_length"][str(length)] = {
+                "single_ms": round(single_seconds * 1000, 3),
+                "segmented_ms": round(segmented_seconds * 1000, 3),
+                "audio_bytes": len(audio_bytes),
+                "segmented_audio_bytes": long_bytes,
+            }
+    return result
+
+def bench_metrics_overhead(num_calls: int = 20000) -> dict:
+    """Warm-cache translate_text cost with metrics disabled vs. enabled."""
+    import metrics
+    was_enabled = metrics.registry.enabled
+    result = {"calls": num_calls}
+    with local_environment(0.0):
+        utils.translate_text("en", "es", "overhead probe")
+        for label, enabled in (("disabled", False), ("enabled", True)):
+            metrics.registry.enabled = enabled
+            start = time.perf_counter()
+            for _ in range(num_calls):
+                utils.translate_text("en", "es", "overhead probe")
+            result[f"{label}_us_per_call"] = round((time.perf_counter() - start) / num_calls * 1e6, 3)
+    metrics.registry.enabled = was_enabled
+    metrics.registry.reset()
+    return result
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Local stand-in for the Google Translate page: keep-alive HTTP/1.1, fixed answer."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    body = b'<html><body><div class="t0">traducido</div></body></html>'
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+def bench_connection_reuse(num_requests: int) -> dict:
+    """
+    Compare building a GoogleTranslator per call (the old behaviour) with the
+    pooled translators and shared keep-alive session, against a local HTTP stand-in.
+    """
+    from deep_translator import GoogleTranslator
+    from translator_pool import TranslatorPool
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    server.daemon_threads = True
+    server.connections = set()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    try:
+        start = time.perf_counter()
+        for i in range(num_requests):
+            translator = GoogleTranslator(source="en", target="es")
+            translator._base_url = url
+            translator.translate(f"text {i}")
+        fresh_seconds = time.perf_counter() - start
+        fresh_connections = len(server.connections)
+
+        server.connections = set()
+        pool = TranslatorPool()
+        start = time.perf_counter()
+        for i in range(num_requests):
+            translator = pool.get("en", "es")
+            translator._base_url = url
+            translator.translate(f"text {i}")
+        pooled_seconds = time.perf_counter() - start
+        pooled_connections = len(server.connections)
+        pool.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    return {
+        "requests": num_requests,
+        "fresh_s": round(fresh_seconds, 4),
+        "pooled_s": round(pooled_seconds, 4),
+        "fresh_connections": fresh_connections,
+        "pooled_connections": pooled_connections,
+        "fresh_ms_per_request": round(fresh_seconds / num_requests * 1000, 3),
+        "pooled_ms_per_request": round(pooled_seconds / num_requests * 1000, 3),
+        "speedup": round(fresh_seconds / pooled_seconds, 2),
+    }
+
+def bench_fuzzy_lookup(num_entries: int, num_queries: int = 200, threshold: float = 0.95) -> dict:
+    """Fuzzy translation-memory lookup latency against an index of num_entries segments."""
+    from fuzzy_index import FuzzyIndex
+    rng = random.Random(7)
+    words = [f"{rng.choice('bcdfghklmnprst')}{rng.choice('aeiou')}{rng.choice('lmnrst')}{i}" for i in range(5000)]
+    sources = [" ".join(rng.choice(words) for _ in range(rng.randint(6, 12))) for _ in range(num_entries)]
+    result = {"entries": num_entries, "queries": num_queries, "threshold": threshold}
+    index = FuzzyIndex()
+    with peak_memory(result):
+        start = time.perf_counter()
+        for i, source in enumerate(sources):
+            index.add(source, i)
+        result["build_s"] = round(time.perf_counter() - start, 2)
+
+    # Each query is a stored segment with one character changed
+    queries = []
+    for _ in range(num_queries):
+        source = rng.choice(sources)
+        position = rng.randrange(len(source))
+        queries.append(source[:position] + "x" + source[position + 1:])
+    timings, found = [], 0
+    for query in queries:
+        start = time.perf_counter()
+        found += bool(index.search(query, threshold))
+        timings.append(time.perf_counter() - start)
+    result["lookup"] = _percentiles(timings)
+    result["match_ratio"] = round(found / num_queries, 4)
+    return result
+
+def bench_language_detection(num_texts: int = 2000) -> dict:
+    """Offline language detection latency per string (uncached), over every supported language."""
+    from language_detection import LanguageDetector, SAMPLES
+    detector = LanguageDetector()
+    texts = [sentence.strip() + "." for sample in SAMPLES.values() for sentence in sample.split(". ") if sentence]
+    texts += ["Ich weiß es nicht", "Я не знаю", "わかりません", "我不知道", "모르겠어요", "لا أعرف", "मुझे नहीं पता", "Δεν ξέρω"]
+    timings = []
+    for i in range(num_texts):
+        text = texts[i % len(texts)]
+        start = time.perf_counter()
+        detector.detect(text)
+        timings.append(time.perf_counter() - start)
+    return {"texts": num_texts, "detect": _percentiles(timings)}
+
+def bench_masking(num_texts: int = 2000) -> dict:
+    """Passthrough masking cost per string, the payload it saves and the cache keys it merges."""
+    from masking import PassthroughMasker
+    masker = PassthroughMasker()
+    templates = [
+        "Order {0} shipped on 2024-05-{1:02d}, track it at https://example.com/track/{0}",
+        "Hi {{name}}, your code is {0}. Questions? Write to support@example.com",
+        "Run `pip install app=={1}.0` and restart",
+        "Thank you for shopping with us, we hope to see you again soon",
+    ]
+    texts = [templates[i % len(templates)].format(10000 + i, i % 28 + 1) for i in range(num_texts)]
+    timings = []
+    masked_chars = 0
+    keys = set()
+    for text in texts:
+        start = time.perf_counter()
+        masked, spans = masker.mask(text)
+        masker.unmask(masked, spans)
+        timings.append(time.perf_counter() - start)
+        masked_chars += len(masked)
+        keys.add(masked)
+    original_chars = sum(len(text) for text in texts)
+    return {
+        "texts": num_texts,
+        "mask_unmask": _percentiles(timings),
+        "payload_reduction": round(1 - masked_chars / original_chars, 4),
+        "distinct_keys": {"unmasked": len(set(texts)), "masked": len(keys)},
+    }
+
+def bench_templates(num_messages: int = 5000, num_templates: int = 20) -> dict:
+    """Backend calls and latency for personalized messages, with and without registered templates."""
+    templates = [f"Hi {{name}}, your {kind} is ready ({{detail}})" for kind in
+                 ("order", "invoice", "refund", "parcel", "booking", "ticket", "report", "badge", "voucher", "upgrade",
+                  "license", "payout", "receipt", "statement", "renewal", "transfer", "delivery", "quote", "claim", "visa")
+                 ][:num_templates]
+    names = ["Ana", "Bob", "Chen", "Dana", "Emeka", "Farah", "Goran", "Hana"]
+    messages = [templates[i % len(templates)].format(name=names[i % len(names)] + chr(97 + i // 8 % 26),
+                                                     detail=f"ref {chr(97 + i % 26)}{chr(97 + i // 26 % 26)}")
+                for i in range(num_messages)]
+    result = {"messages": num_messages, "templates": len(templates)}
+    saved = utils._templates
+    try:
+        for label, registered in (("without_templates", ()), ("with_templates", templates)):
+            with local_environment(0.0) as (backend, _):
+                utils.configure_templates(templates=registered)
+                timings = []
+                for message in messages:
+                    start = time.perf_counter()
+                    utils.translate_text("en", "es", message)
+                    timings.append(time.perf_counter() - start)
+                result[label] = {"backend_calls": backend.calls, "latency": _percentiles(timings)}
+    finally:
+        utils._templates = saved
+    return result
+
+def bench_warm_start(num_requests: int = 2000, vocabulary: int = 5000, snapshot_entries: int = 5000,
+                     latency: float = 0.002) -> dict:
+    """First-requests latency of a fresh process, cold vs. with a snapshot of the previous process's hottest entries."""
+    from snapshot import Snapshot, export_snapshot
+    texts = zipf_workload(num_requests, vocabulary)
+    result = {"requests": num_requests, "vocabulary": vocabulary, "snapshot_entries": snapshot_entries,
+              "backend_latency_s": latency}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "warm.snap")
+        # The previous process: serve a day's traffic, then export what it has seen most
+        with local_environment(0.0):
+            for text in zipf_workload(num_requests * 5, vocabulary, seed=1):
+                utils.translate_text("en", "es", text)
+            result["snapshot_bytes"] = export_snapshot(path, utils._translation_cache, translations=snapshot_entries)["bytes"]
+        for label, snapshot_path in (("cold", None), ("warm", path)):
+            start = time.perf_counter()
+            snapshot = Snapshot(snapshot_path) if snapshot_path else None
+            opened = time.perf_counter() - start
+            with local_environment(latency):
+                utils._translation_cache.snapshot = snapshot
+                timings = []
+                for text in texts:
+                    start = time.perf_counter()
+                    utils.translate_text("en", "es", text)
+                    timings.append(time.perf_counter() - start)
+                stats = utils.get_cache_stats()
+            result[label] = {"open_ms": round(opened * 1000, 3), "latency": _percentiles(timings),
+                             "hit_ratio": round(stats["hit_ratio"], 4)}
+            if snapshot is not None:
+                snapshot.close()
+    return result
+
+def bench_compact_cache(num_entries: int = 1000000, num_lookups: int = 100000) -> dict:
+    """Memory held by num_entries cached translations and hit latency: lru_cache vs. the memory tiers."""
+    from functools import lru_cache
+    rng = random.Random(5)
+    text = lambda i: f"Please confirm the delivery address for order {i}"
+    lookups = [text(rng.randrange(num_entries)) for _ in range(num_lookups)]
+    result = {"entries": num_entries, "lookups": num_lookups}
+
+    @lru_cache(maxsize=num_entries)
+    def translate(source_lang, target_lang, text):
+        return "[es] " + text
+
+    tiers = {
+        "lru_cache": (lambda i: translate("en", "es", text(i)), lambda text: translate("en", "es", text)),
+        "ordered_dict": TranslationCache(path=None, memory_size=num_entries),
+        "compact": TranslationCache(path=None, memory_size=num_entries, compact=True),
+    }
+    for label, tier in tiers.items():
+        if isinstance(tier, TranslationCache):
+            tier = (lambda cache: (lambda i: cache.set("en", "es", text(i), "[es] " + text(i)),
+                                   lambda text: cache.get("en", "es", text)))(tier)
+        fill, lookup = tier
+        tracemalloc.start()
+        for i in range(num_entries):
+            fill(i)
+        held, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        start = time.perf_counter()
+        for query in lookups:
+            lookup(query)
+        looked_up = time.perf_counter() - start
+        result[label] = {
+            "memory_mb": round(held / 2 ** 20, 1),
+            "bytes_per_entry": round(held / num_entries, 1),
+            "hit_us": round(looked_up / num_lookups * 1e6, 3),
+        }
+        tiers[label] = None
+        translate.cache_clear()
+    result["memory_saving"] = round(result["lru_cache"]["memory_mb"] / result["compact"]["memory_mb"], 2)
+    return result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the translation hot paths")
+    parser.add_argument("--texts", type=int, default=200, help="Number of texts per run")
+    parser.add_argument("--latency", type=float, default=0.02, help="Local backend latency in seconds")
+    parser.add_argument("--workers", type=int, default=16, help="Engine worker threads")
+    parser.add_argument("--zipf-requests", type=int, default=20000, help="Requests in the Zipf workload")
+    parser.add_argument("--zipf-vocabulary", type=int, default=5000, help="Distinct texts in the Zipf workload")
+    parser.add_argument("--zipf-cache", type=int, default=500, help="Memory cache entries for the Zipf workload")
+    parser.add_argument("--fuzzy-entries", type=int, default=100000, help="Segments in the fuzzy-match index")
+    parser.add_argument("--compact-entries", type=int, default=1000000, help="Entries in the cache memory comparison")
+    parser.add_argument("--output", help="Also write the JSON results to this file")
+    args = parser.parse_args(argv)
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "translate_latency": bench_translate_latency(args.texts, args.latency),
+        "zipf_hit_ratio": bench_zipf_hit_ratio(args.zipf_requests, args.zipf_vocabulary, args.zipf_cache),
+        "normalization_hit_ratio": bench_normalization_hit_ratio(args.zipf_requests, args.zipf_vocabulary),
+        "batch_throughput": bench_batch_throughput(args.texts, args.latency),
+        "engine_throughput": bench_engine_throughput(args.texts, args.latency, args.workers),
+        "tts_latency": bench_tts_latency(args.latency),
+        "metrics_overhead": bench_metrics_overhead(),
+        "fuzzy_lookup": bench_fuzzy_lookup(args.fuzzy_entries),
+        "language_detection": bench_language_detection(),
+        "masking": bench_masking(),
+        "templates": bench_templates(),
+        "warm_start": bench_warm_start(),
+        "compact_cache": bench_compact_cache(args.compact_entries),
+    }
+    try:
+        results["connection_reuse"] = bench_connection_reuse(args.texts)
+    except ImportError as e:
+        results["connection_reuse"] = {"skipped": str(e)}
+
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    return results
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""
+Bulk file translation for the Language Translation Tool.
+Streams line-delimited input (plain text, CSV or JSON Lines) through the
+concurrent engine, writes results in input order as they arrive and keeps a
+checkpoint so an interrupted job resumes where it stopped.
+"""
+
+import csv
+import json
+import os
+import time
+from collections import deque
+from itertools import islice
+from typing import Iterator, Optional, Tuple
+
+from engine import TranslationEngine
+from resilience import CircuitOpenError, is_retryable
+
+FORMATS = ("txt", "csv", "jsonl")
+
+# Column/field added to CSV and JSON Lines records
+TRANSLATION_FIELD = "translation"
+# JSON Lines field explaining why a record was not translated
+ERROR_FIELD = "error"
+
+
+def detect_format(path: str) -> str:
+    """Guess the record format from a file extension (defaults to plain text)."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    return "txt"
+
+
+def checkpoint_path(output_path: str) -> str:
+    """Return the checkpoint file kept next to an output file."""
+    return output_path + ".checkpoint"
+
+
+def _read_records(f, file_format: str, field: str) -> Iterator[Tuple[str, object, Optional[str]]]:
+    """
+    Yield (text, record, error) from an open input file. A record that cannot be
+    translated (e.g. a JSON line that is not an object) comes with an error
+    message and an empty text.
+    """
+    if file_format == "txt":
+        for line in f:
+            yield line.rstrip("\r\n"), None, None
+    elif file_format == "jsonl":
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield "", {"line": line.rstrip("\r\n")}, f"Invalid JSON: {e}"
+                continue
+            if not isinstance(record, dict):
+                yield "", {"line": line.rstrip("\r\n")}, "Record is not a JSON object"
+                continue
+            text = record.get(field) or ""
+            if not isinstance(text, str):
+                yield "", record, f"Field {field!r} is not a string"
+                continue
+            yield text, record, None
+    else:
+        for record in csv.DictReader(f):
+            yield record.get(field) or "", record, None
+
+
+def _is_transient(error: BaseException) -> bool:
+    """
+    Tell whether a translation failed because of the service rather than the record:
+    an open circuit or an error resilience would retry (network trouble, throttling,
+    server errors) anywhere in the exception chain. Such failures stop the job so it
+    can be resumed later.
+    """
+    while error is not None:
+        if isinstance(error, CircuitOpenError) or is_retryable(error):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class _Writer:
+    """Appends translated records to the output file in the input's format."""
+
+    def __init__(self, f, file_format: str, fieldnames=None):
+        self.f = f
+        self.file_format = file_format
+        self._csv = None
+        if file_format == "csv":
+            self._csv = csv.DictWriter(f, fieldnames=list(fieldnames) + [TRANSLATION_FIELD])
+
+    def write_header(self) -> None:
+        if self._csv is not None:
+            self._csv.writeheader()
+
+    def write(self, record, translation: str, error: Optional[str] = None) -> None:
+        """Write one record; a failed record gets an empty translation (and an error field in JSON Lines)."""
+        if self.file_format == "txt":
+            self.f.write(translation.replace("\n", " ") + "\n")
+        elif self.file_format == "jsonl":
+            record[TRANSLATION_FIELD] = translation
+            if error is not None:
+                record[ERROR_FIELD] = error
+            self.f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        else:
+            record[TRANSLATION_FIELD] = translation
+            self._csv.writerow(record)
+
+
+def _load_checkpoint(path: str, job: dict) -> Optional[dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        checkpoint = json.load(f)
+    if any(checkpoint.get(key) != value for key, value in job.items()):
+        raise ValueError(f"Checkpoint {path} belongs to a different job; delete it to start over")
+    return checkpoint
+
+
+def _save_checkpoint(path: str, checkpoint: dict) -> None:
+    """Replace the checkpoint atomically so a crash never leaves a partial one."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+
+def translate_file(
+    source_lang: str,
+    target_lang: str,
+    input_path: str,
+    output_path: str,
+    workers: int = 8,
+    file_format: Optional[str] = None,
+    field: str = "text",
+    rate_limit: Optional[float] = None,
+    checkpoint_every: int = 1000,
+    progress=None,
+) -> dict:
+    """
+    Translate a line-delimited file record by record.
+
+    Records are read lazily and translated on a pool of workers; results are
+    appended to output_path in input order. Every checkpoint_every records the
+    output is synced and the number of records written is recorded in
+    "<output_path>.checkpoint". If that file exists when the job starts, the
+    output is truncated to the last checkpoint and the records before it are
+    skipped, so no finished record reaches the backend again. The checkpoint is
+    removed once the whole file is done.
+
+    A record that cannot be translated (too long for the backend, rejected by
+    it, or not a JSON object) does not stop the job: it is written with an
+    empty translation (JSON Lines records also get an "error" field) and
+    counted as failed. Only service failures (connection errors, timeouts,
+    throttling, server errors, an open circuit) stop the job, so it can be
+    resumed once the service is back.
+
+    Args:
+        source_lang (str): Source language code (e.g., 'en', 'es', 'fr')
+        target_lang (str): Target language code (e.g., 'en', 'es', 'fr')
+        input_path (str): File to translate
+        output_path (str): File receiving the translations
+        workers (int): Number of concurrent backend requests
+        file_format (str): "txt", "csv" or "jsonl" (default: from the input's extension)
+        field (str): CSV column or JSON field holding the text
+        rate_limit (float): Maximum backend requests per second (None = unlimited)
+        checkpoint_every (int): Records between checkpoints
+        progress (callable): Called with the number of records written after each checkpoint
+
+    Returns:
+        dict: Records written in this run, how many of them failed, records skipped
+            by resuming and elapsed seconds
+
+    Raises:
+        ValueError: If the format is unknown, checkpoint_every is below 1 or the
+            checkpoint belongs to another job
+        Exception: If the translation service fails (progress up to the last checkpoint is kept)
+    """
+    file_format = file_format or detect_format(input_path)
+    if file_format not in FORMATS:
+        raise ValueError(f"Unsupported format: {file_format}. Choose from {', '.join(FORMATS)}")
+    if checkpoint_every < 1:
+        raise ValueError("checkpoint_every must be at least 1")
+
+    state_path = checkpoint_path(output_path)
+    job = {
+        "input": os.path.abspath(input_path),
+        "source_lang": source_lang,
+        "target_lang": target_lang,
+        "format": file_format,
+        "field": field,
+    }
+    checkpoint = _load_checkpoint(state_path, job)
+    resumed = 0
+    if checkpoint is not None and os.path.exists(output_path):
+        resumed = checkpoint["records"]
+        # Drop anything written after the last checkpoint, it is translated again
+        os.truncate(output_path, checkpoint["offset"])
+
+    start = time.perf_counter()
+    written = resumed
+    failed = 0
+    with open(input_path, newline="", encoding="utf-8") as source, \
+            open(output_path, "a" if resumed else "w", newline="", encoding="utf-8") as out:
+        records = _read_records(source, file_format, field)
+        first = next(records, None)
+        if first is None:
+            return {"records": 0, "failed": 0, "resumed": resumed, "seconds": 0.0}
+        writer = _Writer(out, file_format, first[1].keys() if file_format == "csv" else None)
+        if not resumed:
+            writer.write_header()
+
+        def remaining():
+            yield first
+            yield from records
+
+        pending = deque()
+
+        def texts():
+            for text, record, error in islice(remaining(), resumed, None):
+                pending.append((record, error))
+                # Unreadable records are not sent to the backend
+                yield text if error is None else ""
+
+        def save():
+            out.flush()
+            os.fsync(out.fileno())
+            _save_checkpoint(state_path, dict(job, records=written, offset=os.fstat(out.fileno()).st_size))
+            if progress is not None:
+                progress(written)
+
+        with TranslationEngine(max_workers=workers, rate_limit=rate_limit) as engine:
+            for translation in engine.imap(source_lang, target_lang, texts(), return_exceptions=True):
+                record, error = pending.popleft()
+                if isinstance(translation, Exception):
+                    if _is_transient(translation):
+                        raise translation
+                    error = str(translation)
+                if error is not None:
+                    translation = ""
+                    failed += 1
+                writer.write(record, translation, error)
+                written += 1
+                if (written - resumed) % checkpoint_every == 0:
+                    save()
+        out.flush()
+        os.fsync(out.fileno())
+
+    if os.path.exists(state_path):
+        os.remove(state_path)
+    return {"records": written - resumed, "failed": failed, "resumed": resumed, "seconds": round(time.perf_counter() - start, 3)}
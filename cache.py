@@ -0,0 +1,322 @@
+"""
+Persistent translation cache for the Language Translation Tool.
+Keeps a small in-memory LRU tier in front of a SQLite database so that
+translations survive process restarts and can be shared between processes.
+For millions of entries the memory tier can be a compact_cache.CompactCache.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from compact_cache import CompactCache
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "language-translation-tool", "translations.sqlite3"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    source_lang TEXT NOT NULL,
+    target_lang TEXT NOT NULL,
+    text TEXT NOT NULL,
+    translation TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (source_lang, target_lang, text)
+)
+"""
+
+
+class TranslationCache:
+    """
+    Two-tier translation cache: in-memory LRU backed by an optional SQLite file.
+
+    SQLite runs in WAL mode with a busy timeout, so several processes on the
+    same host can read and write the same cache file safely.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = DEFAULT_CACHE_PATH,
+        max_entries: int = 100000,
+        ttl: Optional[float] = None,
+        memory_size: int = 1000,
+        stale_ttl: float = 0.0,
+        snapshot=None,
+        compact: bool = False,
+    ):
+        """
+        Args:
+            path (str): SQLite file path, or None for a memory-only cache
+            max_entries (int): Maximum number of rows kept on disk
+            ttl (float): Seconds before an entry expires (None = never)
+            memory_size (int): Number of entries kept in the in-memory tier
+            stale_ttl (float): Seconds expired rows are kept on disk for stale reads
+                (get(..., allow_stale=True)) before evict() removes them
+            snapshot (snapshot.Snapshot): Read-only warm-start tier consulted after
+                memory and disk; hits are promoted into the memory tier
+            compact (bool): Keep the memory tier in a CompactCache (hashed keys, one
+                UTF-8 arena, CLOCK eviction) instead of an LRU OrderedDict; meant for
+                memory_size in the hundreds of thousands or more
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.memory_size = memory_size
+        self.stale_ttl = stale_ttl
+        self.snapshot = snapshot
+        self.compact = compact
+
+        self._memory = CompactCache(memory_size) if compact else OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._writes_since_evict = 0
+
+        self.hits = 0
+        self.memory_hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.snapshot_hits = 0
+
+        if self.path:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._connection()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's SQLite connection, creating it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl is not None and now - created_at > self.ttl
+
+    def get(self, source_lang: str, target_lang: str, text: str, allow_stale: bool = False) -> Optional[str]:
+        """
+        Look up a cached translation.
+
+        Args:
+            allow_stale (bool): Also return expired entries that have not been
+                evicted yet (used when the backend is unavailable)
+
+        Returns:
+            str: Cached translation, or None on a miss
+        """
+        if allow_stale:
+            return self._get_stale((source_lang, target_lang, text))
+
+        key = (source_lang, target_lang, text)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                translation, created_at = entry
+                if not self._expired(created_at, now):
+                    if not self.compact:
+                        self._memory.move_to_end(key)
+                    self.hits += 1
+                    self.memory_hits += 1
+                    return translation
+
+        if self.path:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT translation, created_at FROM translations "
+                "WHERE source_lang = ? AND target_lang = ? AND text = ?",
+                key,
+            ).fetchone()
+            if row is not None and not self._expired(row[1], now):
+                conn.execute(
+                    "UPDATE translations SET last_used = ?, hits = hits + 1 "
+                    "WHERE source_lang = ? AND target_lang = ? AND text = ?",
+                    (now,) + key,
+                )
+                with self._lock:
+                    self._remember(key, row[0], row[1])
+                    self.hits += 1
+                return row[0]
+
+        # Last, so rows written since the snapshot was exported take precedence
+        snapshot = self.snapshot
+        if snapshot is not None:
+            found = snapshot.get_translation(*key)
+            if found is not None and not self._expired(found[1], now):
+                with self._lock:
+                    self._remember(key, *found)
+                    self.hits += 1
+                    self.snapshot_hits += 1
+                return found[0]
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def _get_stale(self, key: Tuple[str, str, str]) -> Optional[str]:
+        """Return an entry whether or not it has expired; counted as a stale hit only."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self.stale_hits += 1
+                return entry[0]
+
+        if self.path:
+            row = self._connection().execute(
+                "SELECT translation FROM translations "
+                "WHERE source_lang = ? AND target_lang = ? AND text = ?",
+                key,
+            ).fetchone()
+            if row is not None:
+                with self._lock:
+                    self.stale_hits += 1
+                return row[0]
+
+        snapshot = self.snapshot
+        if snapshot is not None:
+            found = snapshot.get_translation(*key)
+            if found is not None:
+                with self._lock:
+                    self.stale_hits += 1
+                return found[0]
+        return None
+
+    def set(self, source_lang: str, target_lang: str, text: str, translation: str) -> None:
+        """Store a translation in both tiers."""
+        key = (source_lang, target_lang, text)
+        now = time.time()
+
+        with self._lock:
+            self._remember(key, translation, now)
+
+        if self.path:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO translations "
+                "(source_lang, target_lang, text, translation, created_at, last_used, hits) "
+                "VALUES (?, ?, ?, ?, ?, ?, 0)",
+                key + (translation, now, now),
+            )
+            with self._lock:
+                self._writes_since_evict += 1
+                should_evict = self._writes_since_evict >= max(1, self.max_entries // 100)
+                if should_evict:
+                    self._writes_since_evict = 0
+            if should_evict:
+                self.evict()
+
+    def _remember(self, key: Tuple[str, str, str], translation: str, created_at: float) -> None:
+        """Insert into the memory tier (caller holds the lock)."""
+        if self.compact:
+            # Evicts by itself; lookups already set its reference bits
+            self._memory.set(key, (translation, created_at))
+            return
+        self._memory[key] = (translation, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def evict(self) -> int:
+        """
+        Drop expired rows (once past stale_ttl) and trim the disk tier down to max_entries,
+        removing the least recently used rows first.
+
+        Returns:
+            int: Number of rows removed
+        """
+        if not self.path:
+            return 0
+
+        conn = self._connection()
+        removed = 0
+        if self.ttl is not None:
+            removed += conn.execute(
+                "DELETE FROM translations WHERE created_at < ?", (time.time() - self.ttl - self.stale_ttl,)
+            ).rowcount
+
+        count = conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            removed += conn.execute(
+                "DELETE FROM translations WHERE rowid IN "
+                "(SELECT rowid FROM translations ORDER BY last_used LIMIT ?)",
+                (excess,),
+            ).rowcount
+        return removed
+
+    def hottest(self, limit: int) -> List[Tuple[str, str, str, str, float]]:
+        """
+        Return up to limit unexpired entries, most used first: disk rows by hit count
+        (reads served from the disk tier), then memory entries by recency (compact
+        tier: entries used since the CLOCK hand last passed first).
+
+        Returns:
+            list: (source_lang, target_lang, text, translation, created_at) tuples
+        """
+        now = time.time()
+        with self._lock:
+            items = self._memory.items() if self.compact else reversed(self._memory.items())
+            memory = [key + entry for key, entry in items]
+        rows = []
+        if self.path and limit > 0:
+            oldest = now - self.ttl if self.ttl is not None else 0.0
+            rows = self._connection().execute(
+                "SELECT source_lang, target_lang, text, translation, created_at FROM translations "
+                "WHERE created_at >= ? ORDER BY hits DESC, last_used DESC LIMIT ?",
+                (oldest, limit),
+            ).fetchall()
+        entries = {}
+        for source_lang, target_lang, text, translation, created_at in rows + memory:
+            key = (source_lang, target_lang, text)
+            if key not in entries and not self._expired(created_at, now):
+                entries[key] = (translation, created_at)
+        return [key + entry for key, entry in entries.items()][:limit]
+
+    def clear(self) -> None:
+        """
+        Remove every entry from both tiers and reset the counters. The snapshot is
+        detached too (not closed, it may be shared), so cleared entries do not reappear.
+        """
+        with self._lock:
+            self.snapshot = None
+            self._memory.clear()
+            self.hits = self.memory_hits = self.misses = self.stale_hits = self.snapshot_hits = 0
+        if self.path:
+            self._connection().execute("DELETE FROM translations")
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and tier sizes."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats = {
+                "hits": self.hits,
+                "memory_hits": self.memory_hits,
+                "misses": self.misses,
+                "stale_hits": self.stale_hits,
+                "snapshot_hits": self.snapshot_hits,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+            }
+        if self.path:
+            stats["disk_entries"] = self._connection().execute(
+                "SELECT COUNT(*) FROM translations"
+            ).fetchone()[0]
+        return stats
+
+    def close(self) -> None:
+        """Close this thread's SQLite connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
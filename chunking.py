@@ -0,0 +1,92 @@
+"""
+Sentence-aware text chunking for the Language Translation Tool.
+Splits text into chunks under a character limit, preferring paragraph, line,
+sentence and word boundaries. Joining the chunks always gives back the
+original text, whitespace included.
+"""
+
+import re
+from typing import Iterable, Iterator, List, Tuple
+
+# Boundaries in order of preference; each match ends just after the separator
+_BOUNDARIES = [
+    re.compile(r"\n\s*\n"),                 # paragraph break
+    re.compile(r"\n"),                      # line break
+    re.compile(r"[.!?;:。！？؟…]+[\"')\]»]*\s+"),  # sentence end
+    re.compile(r"\s+"),                     # word boundary
+]
+
+
+def _find_cut(buffer: str, max_chars: int) -> int:
+    """Return the best position <= max_chars at which to cut the buffer."""
+    window = buffer[:max_chars]
+    for boundary in _BOUNDARIES:
+        cut = 0
+        for match in boundary.finditer(window):
+            cut = match.end()
+        if cut > 0:
+            return cut
+    return max_chars
+
+
+def iter_chunks(source: Iterable[str], max_chars: int) -> Iterator[str]:
+    """
+    Stream chunks of at most max_chars characters from an iterable of strings
+    (e.g. an open text file). Only one chunk's worth of text is buffered.
+    
+    Args:
+        source (iterable): Pieces of text, such as the lines of a file
+        max_chars (int): Maximum characters per chunk
+    
+    Yields:
+        str: Consecutive chunks of the input
+    """
+    if max_chars <= 0:
+        raise ValueError("max_chars must be greater than zero")
+    
+    buffer = ""
+    for piece in source:
+        buffer += piece
+        while len(buffer) > max_chars:
+            cut = _find_cut(buffer, max_chars)
+            yield buffer[:cut]
+            buffer = buffer[cut:]
+    if buffer:
+        yield buffer
+
+
+def split_chunks(text: str, max_chars: int) -> List[str]:
+    """Split a string into chunks of at most max_chars characters."""
+    return list(iter_chunks([text], max_chars))
+
+
+_SEGMENT_END = re.compile(r"\n\s*|[.!?。！？؟…]+[\"')\]»]*\s+")
+
+
+def split_segments(text: str) -> List[str]:
+    """
+    Split text into sentence/line segments, each keeping its trailing whitespace,
+    so that "".join(split_segments(text)) == text.
+    """
+    segments = []
+    start = 0
+    for match in _SEGMENT_END.finditer(text):
+        if match.end() > start:
+            segments.append(text[start:match.end()])
+            start = match.end()
+    if start < len(text):
+        segments.append(text[start:])
+    return segments
+
+
+def split_whitespace(chunk: str) -> Tuple[str, str, str]:
+    """
+    Split a chunk into (leading whitespace, content, trailing whitespace)
+    so the whitespace can be re-attached around the translated content.
+    """
+    core = chunk.strip()
+    if not core:
+        return chunk, "", ""
+    start = len(chunk) - len(chunk.lstrip())
+    end = len(chunk.rstrip())
+    return chunk[:start], core, chunk[end:]
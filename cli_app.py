@@ -2,39 +2,104 @@
 """
 Command-line interface for the Language Translation Tool.
 This is a simple CLI version to demonstrate functionality without Streamlit.
+
+Run without arguments for the interactive mode, translate a whole file:
+    python cli_app.py --from en --to es --input data.jsonl --output out.jsonl --workers 16
+or translate one text into several languages (prints JSON keyed by language code):
+    python cli_app.py --from en --to es,fr,de --text "Save changes"
+    python cli_app.py --from en --to all --text "Save changes"
+Use --from auto to detect the source language offline.
 """
 
+import argparse
+import json
 import os
+import sys
 import tempfile
-from utils import translate_text, text_to_speech
+from languages import LANGUAGES, LANGUAGE_CODES, LANGUAGE_NAMES
+from utils import translate_text, translate_fanout, text_to_speech, detect_source_language
+
+def parse_targets(spec):
+    """Turn "es,fr,de" or "all" into a list of language codes."""
+    if spec.strip().lower() == "all":
+        return list(LANGUAGE_CODES)
+    return [code.strip() for code in spec.split(",") if code.strip()]
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description="Translate a line-delimited file (txt, CSV or JSONL), or one text into several languages"
+    )
+    parser.add_argument("--from", dest="source_lang", required=True,
+                        help='Source language code, or "auto" to detect it')
+    parser.add_argument("--to", dest="target_lang", required=True,
+                        help='Target language code (with --text: comma-separated codes or "all")')
+    parser.add_argument("--text", help="Text to translate into every --to language")
+    parser.add_argument("--input", help="File to translate")
+    parser.add_argument("--output", help="File receiving the translations")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent backend requests")
+    parser.add_argument("--format", choices=["txt", "csv", "jsonl"], help="Input format (default: from extension)")
+    parser.add_argument("--field", default="text", help="CSV column or JSON field holding the text")
+    parser.add_argument("--rate-limit", type=float, help="Maximum backend requests per second")
+    parser.add_argument("--checkpoint-every", type=int, default=1000, help="Records between checkpoints")
+    args = parser.parse_args(argv)
+    if args.text is None and not (args.input and args.output):
+        parser.error("either --text or both --input and --output are required")
+    if args.checkpoint_every < 1:
+        parser.error("--checkpoint-every must be at least 1")
+    if args.text is None and ("," in args.target_lang or args.target_lang.strip().lower() == "all"):
+        parser.error("file translation takes a single --to language")
+    return args
+
+def fanout_mode(args):
+    """Translate --text into every --to language and print the results as JSON."""
+    try:
+        translations = translate_fanout(args.source_lang, parse_targets(args.target_lang), args.text)
+    except Exception as e:
+        print(f"❌ Translation failed: {str(e)}", file=sys.stderr)
+        return 1
+    print(json.dumps(translations, ensure_ascii=False, indent=2))
+    return 0
+
+def bulk_mode(args):
+    """Translate a file non-interactively, resuming from its checkpoint if one exists."""
+    from bulk import checkpoint_path, translate_file
+
+    if os.path.exists(checkpoint_path(args.output)):
+        print(f"↩️  Resuming from {checkpoint_path(args.output)}", file=sys.stderr)
+    try:
+        result = translate_file(
+            args.source_lang,
+            args.target_lang,
+            args.input,
+            args.output,
+            workers=args.workers,
+            file_format=args.format,
+            field=args.field,
+            rate_limit=args.rate_limit,
+            checkpoint_every=args.checkpoint_every,
+            progress=lambda done: print(f"   {done} records written", file=sys.stderr),
+        )
+    except Exception as e:
+        print(f"❌ Translation failed: {str(e)}", file=sys.stderr)
+        print("   Run the same command again to resume from the last checkpoint.", file=sys.stderr)
+        return 1
+    print(f"✅ Translated {result['records']} records in {result['seconds']}s "
+          f"({result['resumed']} already done) -> {args.output}", file=sys.stderr)
+    if result["failed"]:
+        print(f"⚠️  {result['failed']} records could not be translated and were left empty", file=sys.stderr)
+    return 0
 
-def main():
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        args = parse_args(argv)
+        return fanout_mode(args) if args.text is not None else bulk_mode(args)
+    
     print("🌍 Language Translation Tool - CLI Version")
     print("=" * 50)
     
     # Language options (ISO codes)
-    languages = {
-        "1": ("English", "en"),
-        "2": ("Spanish", "es"), 
-        "3": ("French", "fr"),
-        "4": ("German", "de"),
-        "5": ("Italian", "it"),
-        "6": ("Portuguese", "pt"),
-        "7": ("Russian", "ru"),
-        "8": ("Japanese", "ja"),
-        "9": ("Korean", "ko"),
-        "10": ("Chinese (Simplified)", "zh"),
-        "11": ("Arabic", "ar"),
-        "12": ("Hindi", "hi"),
-        "13": ("Dutch", "nl"),
-        "14": ("Swedish", "sv"),
-        "15": ("Norwegian", "no"),
-        "16": ("Danish", "da"),
-        "17": ("Finnish", "fi"),
-        "18": ("Polish", "pl"),
-        "19": ("Turkish", "tr"),
-        "20": ("Greek", "el")
-    }
+    languages = {str(i): (name, code) for i, (code, name, _) in enumerate(LANGUAGES, start=1)}
     
     # Display language options
     print("\nAvailable languages:")
@@ -44,23 +109,30 @@ def main():
     # Get source language
     while True:
         try:
-            source_choice = input("\nSelect source language (1-20): ").strip()
+            source_choice = input("\nSelect source language (1-20, or 'auto' to detect it): ").strip()
+            if source_choice.lower() == "auto":
+                source_lang_name, source_lang = "the detected language", "auto"
+                break
             if source_choice in languages:
                 source_lang_name, source_lang = languages[source_choice]
                 break
             else:
-                print("Invalid choice. Please select 1-20.")
+                print("Invalid choice. Please select 1-20 or 'auto'.")
         except KeyboardInterrupt:
             print("\nGoodbye!")
             return
     
-    # Get target language
+    # Get target language(s)
     while True:
         try:
-            target_choice = input("Select target language (1-20): ").strip()
-            if target_choice in languages:
-                target_lang_name, target_lang = languages[target_choice]
-                if target_lang == source_lang:
+            target_choice = input("Select target language (1-20, several separated by commas, or 'all'): ").strip()
+            if target_choice.lower() == "all":
+                targets = [language for language in languages.values() if language[1] != source_lang]
+                break
+            choices = [choice.strip() for choice in target_choice.split(",")]
+            if all(choice in languages for choice in choices):
+                targets = [languages[choice] for choice in dict.fromkeys(choices)]
+                if any(code == source_lang for _, code in targets):
                     print("Source and target languages cannot be the same. Please select different languages.")
                     continue
                 break
@@ -69,19 +141,34 @@ def main():
         except KeyboardInterrupt:
             print("\nGoodbye!")
             return
+    target_lang_name, target_lang = targets[0]
     
     # Get input text
-    print(f"\nTranslating from {source_lang_name} to {target_lang_name}")
+    print(f"\nTranslating from {source_lang_name} to {', '.join(name for name, _ in targets)}")
     input_text = input("Enter text to translate: ").strip()
     
     if not input_text:
         print("No text entered. Exiting.")
         return
     
+    if len(targets) > 1:
+        print("\n🔄 Translating...")
+        try:
+            translations = translate_fanout(source_lang, [code for _, code in targets], input_text)
+        except Exception as e:
+            print(f"❌ Translation failed: {str(e)}")
+            return
+        for name, code in targets:
+            print(f"✅ {name} ({code}): {translations[code]}")
+        return
+    
     # Perform translation
     print("\n🔄 Translating...")
     try:
         translated_text = translate_text(source_lang, target_lang, input_text)
+        if source_lang == "auto":
+            detected = detect_source_language(input_text)
+            print(f"🔍 Detected language: {LANGUAGE_NAMES.get(detected, 'unknown')}")
         print(f"✅ Translation: {translated_text}")
         
         # Ask if user wants audio
@@ -118,4 +205,4 @@ def main():
         print(f"❌ Translation failed: {str(e)}")
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
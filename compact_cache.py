@@ -0,0 +1,214 @@
+"""
+Memory-compact cache tier for the Language Translation Tool.
+Holds millions of translations without any Python objects per entry: keys are
+64-bit hashes in an open-addressing table of slot numbers, keys and values are
+UTF-8 in one contiguous bytearray arena, the remaining per-entry fields live
+in parallel typed arrays, and eviction uses the CLOCK algorithm (one
+reference byte per slot) instead of relinking a list node on every hit.
+"""
+
+from array import array
+from typing import Iterator, Optional, Tuple
+
+# Table cell without an entry
+_EMPTY = -1
+# Arena garbage (bytes of overwritten entries) tolerated before compacting
+_MIN_COMPACT_BYTES = 1 << 20
+
+
+def _encode(key: Tuple[str, ...]) -> bytes:
+    # Only the last key part (the text) may contain "\0", so keys decode unambiguously
+    return "\0".join(key).encode("utf-8")
+
+
+class CompactCache:
+    """
+    Fixed-capacity map from tuples of strings to (str, float) entries, with CLOCK
+    eviction. About 50 bytes of bookkeeping per entry plus the UTF-8 bytes of key
+    and value, against several hundred for a dict or functools.lru_cache.
+    """
+
+    __slots__ = ("capacity", "_hashes", "_offsets", "_key_lengths", "_value_lengths", "_created",
+                 "_referenced", "_arena", "_garbage", "_table", "_mask", "_hand")
+
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity (int): Maximum number of entries
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove every entry and release the arena."""
+        # Per slot: key hash, arena offset, key and value byte lengths, created_at, CLOCK bit
+        self._hashes = array("q")
+        self._offsets = array("Q")
+        self._key_lengths = array("I")
+        self._value_lengths = array("I")
+        self._created = array("d")
+        self._referenced = bytearray()
+        self._arena = bytearray()
+        self._garbage = 0
+        # Linear-probing table of slot numbers, kept at most half full
+        self._table = array("q", [_EMPTY]) * 16
+        self._mask = 15
+        self._hand = 0
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def _find(self, key_hash: int, key: bytes) -> int:
+        """Return the slot holding key, or -1."""
+        table, mask, hashes = self._table, self._mask, self._hashes
+        index = key_hash & mask
+        while True:
+            slot = table[index]
+            if slot == _EMPTY:
+                return -1
+            if hashes[slot] == key_hash:
+                offset = self._offsets[slot]
+                if self._arena[offset:offset + self._key_lengths[slot]] == key:
+                    return slot
+            index = (index + 1) & mask
+
+    def get(self, key: Tuple[str, ...]) -> Optional[Tuple[str, float]]:
+        """Return the (value, created_at) stored under key and mark it used, or None."""
+        slot = self._find(hash(key), _encode(key))
+        if slot < 0:
+            return None
+        self._referenced[slot] = 1
+        start = self._offsets[slot] + self._key_lengths[slot]
+        return self._arena[start:start + self._value_lengths[slot]].decode("utf-8"), self._created[slot]
+
+    def set(self, key: Tuple[str, ...], entry: Tuple[str, float]) -> None:
+        """Store (value, created_at) under key, evicting an entry if the cache is full."""
+        value, created_at = entry
+        key_bytes = _encode(key)
+        value_bytes = value.encode("utf-8")
+        key_hash = hash(key)
+        slot = self._find(key_hash, key_bytes)
+        if slot < 0 and len(self._hashes) < self.capacity:
+            self._append(key_hash, key_bytes, value_bytes, created_at)
+            return
+        if slot < 0:
+            slot = self._evict()
+            self._hashes[slot] = key_hash
+            # A new entry gets no second chance until it is used
+            self._referenced[slot] = 0
+            self._index(slot)
+        self._write(slot, key_bytes, value_bytes)
+        self._created[slot] = created_at
+
+    def _append(self, key_hash: int, key: bytes, value: bytes, created_at: float) -> None:
+        """Fill the next unused slot (only while below capacity)."""
+        slot = len(self._hashes)
+        self._hashes.append(key_hash)
+        self._offsets.append(len(self._arena))
+        self._key_lengths.append(len(key))
+        self._value_lengths.append(len(value))
+        self._created.append(created_at)
+        self._referenced.append(0)
+        self._arena += key
+        self._arena += value
+        if (slot + 1) * 2 > len(self._table):
+            self._resize(len(self._table) * 2)
+        else:
+            self._index(slot)
+
+    def _index(self, slot: int) -> None:
+        table, mask = self._table, self._mask
+        index = self._hashes[slot] & mask
+        while table[index] != _EMPTY:
+            index = (index + 1) & mask
+        table[index] = slot
+
+    def _evict(self) -> int:
+        """Advance the CLOCK hand past used entries (clearing their bit) and unindex the first unused one."""
+        referenced = self._referenced
+        while True:
+            victim = referenced.find(0, self._hand)
+            if victim >= 0:
+                referenced[self._hand:victim] = bytes(victim - self._hand)
+                self._hand = (victim + 1) % len(referenced)
+                break
+            referenced[self._hand:] = bytes(len(referenced) - self._hand)
+            self._hand = 0
+        self._unindex(victim)
+        return victim
+
+    def _unindex(self, slot: int) -> None:
+        """Remove slot from the table, shifting later probes back so no tombstones are needed."""
+        table, mask, hashes = self._table, self._mask, self._hashes
+        hole = hashes[slot] & mask
+        while table[hole] != slot:
+            hole = (hole + 1) & mask
+        index = hole
+        while True:
+            index = (index + 1) & mask
+            moved = table[index]
+            if moved == _EMPTY:
+                break
+            home = hashes[moved] & mask
+            # Entries whose home lies cyclically in (hole, index] must stay put
+            if (home <= hole or home > index) if hole <= index else (home <= hole and home > index):
+                table[hole] = moved
+                hole = index
+        table[hole] = _EMPTY
+
+    def _resize(self, size: int) -> None:
+        table = array("q", [_EMPTY]) * size
+        mask = size - 1
+        for slot, key_hash in enumerate(self._hashes):
+            index = key_hash & mask
+            while table[index] != _EMPTY:
+                index = (index + 1) & mask
+            table[index] = slot
+        self._table, self._mask = table, mask
+
+    def _write(self, slot: int, key: bytes, value: bytes) -> None:
+        """Put key and value bytes in the arena, reusing the slot's old space when they fit."""
+        size = len(key) + len(value)
+        old_size = self._key_lengths[slot] + self._value_lengths[slot]
+        if size <= old_size:
+            offset = self._offsets[slot]
+            self._garbage += old_size - size
+        else:
+            offset = len(self._arena)
+            self._garbage += old_size
+        self._arena[offset:offset + size] = key + value
+        self._offsets[slot] = offset
+        self._key_lengths[slot] = len(key)
+        self._value_lengths[slot] = len(value)
+        if self._garbage > _MIN_COMPACT_BYTES and self._garbage * 2 > len(self._arena):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Copy live entries into a fresh arena, dropping overwritten bytes."""
+        arena = bytearray()
+        old = self._arena
+        for slot in range(len(self._hashes)):
+            offset = self._offsets[slot]
+            self._offsets[slot] = len(arena)
+            arena += old[offset:offset + self._key_lengths[slot] + self._value_lengths[slot]]
+        self._arena = arena
+        self._garbage = 0
+
+    def items(self) -> Iterator[Tuple[Tuple[str, ...], Tuple[str, float]]]:
+        """Yield (key, (value, created_at)), entries used since the CLOCK hand passed them first."""
+        referenced = self._referenced
+        slots = [slot for slot in range(len(self._hashes)) if referenced[slot]]
+        slots += [slot for slot in range(len(self._hashes)) if not referenced[slot]]
+        for slot in slots:
+            offset, key_length = self._offsets[slot], self._key_lengths[slot]
+            key = self._arena[offset:offset + key_length].decode("utf-8").split("\0", 2)
+            value = self._arena[offset + key_length:offset + key_length + self._value_lengths[slot]]
+            yield tuple(key), (value.decode("utf-8"), self._created[slot])
+
+    def memory_bytes(self) -> int:
+        """Bytes held by the arrays, table and arena (including spare capacity of the arena)."""
+        columns = (self._hashes, self._offsets, self._key_lengths, self._value_lengths, self._created, self._table)
+        return (sum(column.buffer_info()[1] * column.itemsize for column in columns)
+                + len(self._referenced) + len(self._arena))
@@ -0,0 +1,219 @@
+"""
+Concurrent translation engine for the Language Translation Tool.
+Runs cache misses on a bounded thread pool, throttled by a token-bucket rate
+limiter, and delivers results in input order.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+import utils
+from normalization import TextNormalizer
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` requests per second with bursts up to `burst`."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("Rate must be greater than zero")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# Normalizer that leaves text untouched
+_IDENTITY = TextNormalizer(unicode_form=None, collapse_whitespace=False)
+
+
+class TranslationEngine:
+    """
+    Translate many texts in parallel.
+
+    Cache hits are answered on the worker thread without touching the rate
+    limiter; only real backend calls consume tokens.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        rate_limit: Optional[float] = None,
+        burst: Optional[int] = None,
+        translate_func: Optional[Callable[[str, str, str], str]] = None,
+        normalize: bool = True,
+    ):
+        """
+        Args:
+            max_workers (int): Number of concurrent backend requests
+            rate_limit (float): Maximum backend requests per second (None = unlimited)
+            burst (int): Token bucket size (defaults to one second of requests)
+            translate_func (callable): Backend call taking (source_lang, target_lang, text)
+                (None = utils' cached, masked and template-aware translation)
+            normalize (bool): Apply utils' text normalization before cache lookup
+        """
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(rate_limit, burst) if rate_limit else None
+        self.translate_func = translate_func
+        self.normalize = normalize
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="translate")
+
+    def _translate_one(self, source_lang: str, target_lang: str, text: str) -> str:
+        clean_text = text.strip() if text else ""
+        if not clean_text:
+            return ""
+        normalizer = utils._normalizer if self.normalize else _IDENTITY
+        key, case = normalizer.normalize(clean_text)
+        # Same cache key as translate_text: source resolved, template matched, spans masked
+        prepared = utils._prepare(source_lang, target_lang, key)
+        if prepared is None:
+            return normalizer.restore(key, case)
+        cached = utils._lookup_prepared(target_lang, prepared)
+        restored = utils._restore_prepared(prepared, cached) if cached is not None else None
+        if restored is not None:
+            return normalizer.restore(restored, case)
+        return normalizer.restore(self._translate_miss(target_lang, key, prepared, cached), case)
+
+    def _translate_miss(self, target_lang: str, text: str, prepared, cached: Optional[str] = None) -> str:
+        """Translate a prepared text that the cache could not answer (see utils._prepare)."""
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        try:
+            if self.translate_func is None:
+                return utils._translate_prepared(target_lang, text, prepared, cached)
+            return self.translate_func(prepared.source, target_lang, text)
+        except Exception as e:
+            raise utils._translation_error(e)
+
+    def imap(self, source_lang: str, target_lang: str, texts: Iterable[str],
+             return_exceptions: bool = False) -> Iterator[str]:
+        """
+        Translate texts concurrently, yielding results in input order.
+        At most a few batches of work are queued at once, so arbitrarily long
+        iterables are processed in constant memory.
+        
+        Args:
+            return_exceptions (bool): Yield a failed text's exception in its place
+                instead of raising it
+        
+        Raises:
+            Exception: If any translation fails (unless return_exceptions is set)
+        """
+        window = deque()
+        max_pending = self.max_workers * 4
+
+        def result(future):
+            if return_exceptions:
+                error = future.exception()
+                if error is not None:
+                    return error
+            return future.result()
+
+        for text in texts:
+            window.append(self._executor.submit(self._translate_one, source_lang, target_lang, text))
+            if len(window) >= max_pending:
+                yield result(window.popleft())
+        while window:
+            yield result(window.popleft())
+
+    def translate(self, source_lang: str, target_lang: str, texts: Iterable[str]) -> List[str]:
+        """Translate texts concurrently and return the results in input order."""
+        return list(self.imap(source_lang, target_lang, texts))
+
+    def fanout(self, source_lang: str, target_langs: Iterable[str], text: str) -> Dict[str, str]:
+        """
+        Translate one text into several languages concurrently.
+        The text is normalized once, every target's cache entry is checked on the
+        calling thread and only the misses are sent to the workers.
+        
+        Returns:
+            dict: Translations keyed by target language code, in the order given
+        
+        Raises:
+            Exception: If any translation fails
+        """
+        targets = list(dict.fromkeys(target_langs))
+        clean_text = text.strip() if text else ""
+        if not clean_text:
+            return {target: "" for target in targets}
+        normalizer = utils._normalizer if self.normalize else _IDENTITY
+        key, case = normalizer.normalize(clean_text)
+
+        results = {}
+        pending = {}
+        for target in targets:
+            if target == source_lang:
+                results[target] = clean_text
+                continue
+            # Detection is memoized, so "auto" is only resolved once for all targets
+            prepared = utils._prepare(source_lang, target, key)
+            if prepared is None:
+                results[target] = normalizer.restore(key, case)
+                continue
+            cached = utils._lookup_prepared(target, prepared)
+            restored = utils._restore_prepared(prepared, cached) if cached is not None else None
+            if restored is not None:
+                results[target] = normalizer.restore(restored, case)
+            else:
+                pending[target] = self._executor.submit(self._translate_miss, target, key, prepared, cached)
+        for target, future in pending.items():
+            results[target] = normalizer.restore(future.result(), case)
+        return {target: results[target] for target in targets}
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads."""
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+
+_default_engine = None
+_default_engine_lock = threading.Lock()
+
+def get_engine(max_workers: Optional[int] = None, rate_limit: Optional[float] = None) -> TranslationEngine:
+    """
+    Return the process-wide engine shared by the CLI and the Streamlit app.
+    The first call creates it (max_workers defaults to 8, rate_limit to unlimited);
+    later calls return the same engine.
+    
+    Args:
+        max_workers (int): Number of concurrent backend requests (None = as configured)
+        rate_limit (float): Maximum backend requests per second (None = as configured)
+    
+    Raises:
+        ValueError: If the engine already exists with different settings
+    """
+    global _default_engine
+    with _default_engine_lock:
+        if _default_engine is None:
+            _default_engine = TranslationEngine(max_workers=max_workers or 8, rate_limit=rate_limit)
+            return _default_engine
+        current_rate = _default_engine.rate_limiter.rate if _default_engine.rate_limiter else None
+        if ((max_workers is not None and max_workers != _default_engine.max_workers)
+                or (rate_limit is not None and rate_limit != current_rate)):
+            raise ValueError(
+                f"The shared engine already runs with max_workers={_default_engine.max_workers}, "
+                f"rate_limit={current_rate}; create a TranslationEngine for other settings"
+            )
+        return _default_engine
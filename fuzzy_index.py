@@ -0,0 +1,167 @@
+"""
+Fuzzy matching for the translation memory.
+An inverted character n-gram index finds stored segments within a similarity
+threshold of a query without comparing against every entry.
+"""
+
+import math
+from array import array
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+
+def _grams(text: str, n: int) -> set:
+    """Return the set of character n-grams of text, padded so short texts still have grams."""
+    padded = f"\x02{text}\x03"
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+def bounded_edit_distance(a: str, b: str, max_distance: int) -> Optional[int]:
+    """
+    Levenshtein distance between a and b, or None if it exceeds max_distance.
+    Only a band of width 2 * max_distance + 1 around the diagonal is computed.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    if len(a) > len(b):
+        a, b = b, a
+    inf = max_distance + 1
+    previous = [j if j <= max_distance else inf for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        low = max(1, i - max_distance)
+        high = min(len(b), i + max_distance)
+        current = [inf] * (len(b) + 1)
+        current[0] = i if i <= max_distance else inf
+        char_a = a[i - 1]
+        row_min = current[0]
+        for j in range(low, high + 1):
+            cost = 0 if char_a == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            current[j] = value if value <= max_distance else inf
+            if current[j] < row_min:
+                row_min = current[j]
+        if row_min > max_distance:
+            return None
+        previous = current
+    distance = previous[len(b)]
+    return distance if distance <= max_distance else None
+
+
+def _edit_budget(fraction: float, length: float) -> int:
+    """Whole edits allowed in fraction of length; the tolerance keeps e.g. 0.1 * 10 from truncating to 0."""
+    return math.floor(fraction * length + 1e-9)
+
+
+def similarity(a: str, b: str) -> float:
+    """Edit-distance similarity in [0, 1]: 1 - distance / length of the longer string."""
+    longest = max(len(a), len(b))
+    if longest == 0:
+        return 1.0
+    distance = bounded_edit_distance(a, b, longest)
+    return 1 - distance / longest
+
+
+class FuzzyIndex:
+    """
+    Inverted n-gram index over source segments.
+
+    Lookups use the q-gram count filter: a string within k edits of the query
+    keeps all but at most n * k of the query's distinct n-grams, so among any
+    n * k + c of them it contains at least c. The postings of the rarest
+    n * k + c query grams are counted to collect candidates, and only the few
+    that reach c are verified with a banded edit distance. Postings are split
+    into length bands so texts too short or too long to match are never read.
+    """
+
+    # Extra rarest grams counted beyond n * k (c above); higher prunes harder
+    # but reads more postings
+    EXTRA_GRAMS = 6
+    # Width in characters of each length band
+    LENGTH_BAND = 4
+
+    def __init__(self, n: int = 3):
+        """
+        Args:
+            n (int): Gram length in characters
+        """
+        self.n = n
+        # length band -> gram -> ids of texts in that band containing the gram
+        self._bands: Dict[int, Dict[str, array]] = defaultdict(lambda: defaultdict(lambda: array("I")))
+        self._texts: List[str] = []
+        self._payloads: List[object] = []
+        self._ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def add(self, text: str, payload: object = None) -> None:
+        """Index text, returning payload with it on a match (re-adding a text updates its payload)."""
+        doc_id = self._ids.get(text)
+        if doc_id is not None:
+            self._payloads[doc_id] = payload
+            return
+        doc_id = len(self._texts)
+        self._ids[text] = doc_id
+        self._texts.append(text)
+        self._payloads.append(payload)
+        postings = self._bands[len(text) // self.LENGTH_BAND]
+        for gram in _grams(text, self.n):
+            postings[gram].append(doc_id)
+
+    def _candidates(self, query_grams: set, required: int, min_len: int, max_len: int):
+        """Ids of texts in the length range sharing enough grams with the query to possibly match."""
+        bands = [self._bands[band] for band in range(min_len // self.LENGTH_BAND, max_len // self.LENGTH_BAND + 1)
+                 if band in self._bands]
+        if required <= 0:
+            # Too short for the count filter to prune anything
+            return {doc_id for postings in bands for ids in postings.values() for doc_id in ids}
+
+        frequency = sorted(
+            (sum(len(postings[gram]) for postings in bands if gram in postings), gram) for gram in query_grams
+        )
+        scanned = min(len(query_grams), len(query_grams) - required + self.EXTRA_GRAMS)
+        needed = scanned - (len(query_grams) - required)
+        counts = Counter()
+        for postings in bands:
+            for _, gram in frequency[:scanned]:
+                ids = postings.get(gram)
+                if ids is not None:
+                    counts.update(ids)
+        return [doc_id for doc_id, count in counts.items() if count >= needed]
+
+    def search(self, query: str, threshold: float = 0.95, limit: int = 1) -> List[Tuple[str, object, float]]:
+        """
+        Find indexed texts whose similarity to query is at least threshold.
+
+        Returns:
+            list: Up to limit (text, payload, similarity) tuples, best first
+        """
+        exact = self._ids.get(query)
+        if exact is not None:
+            return [(query, self._payloads[exact], 1.0)]
+
+        # Longest candidate length allowed by the threshold, and the edit budget it implies
+        max_len = _edit_budget(1 / threshold, len(query)) if threshold > 0 else len(query) * 2
+        max_edits = _edit_budget(1 - threshold, max_len)
+        min_len = len(query) - max_edits
+
+        query_grams = _grams(query, self.n)
+        required = len(query_grams) - self.n * max_edits
+
+        matches = []
+        for doc_id in self._candidates(query_grams, required, min_len, max_len):
+            text = self._texts[doc_id]
+            if not min_len <= len(text) <= max_len:
+                continue
+            longest = max(len(text), len(query))
+            distance = bounded_edit_distance(query, text, _edit_budget(1 - threshold, longest))
+            if distance is None:
+                continue
+            score = 1 - distance / longest
+            if score >= threshold - 1e-9:
+                matches.append((text, self._payloads[doc_id], score))
+
+        matches.sort(key=lambda match: -match[2])
+        return matches[:limit]
@@ -0,0 +1,306 @@
+"""
+Offline language identification for the Language Translation Tool.
+Recognizes the 20 supported languages without a network call: languages with
+their own script (Greek, Russian, Arabic, Hindi, Japanese, Korean, Chinese) are
+identified by character ranges, and Latin-script languages are scored against
+character trigram profiles built once from the sample sentences below.
+"""
+
+import math
+import re
+from functools import lru_cache
+from collections import Counter, namedtuple
+from typing import Dict, List, Optional, Tuple
+
+# A detected language and how confident the model is (0-1)
+Detection = namedtuple("Detection", ["language", "confidence"])
+
+# Letter runs per script; kana is checked before Han so Japanese wins over Chinese
+_SCRIPTS = [
+    ("ja", re.compile(r"[぀-ヿ]")),
+    ("ko", re.compile(r"[ᄀ-ᇿ㄰-㆏가-힯]")),
+    ("zh", re.compile(r"[一-鿿㐀-䶿]")),
+    ("el", re.compile(r"[Ͱ-Ͽἀ-῿]")),
+    ("ru", re.compile(r"[Ѐ-ӿ]")),
+    ("ar", re.compile(r"[؀-ۿݐ-ݿ]")),
+    ("hi", re.compile(r"[ऀ-ॿ]")),
+]
+_LATIN = re.compile(r"[a-zA-ZÀ-ɏ]")
+_OTHER_SCRIPTS = re.compile("|".join(pattern.pattern for _, pattern in _SCRIPTS))
+
+# URLs and e-mail addresses carry no language
+_URL_OR_EMAIL = re.compile(r"(?:https?://|www\.)\S+|[\w.+-]+@[\w-]+\.[\w.-]+")
+_LETTER = re.compile(r"[^\W\d_]")
+# Characters that separate words for the trigram model
+_NON_LETTER = re.compile(r"[^a-zß-ɏ]+")
+
+# Only the start of long texts is scored; it is plenty to tell languages apart
+MAX_SCORED_CHARS = 300
+
+# Sample sentences the Latin-script profiles are built from
+SAMPLES = {
+    "en": (
+        "The quick brown fox jumps over the lazy dog. Hello, how are you today? "
+        "Thank you very much for your help. Where is the nearest train station? "
+        "I would like to order a coffee and a piece of cake, please. "
+        "Please save your changes before you close the window. "
+        "The weather is nice and we are going to the beach this weekend. "
+        "My name is John and I live in a small house with my family. "
+        "What time does the meeting start? Your order has been shipped and will arrive soon. "
+        "We should think about the things that matter the most. "
+        "This is the best book that I have ever read. They were waiting for the bus. "
+        "I do not know what you mean, but the file could not be saved. "
+        "She said that she did not have time to come tomorrow. Can you help me with this, please?"
+    ),
+    "es": (
+        "El rápido zorro marrón salta sobre el perro perezoso. Hola, ¿cómo estás hoy? "
+        "Muchas gracias por tu ayuda. ¿Dónde está la estación de tren más cercana? "
+        "Me gustaría pedir un café y un trozo de pastel, por favor. "
+        "Por favor, guarde los cambios antes de cerrar la ventana. "
+        "Hace buen tiempo y vamos a la playa este fin de semana. "
+        "Me llamo Juan y vivo en una casa pequeña con mi familia. "
+        "¿A qué hora empieza la reunión? Su pedido ha sido enviado y llegará pronto. "
+        "Deberíamos pensar en las cosas que más importan. "
+        "Este es el mejor libro que he leído nunca. Ellos estaban esperando el autobús."
+    ),
+    "fr": (
+        "Le renard brun rapide saute par-dessus le chien paresseux. Bonjour, comment allez-vous aujourd'hui ? "
+        "Merci beaucoup pour votre aide. Où se trouve la gare la plus proche ? "
+        "Je voudrais commander un café et un morceau de gâteau, s'il vous plaît. "
+        "Veuillez enregistrer vos modifications avant de fermer la fenêtre. "
+        "Il fait beau et nous allons à la plage ce week-end. "
+        "Je m'appelle Jean et j'habite dans une petite maison avec ma famille. "
+        "À quelle heure commence la réunion ? Votre commande a été expédiée et arrivera bientôt. "
+        "Nous devrions penser aux choses qui comptent le plus. "
+        "C'est le meilleur livre que j'aie jamais lu. Ils attendaient le bus."
+    ),
+    "de": (
+        "Der schnelle braune Fuchs springt über den faulen Hund. Hallo, wie geht es dir heute? "
+        "Vielen Dank für deine Hilfe. Wo ist der nächste Bahnhof? "
+        "Ich möchte bitte einen Kaffee und ein Stück Kuchen bestellen. "
+        "Bitte speichern Sie Ihre Änderungen, bevor Sie das Fenster schließen. "
+        "Das Wetter ist schön und wir fahren am Wochenende an den Strand. "
+        "Ich heiße Johann und wohne mit meiner Familie in einem kleinen Haus. "
+        "Um wie viel Uhr beginnt die Besprechung? Ihre Bestellung wurde versandt und kommt bald an. "
+        "Wir sollten über die Dinge nachdenken, die am wichtigsten sind. "
+        "Das ist das beste Buch, das ich je gelesen habe. Sie warteten auf den Bus. "
+        "Ich weiß nicht, was du meinst, aber die Datei konnte nicht gespeichert werden. "
+        "Sie sagte, dass sie morgen keine Zeit hat. Kannst du mir bitte dabei helfen?"
+    ),
+    "it": (
+        "La veloce volpe marrone salta sopra il cane pigro. Ciao, come stai oggi? "
+        "Grazie mille per il tuo aiuto. Dov'è la stazione ferroviaria più vicina? "
+        "Vorrei ordinare un caffè e una fetta di torta, per favore. "
+        "Per favore, salva le modifiche prima di chiudere la finestra. "
+        "Il tempo è bello e questo fine settimana andiamo al mare. "
+        "Mi chiamo Giovanni e vivo in una piccola casa con la mia famiglia. "
+        "A che ora inizia la riunione? Il tuo ordine è stato spedito e arriverà presto. "
+        "Dovremmo pensare alle cose che contano di più. "
+        "Questo è il libro più bello che abbia mai letto. Stavano aspettando l'autobus."
+    ),
+    "pt": (
+        "A rápida raposa marrom pula sobre o cão preguiçoso. Olá, como você está hoje? "
+        "Muito obrigado pela sua ajuda. Onde fica a estação de trem mais próxima? "
+        "Eu gostaria de pedir um café e uma fatia de bolo, por favor. "
+        "Por favor, salve as suas alterações antes de fechar a janela. "
+        "O tempo está bom e nós vamos à praia neste fim de semana. "
+        "Meu nome é João e eu moro numa casa pequena com a minha família. "
+        "A que horas começa a reunião? O seu pedido foi enviado e chegará em breve. "
+        "Nós devemos pensar nas coisas que mais importam. "
+        "Este é o melhor livro que eu já li. Eles estavam esperando o ônibus."
+    ),
+    "nl": (
+        "De snelle bruine vos springt over de luie hond. Hallo, hoe gaat het vandaag met je? "
+        "Heel erg bedankt voor je hulp. Waar is het dichtstbijzijnde treinstation? "
+        "Ik wil graag een koffie en een stuk taart bestellen, alstublieft. "
+        "Sla uw wijzigingen op voordat u het venster sluit. "
+        "Het weer is mooi en we gaan dit weekend naar het strand. "
+        "Mijn naam is Jan en ik woon met mijn familie in een klein huis. "
+        "Hoe laat begint de vergadering? Uw bestelling is verzonden en komt binnenkort aan. "
+        "We moeten nadenken over de dingen die het belangrijkst zijn. "
+        "Dit is het beste boek dat ik ooit heb gelezen. Zij wachtten op de bus. "
+        "Ik weet niet wat je bedoelt, maar het bestand kon niet worden opgeslagen. "
+        "Ze zei dat ze morgen geen tijd heeft. Kun je me hier alsjeblieft mee helpen?"
+    ),
+    "sv": (
+        "Den snabba bruna räven hoppar över den lata hunden. Hej, hur mår du idag? "
+        "Tack så mycket för din hjälp. Var ligger närmaste järnvägsstation? "
+        "Jag skulle vilja beställa en kaffe och en bit tårta, tack. "
+        "Spara dina ändringar innan du stänger fönstret. "
+        "Vädret är fint och vi ska åka till stranden i helgen. "
+        "Jag heter Johan och jag bor i ett litet hus med min familj. "
+        "Vilken tid börjar mötet? Din beställning har skickats och kommer snart fram. "
+        "Vi borde tänka på de saker som betyder mest. "
+        "Det här är den bästa boken som jag någonsin har läst. De väntade på bussen. "
+        "Jag vet inte vad du menar, men filen kunde inte sparas. Vad heter du och var kommer du ifrån? "
+        "Hon sade att hon inte hade tid att komma i morgon. Kan du hjälpa mig med det här?"
+    ),
+    "no": (
+        "Den raske brune reven hopper over den late hunden. Hei, hvordan har du det i dag? "
+        "Tusen takk for hjelpen din. Hvor er nærmeste jernbanestasjon? "
+        "Jeg vil gjerne bestille en kaffe og et stykke kake, takk. "
+        "Vennligst lagre endringene dine før du lukker vinduet. "
+        "Været er fint, og vi skal dra til stranden i helgen. "
+        "Jeg heter Johan, og jeg bor i et lite hus sammen med familien min. "
+        "Når begynner møtet? Bestillingen din er sendt og kommer snart. "
+        "Vi burde tenke på de tingene som betyr mest. "
+        "Dette er den beste boken jeg noensinne har lest. De ventet på bussen. "
+        "Jeg vet ikke hva du mener, men filen kunne ikke lagres. Hva heter du, og hvor kommer du fra? "
+        "Hun sa at hun ikke hadde tid til å komme i morgen. Kan du hjelpe meg med dette?"
+    ),
+    "da": (
+        "Den hurtige brune ræv hopper over den dovne hund. Hej, hvordan har du det i dag? "
+        "Mange tak for din hjælp. Hvor er den nærmeste togstation? "
+        "Jeg vil gerne bestille en kaffe og et stykke kage, tak. "
+        "Gem venligst dine ændringer, før du lukker vinduet. "
+        "Vejret er dejligt, og vi tager til stranden i weekenden. "
+        "Jeg hedder Johan, og jeg bor i et lille hus sammen med min familie. "
+        "Hvornår begynder mødet? Din ordre er blevet afsendt og ankommer snart. "
+        "Vi burde tænke over de ting, der betyder mest. "
+        "Det er den bedste bog, jeg nogensinde har læst. De ventede på bussen. "
+        "Jeg ved ikke, hvad du mener, men filen kunne ikke gemmes. Hvad hedder du, og hvor kommer du fra? "
+        "Hun sagde, at hun ikke havde tid til at komme i morgen. Kan du hjælpe mig med det her?"
+    ),
+    "fi": (
+        "Nopea ruskea kettu hyppää laiskan koiran yli. Hei, mitä kuuluu tänään? "
+        "Kiitos paljon avustasi. Missä on lähin rautatieasema? "
+        "Haluaisin tilata kahvin ja palan kakkua, kiitos. "
+        "Tallenna muutokset ennen kuin suljet ikkunan. "
+        "Sää on kaunis ja menemme rannalle tänä viikonloppuna. "
+        "Nimeni on Juha ja asun pienessä talossa perheeni kanssa. "
+        "Mihin aikaan kokous alkaa? Tilauksesi on lähetetty ja saapuu pian. "
+        "Meidän pitäisi miettiä asioita, jotka ovat tärkeimpiä. "
+        "Tämä on paras kirja, jonka olen koskaan lukenut. He odottivat bussia."
+    ),
+    "pl": (
+        "Szybki brązowy lis przeskakuje nad leniwym psem. Cześć, jak się dzisiaj masz? "
+        "Dziękuję bardzo za twoją pomoc. Gdzie jest najbliższa stacja kolejowa? "
+        "Chciałbym zamówić kawę i kawałek ciasta, proszę. "
+        "Zapisz zmiany przed zamknięciem okna. "
+        "Pogoda jest ładna i w ten weekend jedziemy na plażę. "
+        "Nazywam się Jan i mieszkam w małym domu z moją rodziną. "
+        "O której godzinie zaczyna się spotkanie? Twoje zamówienie zostało wysłane i wkrótce dotrze. "
+        "Powinniśmy myśleć o rzeczach, które są najważniejsze. "
+        "To najlepsza książka, jaką kiedykolwiek czytałem. Czekali na autobus."
+    ),
+    "tr": (
+        "Hızlı kahverengi tilki tembel köpeğin üzerinden atlar. Merhaba, bugün nasılsın? "
+        "Yardımın için çok teşekkür ederim. En yakın tren istasyonu nerede? "
+        "Bir kahve ve bir dilim pasta sipariş etmek istiyorum, lütfen. "
+        "Lütfen pencereyi kapatmadan önce değişikliklerinizi kaydedin. "
+        "Hava güzel ve bu hafta sonu sahile gidiyoruz. "
+        "Benim adım Can ve ailemle birlikte küçük bir evde yaşıyorum. "
+        "Toplantı saat kaçta başlıyor? Siparişiniz kargoya verildi ve yakında ulaşacak. "
+        "En önemli şeyler hakkında düşünmeliyiz. "
+        "Bu şimdiye kadar okuduğum en iyi kitap. Otobüsü bekliyorlardı."
+    ),
+}
+
+
+def _trigrams(text: str) -> List[str]:
+    """Character trigrams of each lower-cased word, padded with spaces at word boundaries."""
+    padded = _NON_LETTER.sub(" ", f" {text.lower()} ")
+    # Trigrams centred on a space would span two words
+    return [padded[i:i + 3] for i in range(len(padded) - 2) if padded[i + 1] != " "]
+
+
+def _strip_urls(text: str) -> str:
+    # Most texts have no URL or address; skip the substitution for them
+    if "://" in text or "www." in text or "@" in text:
+        return _URL_OR_EMAIL.sub(" ", text)
+    return text
+
+
+def has_language(text: str) -> bool:
+    """Return whether text contains letters outside URLs and e-mail addresses."""
+    return _LETTER.search(_strip_urls(text)) is not None
+
+
+class LanguageDetector:
+    """
+    Script ranges plus a smoothed trigram model over Latin-script languages.
+
+    Each trigram maps to a tuple of log-probabilities (one per language), so a
+    text is scored with one dict lookup per trigram.
+    """
+
+    def __init__(self, samples: Optional[Dict[str, str]] = None, smoothing: float = 0.5):
+        """
+        Args:
+            samples (dict): Sample text per Latin-script language code
+            smoothing (float): Additive smoothing for unseen trigrams
+        """
+        samples = SAMPLES if samples is None else samples
+        self.languages = list(samples)
+        counts = {lang: Counter(_trigrams(text)) for lang, text in samples.items()}
+        vocabulary = set().union(*counts.values())
+        denominators = [sum(counts[lang].values()) + smoothing * (len(vocabulary) + 1) for lang in self.languages]
+
+        self._unseen = tuple(math.log(smoothing / d) for d in denominators)
+        self._table: Dict[str, Tuple[float, ...]] = {
+            gram: tuple(math.log((counts[lang][gram] + smoothing) / d) for lang, d in zip(self.languages, denominators))
+            for gram in vocabulary
+        }
+
+    def _log_likelihoods(self, grams: List[str]) -> List[float]:
+        table, unseen = self._table, self._unseen
+        return [sum(column) for column in zip(*[table.get(gram, unseen) for gram in grams])]
+
+    def scores(self, text: str) -> Dict[str, float]:
+        """Return the average per-trigram log-likelihood of text for each Latin-script language."""
+        grams = _trigrams(text[:MAX_SCORED_CHARS])
+        if not grams:
+            return {}
+        return {lang: total / len(grams) for lang, total in zip(self.languages, self._log_likelihoods(grams))}
+
+    def detect(self, text: str) -> Optional[Detection]:
+        """
+        Identify the language of text.
+
+        Returns:
+            Detection: (language, confidence), or None if text has no letters to go by
+        """
+        text = _strip_urls(text[:MAX_SCORED_CHARS * 2])
+        if not _LETTER.search(text):
+            return None
+
+        if _OTHER_SCRIPTS.search(text):
+            script_counts = [(len(pattern.findall(text)), lang) for lang, pattern in _SCRIPTS]
+            script_letters, script_lang = max(script_counts)
+            latin_letters = len(_LATIN.findall(text))
+            if script_letters > latin_letters:
+                # Kanji-only Japanese is read as Chinese; any kana decides for Japanese
+                if script_lang == "zh" and script_counts[0][0]:
+                    script_lang = "ja"
+                return Detection(script_lang, script_letters / (script_letters + latin_letters))
+
+        grams = _trigrams(text[:MAX_SCORED_CHARS])
+        if not grams:
+            return None
+        totals = self._log_likelihoods(grams)
+        top = max(totals)
+        # Posterior over the candidates for the whole text, assuming equal priors
+        return Detection(self.languages[totals.index(top)], 1.0 / sum(math.exp(total - top) for total in totals))
+
+
+_default_detector: Optional[LanguageDetector] = None
+
+
+def get_detector() -> LanguageDetector:
+    """Return the shared detector, building the profiles on first use."""
+    global _default_detector
+    if _default_detector is None:
+        _default_detector = LanguageDetector()
+    return _default_detector
+
+
+@lru_cache(maxsize=4096)
+def detect_language(text: str) -> Optional[Detection]:
+    """
+    Identify the language of text with the shared detector.
+    Results are memoized, so repeated texts cost a dictionary lookup.
+
+    Returns:
+        Detection: (language, confidence), or None if text has no letters to go by
+    """
+    return get_detector().detect(text)
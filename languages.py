@@ -0,0 +1,31 @@
+"""
+Languages offered by the Language Translation Tool.
+Shared by the CLI, the Streamlit app and the local backends.
+"""
+
+# (ISO code, name, flag) in display order
+LANGUAGES = [
+    ("en", "English", "🇺🇸"),
+    ("es", "Spanish", "🇪🇸"),
+    ("fr", "French", "🇫🇷"),
+    ("de", "German", "🇩🇪"),
+    ("it", "Italian", "🇮🇹"),
+    ("pt", "Portuguese", "🇵🇹"),
+    ("ru", "Russian", "🇷🇺"),
+    ("ja", "Japanese", "🇯🇵"),
+    ("ko", "Korean", "🇰🇷"),
+    ("zh", "Chinese (Simplified)", "🇨🇳"),
+    ("ar", "Arabic", "🇸🇦"),
+    ("hi", "Hindi", "🇮🇳"),
+    ("nl", "Dutch", "🇳🇱"),
+    ("sv", "Swedish", "🇸🇪"),
+    ("no", "Norwegian", "🇳🇴"),
+    ("da", "Danish", "🇩🇰"),
+    ("fi", "Finnish", "🇫🇮"),
+    ("pl", "Polish", "🇵🇱"),
+    ("tr", "Turkish", "🇹🇷"),
+    ("el", "Greek", "🇬🇷"),
+]
+
+LANGUAGE_NAMES = {code: name for code, name, _ in LANGUAGES}
+LANGUAGE_CODES = list(LANGUAGE_NAMES)
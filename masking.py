@@ -0,0 +1,127 @@
+"""
+Passthrough masking for the Language Translation Tool.
+Spans that must not be translated (code, URLs, e-mail addresses, placeholders
+and numbers) are swapped for short numbered sentinels before the backend call
+and put back afterwards. Requests get smaller, the spans cannot be mangled, and
+texts that differ only in those spans ("Order 1234 shipped", "Order 5678
+shipped") share one cache entry.
+"""
+
+import re
+from typing import Iterable, List, Optional, Tuple
+
+# Span kinds, in matching priority order (earlier kinds win on overlap)
+KIND_CODE = "code"
+KIND_URL = "url"
+KIND_EMAIL = "email"
+KIND_PLACEHOLDER = "placeholder"
+KIND_NUMBER = "number"
+
+_PATTERNS = {
+    # ```blocks``` and `inline code`
+    KIND_CODE: r"```[\s\S]*?```|`[^`\n]+`",
+    KIND_URL: r"\b(?:https?://|www\.)[^\s<>\"']*[^\s<>\"'.,;:!?)\]]",
+    KIND_EMAIL: r"\b[\w.+-]+@[\w-]+(?:\.[\w-]+)*\.[A-Za-z]{2,}\b",
+    # {name}, {{ name }}, {0}, ${name}, %s, %(name)s, %1$s
+    KIND_PLACEHOLDER: r"\$?\{\{?\s*[\w.-]*\s*\}?\}|%(?:\(\w+\)|\d+\$)?[-+#0]*\d*(?:\.\d+)?[sdifgxXr]",
+    # 42, 3.14, 1,234,567.89, 1 000 000, 10:30, -5 (not digits inside words such as mp3)
+    KIND_NUMBER: r"(?<![\w.,])[-+]?\d+(?:[.,:\u00a0 ]\d+)*(?![\w])",
+}
+KINDS = tuple(_PATTERNS)
+
+# Sentinels look like ⟦0⟧; backends leave these brackets alone. The pattern
+# tolerates spaces a backend may insert inside them.
+_SENTINEL_OPEN = "⟦"
+_SENTINEL_CLOSE = "⟧"
+_SENTINEL = re.compile(r"⟦\s*(\d+)\s*⟧")
+
+# Characters every protected span contains; texts without any skip the full pattern
+_TRIGGER = re.compile(r"[\d{}%`@]|www\.|://")
+
+
+class PassthroughMasker:
+    """Replaces untranslatable spans with sentinels and restores them in the translation."""
+
+    def __init__(self, kinds: Optional[Iterable[str]] = KINDS):
+        """
+        Args:
+            kinds (iterable): Span kinds to protect (see KINDS); None or empty disables masking
+        """
+        self.kinds = tuple(kind for kind in KINDS if kind in set(kinds or ()))
+        unknown = set(kinds or ()) - set(KINDS)
+        if unknown:
+            raise ValueError(f"Unknown span kind(s): {', '.join(sorted(unknown))}. Available: {', '.join(KINDS)}")
+        # One alternation compiled up front, so masking is a single regex pass
+        self._pattern = re.compile("|".join(f"(?:{_PATTERNS[kind]})" for kind in self.kinds)) if self.kinds else None
+
+    def mask(self, text: str) -> Tuple[str, List[str]]:
+        """
+        Replace protected spans with sentinels.
+
+        Returns:
+            tuple: (masked text, the original spans in sentinel order); the text is
+                returned unchanged with no spans if nothing needed protecting
+        """
+        if self._pattern is None or _SENTINEL_OPEN in text or not _TRIGGER.search(text):
+            return text, []
+        spans = []
+
+        def replace(match):
+            spans.append(match.group())
+            return f"{_SENTINEL_OPEN}{len(spans) - 1}{_SENTINEL_CLOSE}"
+
+        masked = self._pattern.sub(replace, text)
+        return masked, spans
+
+    def unmask(self, translation: str, spans: List[str]) -> Optional[str]:
+        """
+        Put the original spans back into a translation of masked text.
+
+        Returns:
+            str: The restored translation, or None if the backend lost, duplicated
+                or invented a sentinel (the text should then be translated unmasked)
+        """
+        if not spans:
+            return translation
+        seen = []
+
+        def replace(match):
+            index = int(match.group(1))
+            seen.append(index)
+            return spans[index] if index < len(spans) else match.group()
+
+        restored = _SENTINEL.sub(replace, translation)
+        if sorted(seen) != list(range(len(spans))):
+            return None
+        return restored
+
+
+def renumber_sentinels(text: str) -> Tuple[str, List[int]]:
+    """
+    Number the sentinels in a piece of masked text from 0, in order of appearance,
+    so a sentence reads the same whichever text it was cut from.
+
+    Returns:
+        tuple: (renumbered text, the original sentinel numbers)
+    """
+    if _SENTINEL_OPEN not in text:
+        return text, []
+    numbers = []
+
+    def replace(match):
+        numbers.append(int(match.group(1)))
+        return f"{_SENTINEL_OPEN}{len(numbers) - 1}{_SENTINEL_CLOSE}"
+
+    return _SENTINEL.sub(replace, text), numbers
+
+
+def restore_sentinel_numbers(translation: str, numbers: List[int]) -> str:
+    """Undo renumber_sentinels() on a translation of the renumbered text."""
+    if not numbers:
+        return translation
+
+    def replace(match):
+        index = int(match.group(1))
+        return f"{_SENTINEL_OPEN}{numbers[index]}{_SENTINEL_CLOSE}" if index < len(numbers) else match.group()
+
+    return _SENTINEL.sub(replace, translation)
@@ -0,0 +1,300 @@
+"""
+Hot-path metrics for the Language Translation Tool.
+Timing histograms, counters and gauges for translate_text and text_to_speech,
+exported as a JSON snapshot or in the Prometheus text format.
+
+Metrics are disabled by default; while disabled every recording call returns
+after a single attribute check. Enable them with TRANSLATOR_METRICS=1 or
+metrics.enable().
+"""
+
+import bisect
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional, Tuple
+
+from languages import LANGUAGE_NAMES
+
+# Histogram bucket upper bounds in seconds
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# Language labels come from user input; codes outside languages.py are all
+# recorded as "other" so the number of series stays bounded
+OTHER_LABEL = "other"
+_LANGUAGE_LABELS = set(LANGUAGE_NAMES) | {"auto"}
+
+
+def _bounded(name: str, value) -> str:
+    """Map a "lang" or "pair" ("en-es") label to known language codes, or OTHER_LABEL."""
+    value = str(value)
+    if name == "lang":
+        return value if value in _LANGUAGE_LABELS else OTHER_LABEL
+    if name == "pair":
+        source, _, target = value.partition("-")
+        return value if source in _LANGUAGE_LABELS and target in _LANGUAGE_LABELS else OTHER_LABEL
+    return value
+
+
+def _label_key(labels: Optional[Dict[str, str]]) -> LabelKey:
+    return tuple(sorted((name, _bounded(name, value)) for name, value in labels.items())) if labels else ()
+
+
+def _escape(value: str) -> str:
+    """Escape a label value as the Prometheus text format requires."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+class Counter:
+    """Monotonically increasing count, per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def snapshot(self) -> List[dict]:
+        with self._lock:
+            return [{"labels": dict(key), "value": value} for key, value in self._values.items()]
+
+    def prometheus(self) -> List[str]:
+        with self._lock:
+            return [f"{self.name}{_format_labels(key)} {value}" for key, value in self._values.items()]
+
+
+class Gauge(Counter):
+    """Value that can go up and down, per label set."""
+
+    kind = "gauge"
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram:
+    """Bucketed distribution of observed values, per label set."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        # label key -> [bucket counts..., +Inf count], sum, count
+        self._values: Dict[LabelKey, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = _label_key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def snapshot(self) -> List[dict]:
+        with self._lock:
+            return [
+                {
+                    "labels": dict(key),
+                    "buckets": dict(zip([str(b) for b in self.buckets] + ["+Inf"], counts)),
+                    "sum": total,
+                    "count": count,
+                }
+                for key, (counts, total, count) in self._values.items()
+            ]
+
+    def prometheus(self) -> List[str]:
+        lines = []
+        with self._lock:
+            for key, (counts, total, count) in self._values.items():
+                cumulative = 0
+                for bound, bucket_count in zip(list(self.buckets) + ["+Inf"], counts):
+                    cumulative += bucket_count
+                    lines.append(f"{self.name}_bucket{_format_labels(key, ('le', str(bound)))} {cumulative}")
+                lines.append(f"{self.name}_sum{_format_labels(key)} {total}")
+                lines.append(f"{self.name}_count{_format_labels(key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds every metric and whether recording is enabled."""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._metrics: Dict[str, object] = {}
+
+    def _register(self, metric):
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        return self._register(Counter(name, help_text))
+
+    def gauge(self, name: str, help_text: str) -> Gauge:
+        return self._register(Gauge(name, help_text))
+
+    def histogram(self, name: str, help_text: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, buckets))
+
+    def reset(self) -> None:
+        """Drop every recorded value (metric definitions are kept)."""
+        for metric in self._metrics.values():
+            with metric._lock:
+                metric._values.clear()
+
+    def snapshot(self) -> dict:
+        """Return every metric as a JSON-serializable dict."""
+        return {
+            name: {"type": metric.kind, "help": metric.help, "values": metric.snapshot()}
+            for name, metric in self._metrics.items()
+        }
+
+    def prometheus(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        lines = []
+        for name, metric in self._metrics.items():
+            lines.append(f"# HELP {name} {metric.help}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric.prometheus())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry(enabled=os.environ.get("TRANSLATOR_METRICS", "") not in ("", "0"))
+
+TRANSLATE_SECONDS = registry.histogram(
+    "translator_translate_seconds", "End-to-end translate_text latency")
+TRANSLATE_BACKEND_SECONDS = registry.histogram(
+    "translator_translate_backend_seconds", "Translation backend call latency")
+CACHE_LOOKUP_SECONDS = registry.histogram(
+    "translator_cache_lookup_seconds", "Translation cache lookup latency")
+CACHE_HITS = registry.counter(
+    "translator_cache_hits_total", "Translation cache hits by language pair")
+CACHE_MISSES = registry.counter(
+    "translator_cache_misses_total", "Translation cache misses by language pair")
+TRANSLATE_ERRORS = registry.counter(
+    "translator_translate_errors_total", "Failed translations by language pair")
+TRANSLATE_IN_FLIGHT = registry.gauge(
+    "translator_translate_in_flight", "Translations currently in progress")
+TTS_SECONDS = registry.histogram(
+    "translator_tts_seconds", "End-to-end text-to-speech latency")
+TTS_BACKEND_SECONDS = registry.histogram(
+    "translator_tts_backend_seconds", "Text-to-speech backend call latency")
+TTS_BYTES = registry.counter(
+    "translator_tts_bytes_total", "MP3 bytes generated by language")
+TTS_ERRORS = registry.counter(
+    "translator_tts_errors_total", "Failed text-to-speech conversions by language")
+TTS_IN_FLIGHT = registry.gauge(
+    "translator_tts_in_flight", "Text-to-speech conversions currently in progress")
+
+
+def enable() -> None:
+    """Start recording metrics."""
+    registry.enabled = True
+
+
+def disable() -> None:
+    """Stop recording metrics (already recorded values are kept)."""
+    registry.enabled = False
+
+
+def snapshot() -> dict:
+    """Return all metrics as a JSON-serializable dict."""
+    return registry.snapshot()
+
+
+def prometheus_text() -> str:
+    """Return all metrics in the Prometheus text exposition format."""
+    return registry.prometheus()
+
+
+def write_prometheus(path: str) -> None:
+    """
+    Write all metrics to a file for the Prometheus node exporter's textfile collector.
+    The file is replaced atomically so scrapers never see a partial write.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.write(prometheus_text())
+    os.replace(tmp_path, path)
+
+
+_DISABLED = nullcontext()
+
+
+def track(histogram: Histogram, in_flight: Optional[Gauge] = None, errors: Optional[Counter] = None, **labels):
+    """
+    Time a block into histogram, optionally tracking an in-flight gauge and
+    counting exceptions. Returns a shared no-op context when metrics are disabled.
+    """
+    if not registry.enabled:
+        return _DISABLED
+    return _tracked(histogram, in_flight, errors, labels)
+
+
+@contextmanager
+def _tracked(histogram: Histogram, in_flight: Optional[Gauge], errors: Optional[Counter], labels: dict):
+    if in_flight is not None:
+        in_flight.inc()
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        if errors is not None:
+            errors.inc(**labels)
+        raise
+    finally:
+        histogram.observe(time.perf_counter() - start, **labels)
+        if in_flight is not None:
+            in_flight.dec()
+
+
+def serve_prometheus(port: int = 9464, host: str = "127.0.0.1"):
+    """
+    Serve GET /metrics in the Prometheus text format from a background thread.
+
+    Returns:
+        ThreadingHTTPServer: The running server (call shutdown() to stop it)
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = prometheus_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True, name="metrics-server").start()
+    return server
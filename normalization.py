@@ -0,0 +1,104 @@
+"""
+Text normalization for the Language Translation Tool.
+Maps near-duplicate inputs ("Hello", "hello ", "Hello ") to one cache key
+so they share a single backend call, and restores the original casing on the
+translated result.
+"""
+
+import re
+import unicodedata
+from typing import Iterable, Optional, Tuple
+
+# Runs of whitespace other than newlines (includes no-break and other Unicode spaces)
+_HORIZONTAL_SPACE = re.compile(r"[^\S\n]+")
+_SPACE_AROUND_NEWLINE = re.compile(r" ?\n ?")
+
+# Casing patterns that can be folded away and re-applied to the translation
+CASE_LOWER = "lower"
+CASE_UPPER = "upper"
+CASE_CAPITALIZED = "capitalized"
+
+
+def _case_pattern(text: str) -> Optional[str]:
+    """Return the casing pattern of text, or None if it is mixed and must be kept as-is."""
+    if text == text.lower():
+        return CASE_LOWER
+    if text == text.upper():
+        return CASE_UPPER
+    for index, char in enumerate(text):
+        if char.isalpha():
+            if char.isupper() and text[index + 1:] == text[index + 1:].lower():
+                return CASE_CAPITALIZED
+            break
+    return None
+
+
+def _capitalize_first(text: str) -> str:
+    for index, char in enumerate(text):
+        if char.isalpha():
+            return text[:index] + char.upper() + text[index + 1:]
+    return text
+
+
+class TextNormalizer:
+    """Configurable normalization applied before cache lookup."""
+
+    def __init__(self, unicode_form: Optional[str] = "NFC", collapse_whitespace: bool = True,
+                 case_fold: bool = False):
+        """
+        Args:
+            unicode_form (str): Unicode normalization form ('NFC', 'NFKC', ...) or None
+            collapse_whitespace (bool): Collapse runs of spaces/tabs to one space (newlines are kept)
+            case_fold (bool): Fold lower/UPPER/Capitalized text to lower case and restore
+                the casing on the translation (mixed-case text is never folded)
+        """
+        self.unicode_form = unicode_form
+        self.collapse_whitespace = collapse_whitespace
+        self.case_fold = case_fold
+
+    def normalize(self, text: str) -> Tuple[str, Optional[str]]:
+        """
+        Normalize text into a cache key.
+
+        Returns:
+            tuple: (normalized text, casing pattern to pass to restore(), or None)
+        """
+        if self.unicode_form:
+            text = unicodedata.normalize(self.unicode_form, text)
+        if self.collapse_whitespace:
+            text = _SPACE_AROUND_NEWLINE.sub("\n", _HORIZONTAL_SPACE.sub(" ", text)).strip()
+        if not self.case_fold:
+            return text, None
+        pattern = _case_pattern(text)
+        if pattern is None or pattern == CASE_LOWER:
+            return text, None
+        return text.lower(), pattern
+
+    def restore(self, translation: str, pattern: Optional[str]) -> str:
+        """Re-apply the casing pattern returned by normalize() to a translation."""
+        if not translation or pattern is None:
+            return translation
+        if pattern == CASE_UPPER:
+            return translation.upper()
+        if pattern == CASE_CAPITALIZED:
+            return _capitalize_first(translation)
+        return translation
+
+
+def measure_hit_ratio(texts: Iterable[str], normalizer: Optional[TextNormalizer] = None) -> float:
+    """
+    Return the hit ratio an unbounded cache would reach on a workload, keying
+    entries by text.strip() (normalizer=None, the old behaviour) or by the
+    normalizer's output.
+    """
+    seen = set()
+    hits = 0
+    total = 0
+    for text in texts:
+        key = normalizer.normalize(text.strip())[0] if normalizer else text.strip()
+        total += 1
+        if key in seen:
+            hits += 1
+        else:
+            seen.add(key)
+    return hits / total if total else 0.0
@@ -0,0 +1,232 @@
+"""
+Retries and circuit breaking for backend calls in the Language Translation Tool.
+Transient failures are retried with jittered exponential backoff inside a
+per-call deadline, and a circuit breaker per backend and language pair stops
+calling a backend that keeps failing so callers fail fast instead of each
+waiting out the full timeout.
+"""
+
+import random
+import threading
+import time
+from typing import Callable, Dict, Hashable, Optional
+
+# Exceptions raised by deep_translator when the service misbehaves (matched by
+# name so backends without deep_translator installed are not affected)
+_RETRYABLE_NAMES = {"TooManyRequests", "RequestError", "ServerException"}
+
+
+class CircuitOpenError(Exception):
+    """Raised without calling the backend while its circuit is open."""
+
+    def __init__(self, key: Hashable, retry_in: float):
+        super().__init__(f"Backend unavailable for {key}, circuit open (retrying in {retry_in:.1f}s)")
+        self.key = key
+        self.retry_in = retry_in
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Return whether a backend error is transient (network trouble, throttling, server errors)."""
+    if isinstance(error, CircuitOpenError):
+        return False
+    if isinstance(error, (ConnectionError, TimeoutError, OSError)):
+        return True
+    return type(error).__name__ in _RETRYABLE_NAMES
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter: attempt n waits uniform(0, min(max_delay, base_delay * multiplier**n))."""
+
+    def __init__(self, attempts: int = 3, base_delay: float = 0.2, max_delay: float = 5.0, multiplier: float = 2.0):
+        """
+        Args:
+            attempts (int): Calls made before giving up (1 = no retries)
+            base_delay (float): Upper bound of the first backoff, in seconds
+            max_delay (float): Upper bound of any backoff, in seconds
+            multiplier (float): Growth of the bound per retry
+        """
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1")
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+
+    def delay(self, retry: int) -> float:
+        """Return the sleep before retry number `retry` (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * self.multiplier ** retry))
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after failure_threshold consecutive failures; open -> half-open
+    after reset_timeout, when a single probe call is let through. The probe's
+    success closes the circuit, its failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Args:
+            failure_threshold (int): Consecutive failures that open the circuit
+            reset_timeout (float): Seconds the circuit stays open before a probe
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at = 0.0
+        self._state = self.CLOSED
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """Return whether a call may go through now (claims the probe when half-open)."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._probing or time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self._state = self.HALF_OPEN
+            self._probing = True
+            return True
+
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed."""
+        with self._lock:
+            return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._state = self.CLOSED
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+
+# Deadline (time.monotonic) of the attempt running on this thread
+_attempt = threading.local()
+
+
+def time_remaining() -> Optional[float]:
+    """
+    Seconds left for the backend attempt running on this thread, or None outside
+    a resilient call. Backends use it as their request timeout.
+    """
+    deadline = getattr(_attempt, "deadline", None)
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+class Resilience:
+    """Runs backend calls with retries, a deadline and a circuit breaker per key."""
+
+    def __init__(
+        self,
+        retry: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = 30.0,
+        attempt_timeout: Optional[float] = 10.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ):
+        """
+        Args:
+            retry (RetryPolicy): Backoff policy (default 3 attempts)
+            deadline (float): Seconds a call may take across all attempts (None = unbounded)
+            attempt_timeout (float): Seconds a single attempt may take (None = until the deadline)
+            failure_threshold (int): Consecutive failures that open a circuit
+            reset_timeout (float): Seconds a circuit stays open before a probe
+        """
+        self.retry = retry or RetryPolicy()
+        self.deadline = deadline
+        self.attempt_timeout = attempt_timeout
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[Hashable, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.rejected = 0
+
+    def breaker(self, key: Hashable) -> CircuitBreaker:
+        """Return the circuit breaker for key, creating it on first use."""
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(key, CircuitBreaker(self.failure_threshold, self.reset_timeout))
+        return breaker
+
+    def call(self, key: Hashable, func: Callable, *args):
+        """
+        Return func(*args), retrying transient failures while the deadline leaves
+        room for the backoff. Errors that are not transient (e.g. an unsupported
+        language) are raised at once and do not count against the circuit.
+
+        Raises:
+            CircuitOpenError: If the circuit for key is open
+            Exception: The last error from func
+        """
+        breaker = self.breaker(key)
+        deadline = None if self.deadline is None else time.monotonic() + self.deadline
+        last_error = None
+
+        for attempt in range(self.retry.attempts):
+            if not breaker.allow():
+                if last_error is not None:
+                    raise last_error
+                with self._lock:
+                    self.rejected += 1
+                raise CircuitOpenError(key, breaker.retry_in())
+
+            attempt_deadline = deadline
+            if self.attempt_timeout is not None:
+                attempt_end = time.monotonic() + self.attempt_timeout
+                attempt_deadline = attempt_end if deadline is None else min(deadline, attempt_end)
+            _attempt.deadline = attempt_deadline
+            try:
+                result = func(*args)
+            except Exception as e:
+                if not is_retryable(e):
+                    # The backend answered; the circuit only tracks availability
+                    breaker.record_success()
+                    raise
+                breaker.record_failure()
+                last_error = e
+            else:
+                breaker.record_success()
+                return result
+            finally:
+                _attempt.deadline = None
+
+            if attempt + 1 == self.retry.attempts:
+                break
+            pause = self.retry.delay(attempt)
+            if deadline is not None and time.monotonic() + pause >= deadline:
+                break
+            with self._lock:
+                self.retries += 1
+            time.sleep(pause)
+
+        raise last_error
+
+    def stats(self) -> dict:
+        """Return retry and rejection counters and the state of every circuit."""
+        with self._lock:
+            breakers = dict(self._breakers)
+            stats = {"retries": self.retries, "rejected": self.rejected}
+        stats["circuits"] = {key: breaker.state for key, breaker in breakers.items()}
+        return stats
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+HTTP service for the Language Translation Tool.
+Exposes translation and text-to-speech over a small JSON API so other services
+share one process-wide cache, translator pool and audio cache instead of each
+embedding utils.py.
+
+Endpoints:
+    POST /translate        {"source": "en", "target": "es", "text": "Hello"}
+                           (or "targets": ["es", "fr"] for several languages;
+                           "source": "auto" detects the source language)
+    POST /translate/batch  {"source": "en", "target": "es", "texts": ["Hello", "Goodbye"]}
+    POST /tts              {"text": "Hola", "lang": "es", "slow": false}  -> chunked audio/mpeg
+    GET  /tts?text=Hola&lang=es
+    GET  /health
+    GET  /metrics          Prometheus text format
+
+Usage:
+    python server.py [--host 127.0.0.1] [--port 8080] [--max-concurrency 64]
+"""
+
+import argparse
+import json
+import sys
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+# Add the current directory to the Python path to import utils
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import metrics
+import utils
+from languages import LANGUAGE_NAMES
+
+# Largest request body accepted, in bytes
+MAX_BODY_BYTES = 1024 * 1024
+
+
+class RequestError(Exception):
+    """A client error answered with the given HTTP status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class TranslationHandler(BaseHTTPRequestHandler):
+    """Request handler; HTTP/1.1 so clients can keep connections alive."""
+
+    protocol_version = "HTTP/1.1"
+    # Small JSON responses must not wait for delayed ACKs
+    disable_nagle_algorithm = True
+    # Idle keep-alive connections are closed after this many seconds
+    timeout = 60
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    # Responses
+
+    def _send_json(self, status: int, payload: dict, headers: Optional[dict] = None) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error_json(self, status: int, message: str, headers: Optional[dict] = None) -> None:
+        self._send_json(status, {"error": message}, headers)
+
+    def _send_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+
+    # Requests
+
+    def _content_length(self) -> Optional[int]:
+        """
+        Return the declared body length, or None without a Content-Length header.
+
+        Raises:
+            RequestError: If the header is not a non-negative integer
+        """
+        value = self.headers.get("Content-Length")
+        if value is None:
+            return None
+        value = value.strip()
+        if not (value.isascii() and value.isdigit()):
+            # Without a usable length the body cannot be told apart from the next request
+            self.close_connection = True
+            raise RequestError(400, "Content-Length must be a non-negative integer")
+        return int(value)
+
+    def _discard_body(self) -> None:
+        """Skip an unused request body so the connection can be reused."""
+        try:
+            length = self._content_length()
+        except RequestError:
+            return
+        if length is None:
+            # A chunked body cannot be skipped without parsing it
+            if "Transfer-Encoding" in self.headers:
+                self.close_connection = True
+        elif length > MAX_BODY_BYTES:
+            self.close_connection = True
+        elif length:
+            self.rfile.read(length)
+
+    def _read_json(self) -> dict:
+        length = self._content_length()
+        if length is None:
+            self.close_connection = True
+            raise RequestError(411, "Content-Length required")
+        if length > MAX_BODY_BYTES:
+            # The unread body would be parsed as the next request
+            self.close_connection = True
+            raise RequestError(413, f"Request body larger than {MAX_BODY_BYTES} bytes")
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            raise RequestError(400, "Request body must be JSON")
+        if not isinstance(payload, dict):
+            raise RequestError(400, "Request body must be a JSON object")
+        return payload
+
+    @staticmethod
+    def _require(payload: dict, *names: str) -> list:
+        """Return the named string fields, rejecting missing, empty and non-string values."""
+        missing = [name for name in names if payload.get(name) in (None, "")]
+        if missing:
+            raise RequestError(400, f"Missing field(s): {', '.join(missing)}")
+        invalid = [name for name in names if not isinstance(payload[name], str)]
+        if invalid:
+            raise RequestError(400, f"Field(s) must be strings: {', '.join(invalid)}")
+        return [payload[name] for name in names]
+
+    @staticmethod
+    def _require_list(payload: dict, name: str) -> list:
+        """Return a field that must be a list of strings."""
+        values = payload.get(name)
+        if values is None:
+            raise RequestError(400, f"Missing field(s): {name}")
+        if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+            raise RequestError(400, f"{name} must be a list of strings")
+        return values
+
+    @staticmethod
+    def _check_languages(field: str, *codes: str, allow_auto: bool = False) -> None:
+        """Reject language codes outside languages.py, so they never reach the backend as a 502."""
+        unsupported = [code for code in codes if code not in LANGUAGE_NAMES and not (allow_auto and code == "auto")]
+        if unsupported:
+            raise RequestError(400, f"Unsupported language(s) in {field}: {', '.join(unsupported)}. "
+                                    f"Choose from {', '.join(LANGUAGE_NAMES)}")
+
+    def _dispatch(self, handler, payload_reader) -> None:
+        """Run an API handler under the concurrency limit, mapping errors to statuses."""
+        limiter = self.server.limiter
+        if not limiter.acquire(blocking=False):
+            self._discard_body()
+            self._send_error_json(503, "Server busy, retry later", {"Retry-After": "1"})
+            return
+        try:
+            handler(payload_reader())
+        except RequestError as e:
+            self._send_error_json(e.status, str(e))
+        except ValueError as e:
+            self._send_error_json(400, str(e))
+        except Exception as e:
+            self._send_error_json(502, str(e))
+        finally:
+            limiter.release()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif url.path == "/metrics":
+            body = metrics.prometheus_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif url.path == "/tts":
+            query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+            self._dispatch(self._tts, lambda: query)
+        else:
+            self._send_error_json(404, f"Not found: {url.path}")
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        handlers = {
+            "/translate": self._translate,
+            "/translate/batch": self._translate_batch,
+            "/tts": self._tts,
+        }
+        if path not in handlers:
+            self._discard_body()
+            self._send_error_json(404, f"Not found: {path}")
+            return
+        self._dispatch(handlers[path], self._read_json)
+
+    # Endpoints
+
+    def _translate(self, payload: dict) -> None:
+        if payload.get("targets") is not None:
+            source, text = self._require(payload, "source", "text")
+            targets = self._require_list(payload, "targets")
+            self._check_languages("source", source, allow_auto=True)
+            self._check_languages("targets", *targets)
+            self._send_json(200, {"translations": utils.translate_fanout(source, targets, text)})
+            return
+        source, target, text = self._require(payload, "source", "target", "text")
+        self._check_languages("source", source, allow_auto=True)
+        self._check_languages("target", target)
+        self._send_json(200, {"translation": utils.translate_text(source, target, text)})
+
+    def _translate_batch(self, payload: dict) -> None:
+        source, target = self._require(payload, "source", "target")
+        texts = self._require_list(payload, "texts")
+        self._check_languages("source", source, allow_auto=True)
+        self._check_languages("target", target)
+        self._send_json(200, {"translations": utils.translate_many(source, target, texts)})
+
+    def _tts(self, payload: dict) -> None:
+        text, lang = self._require(payload, "text", "lang")
+        self._check_languages("lang", lang)
+        slow = payload.get("slow") in (True, "true", "1")
+        chunks = utils.text_to_speech_stream(text, lang, slow)
+        # Fetch the first piece before answering so failures still get a status code
+        first = next(chunks)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            self._send_chunk(first)
+            for chunk in chunks:
+                self._send_chunk(chunk)
+        except Exception:
+            # Headers are gone; dropping the connection without the final chunk
+            # tells the client the audio is incomplete
+            self.close_connection = True
+            return
+        self.wfile.write(b"0\r\n\r\n")
+
+
+def create_server(host: str = "127.0.0.1", port: int = 8080, max_concurrency: int = 64,
+                  verbose: bool = False) -> ThreadingHTTPServer:
+    """
+    Create the HTTP server (call serve_forever() to run it).
+
+    Args:
+        host (str): Interface to listen on
+        port (int): Port to listen on (0 picks a free port)
+        max_concurrency (int): Requests processed at once; more get 503 with Retry-After
+        verbose (bool): Log every request to stderr
+
+    Returns:
+        ThreadingHTTPServer: The server, with a thread per connection
+    """
+    server = ThreadingHTTPServer((host, port), TranslationHandler)
+    server.daemon_threads = True
+    server.limiter = threading.BoundedSemaphore(max_concurrency)
+    server.verbose = verbose
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve translation and text-to-speech over HTTP")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on")
+    parser.add_argument("--max-concurrency", type=int, default=64, help="Requests processed at once")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args(argv)
+
+    server = create_server(args.host, args.port, args.max_concurrency, args.verbose)
+    print(f"🌍 Translation service listening on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nGoodbye!")
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
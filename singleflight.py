@@ -0,0 +1,109 @@
+"""
+Request coalescing for the Language Translation Tool.
+Concurrent identical requests share one backend call: the first caller runs it
+and every caller that arrives while it is in flight receives the same result
+or exception.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Awaitable, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """An in-flight call and its outcome."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls by key, for threads (do) and coroutines (do_async).
+
+    Nothing is remembered once a call completes; callers arriving afterwards
+    start a new call (the caches in front of it answer those).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        # Event loop -> {key: task}; tasks belong to the loop that created them
+        self._tasks = weakref.WeakKeyDictionary()
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, func: Callable, *args):
+        """
+        Return func(*args), or wait for the identical call already running on another thread.
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: Hashable, func: Callable[[], Awaitable], timeout: Optional[float] = None):
+        """
+        Await func(), or the identical call already running on this event loop.
+        A caller that times out or is cancelled stops waiting without cancelling
+        the shared call, which other callers may still be awaiting.
+
+        Raises:
+            asyncio.TimeoutError: If timeout expires first
+            Exception: Whatever the shared call raised
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            tasks = self._tasks.get(loop)
+            if tasks is None:
+                tasks = self._tasks[loop] = {}
+            task = tasks.get(key)
+            if task is None:
+                task = tasks[key] = loop.create_task(func())
+                task.add_done_callback(lambda done: self._forget(tasks, key, done))
+                self.calls += 1
+            else:
+                self.shared += 1
+        return await asyncio.wait_for(asyncio.shield(task), timeout)
+
+    def _forget(self, tasks: dict, key: Hashable, task: asyncio.Task) -> None:
+        with self._lock:
+            if tasks.get(key) is task:
+                del tasks[key]
+        # Mark the error as retrieved in case every waiter gave up
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        """Return how many calls ran and how many callers shared another's call."""
+        with self._lock:
+            return {"calls": self.calls, "shared": self.shared}
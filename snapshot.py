@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Warm-start snapshots for the Language Translation Tool.
+A snapshot is one binary file holding the hottest translations and TTS clips.
+It is memory-mapped rather than parsed: opening it costs the same for ten
+entries or a million, worker processes share its pages through the OS page
+cache, and lookups binary-search a sorted array of 64-bit key hashes in place.
+
+Layout (little-endian, sections 8-byte aligned):
+    header   magic, version, then count and offset of the translation and clip sections
+    section  count uint64 key hashes (sorted), count records (uint64 offset,
+             uint32 key length, uint32 value length, float64 created_at), then
+             the key and value bytes the records point into
+Translation keys are "source\\0target\\0text" in UTF-8; clip keys are the
+SHA-256 digest AudioCache.key() computes, so both caches agree on identity.
+
+Usage:
+    python snapshot.py export snapshot.bin [--translations 50000] [--clips 500]
+Exports from the caches configured by the TRANSLATOR_* environment variables;
+the SQLite cache can be read while other processes keep using it.
+"""
+
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from bisect import bisect_left
+from typing import Callable, Iterable, Optional, Tuple
+
+from audio_cache import AudioCache
+
+MAGIC = b"TTSNAP01"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sI4xQQQQ")
+_RECORD = struct.Struct("<QIId")
+
+
+def translation_key(source_lang: str, target_lang: str, text: str) -> bytes:
+    return f"{source_lang}\0{target_lang}\0{text}".encode("utf-8")
+
+
+def clip_key(text: str, lang: str, slow: bool = False) -> bytes:
+    return bytes.fromhex(AudioCache.key(text, lang, slow))
+
+
+def _translation_hash(key: bytes) -> int:
+    """Stable 64-bit hash (Python's hash() differs between processes)."""
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def _clip_hash(key: bytes) -> int:
+    # Clip keys are SHA-256 digests already
+    return int.from_bytes(key[:8], "little")
+
+
+class _Section:
+    """One sorted hash table inside the mapped file."""
+
+    def __init__(self, buffer: mmap.mmap, count: int, offset: int, hash_key: Callable[[bytes], int]):
+        self._buffer = buffer
+        self._hash = hash_key
+        self.count = count
+        self._hashes = memoryview(buffer)[offset:offset + 8 * count].cast("Q")
+        self._records = offset + 8 * count
+
+    def get(self, key: bytes) -> Optional[Tuple[bytes, float]]:
+        """Return (value bytes, created_at) for key, or None."""
+        key_hash = self._hash(key)
+        index = bisect_left(self._hashes, key_hash)
+        while index < self.count and self._hashes[index] == key_hash:
+            offset, key_len, value_len, created_at = _RECORD.unpack_from(
+                self._buffer, self._records + index * _RECORD.size)
+            if self._buffer[offset:offset + key_len] == key:
+                return self._buffer[offset + key_len:offset + key_len + value_len], created_at
+            index += 1
+        return None
+
+    def release(self) -> None:
+        self._hashes.release()
+
+
+class Snapshot:
+    """Read-only view of a snapshot file; nothing is loaded until a lookup touches it."""
+
+    def __init__(self, path: str):
+        """
+        Raises:
+            OSError: If the file cannot be opened
+            ValueError: If it is not a snapshot of this version
+        """
+        if sys.byteorder != "little":
+            raise ValueError("Snapshots are little-endian and can only be mapped on little-endian hosts")
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, translations, translations_offset, clips, clips_offset = _HEADER.unpack_from(self._mmap)
+        except struct.error:
+            magic = version = None
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a version {VERSION} translation snapshot")
+        self._translations = _Section(self._mmap, translations, translations_offset, _translation_hash)
+        self._clips = _Section(self._mmap, clips, clips_offset, _clip_hash)
+
+    @property
+    def translations(self) -> int:
+        return self._translations.count
+
+    @property
+    def clips(self) -> int:
+        return self._clips.count
+
+    def get_translation(self, source_lang: str, target_lang: str, text: str) -> Optional[Tuple[str, float]]:
+        """
+        Returns:
+            tuple: (translation, created_at), or None if the snapshot does not have it
+        """
+        found = self._translations.get(translation_key(source_lang, target_lang, text))
+        return None if found is None else (found[0].decode("utf-8"), found[1])
+
+    def get_clip(self, text: str, lang: str, slow: bool = False) -> Optional[bytes]:
+        """Return the MP3 data for a TTS request, or None if the snapshot does not have it."""
+        if not self._clips.count:
+            return None
+        found = self._clips.get(clip_key(text, lang, slow))
+        return None if found is None else found[0]
+
+    def close(self) -> None:
+        self._translations.release()
+        self._clips.release()
+        self._mmap.close()
+
+
+def _pack_section(entries, start: int, hash_key: Callable[[bytes], int]) -> Tuple[bytes, int]:
+    """
+    Lay out one section beginning at file offset start.
+
+    Returns:
+        tuple: (section bytes, entry count)
+    """
+    unique = {}
+    for key, value, created_at in entries:
+        # The first (hottest) entry wins
+        unique.setdefault(key, (value, created_at))
+    ordered = sorted(unique.items(), key=lambda item: hash_key(item[0]))
+    count = len(ordered)
+    offset = start + (8 + _RECORD.size) * count
+    hashes, records, arena = [], [], []
+    for key, (value, created_at) in ordered:
+        hashes.append(hash_key(key))
+        records.append(_RECORD.pack(offset, len(key), len(value), created_at))
+        arena.append(key + value)
+        offset += len(key) + len(value)
+    data = struct.pack(f"<{count}Q", *hashes) + b"".join(records) + b"".join(arena)
+    return data + b"\0" * (-len(data) % 8), count
+
+
+def write_snapshot(path: str, translations: Iterable[Tuple[str, str, str, str, float]],
+                   clips: Iterable[Tuple[str, bytes, float]] = ()) -> dict:
+    """
+    Write a snapshot file atomically (processes that mapped the old file keep it).
+
+    Args:
+        path (str): Snapshot file to create or replace
+        translations (iterable): (source_lang, target_lang, text, translation, created_at), hottest first
+        clips (iterable): (AudioCache.key() hex digest, MP3 bytes, created_at), hottest first
+
+    Returns:
+        dict: Number of translations and clips written and the file size in bytes
+    """
+    translation_data, translation_count = _pack_section(
+        ((translation_key(source, target, text), translation.encode("utf-8"), created_at)
+         for source, target, text, translation, created_at in translations),
+        _HEADER.size,
+        _translation_hash,
+    )
+    clips_offset = _HEADER.size + len(translation_data)
+    clip_data, clip_count = _pack_section(
+        ((bytes.fromhex(key), data, created_at) for key, data, created_at in clips), clips_offset, _clip_hash)
+    header = _HEADER.pack(MAGIC, VERSION, translation_count, _HEADER.size, clip_count, clips_offset)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(translation_data)
+            f.write(clip_data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return {"translations": translation_count, "clips": clip_count, "bytes": os.path.getsize(path)}
+
+
+def export_snapshot(path: str, cache, audio_cache: Optional[AudioCache] = None,
+                    translations: int = 50000, clips: int = 500) -> dict:
+    """
+    Write the hottest entries of a translation cache (and audio cache) to a snapshot.
+
+    Args:
+        path (str): Snapshot file to create or replace
+        cache (TranslationCache): Source of translations, ranked by TranslationCache.hottest()
+        audio_cache (AudioCache): Source of TTS clips, most recently used first (None = no clips)
+        translations (int): Maximum number of translations
+        clips (int): Maximum number of TTS clips
+
+    Returns:
+        dict: Number of translations and clips written and the file size in bytes
+    """
+    clip_entries = []
+    if audio_cache is not None and clips > 0:
+        for key, clip_path, used_at in audio_cache.hottest(clips):
+            try:
+                with open(clip_path, "rb") as f:
+                    clip_entries.append((key, f.read(), used_at))
+            except OSError:
+                # Evicted since it was listed
+                continue
+    return write_snapshot(path, cache.hottest(translations), clip_entries)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export a warm-start snapshot of the translation and audio caches")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    export = subparsers.add_parser("export", help="Write the hottest cache entries to a snapshot file")
+    export.add_argument("output", help="Snapshot file to create or replace")
+    export.add_argument("--translations", type=int, default=50000, help="Maximum number of translations")
+    export.add_argument("--clips", type=int, default=500, help="Maximum number of TTS clips")
+    args = parser.parse_args(argv)
+
+    import utils
+    result = utils.export_snapshot(args.output, translations=args.translations, clips=args.clips)
+    print(f"✅ Wrote {result['translations']} translations and {result['clips']} clips "
+          f"({result['bytes']} bytes) -> {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""
+Template-aware translation for the Language Translation Tool.
+Registered i18n templates ("Hi {name}, your order {order} has shipped") are
+recognized in incoming text: the template is translated once and cached, and
+the interpolated values are filled into the translated template locally, so
+personalized messages cost one backend call per template rather than one per
+message. Uses and backend calls are counted per template, including the
+skeletons masking produces on its own ("Order ⟦0⟧ shipped").
+"""
+
+import re
+import threading
+from collections import namedtuple
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from masking import KIND_PLACEHOLDER, PassthroughMasker
+
+# {name}, {{ name }}, ${name}, {0} and %(name)s; group 1 or 2 is the name
+_NAMED_PLACEHOLDER = re.compile(r"\$?\{\{?\s*([\w.-]+)\s*\}?\}|%\((\w+)\)[-+#0]*\d*(?:\.\d+)?[sdifgxXr]")
+_ANY_PLACEHOLDER = PassthroughMasker([KIND_PLACEHOLDER])
+
+# A recognized template and the values interpolated into it, keyed by placeholder name
+TemplateMatch = namedtuple("TemplateMatch", ["template", "values"])
+
+
+def _placeholder_name(match) -> str:
+    return match.group(1) or match.group(2)
+
+
+def _parse(template: str) -> List[Tuple[str, Optional[str]]]:
+    """
+    Split a template into (literal text, placeholder name) pieces; the last
+    piece has no placeholder.
+
+    Raises:
+        ValueError: If the template has no placeholders or an unnamed one (%s, {})
+    """
+    _, placeholders = _ANY_PLACEHOLDER.mask(template)
+    unnamed = [placeholder for placeholder in placeholders if not _NAMED_PLACEHOLDER.fullmatch(placeholder)]
+    if unnamed or not placeholders:
+        raise ValueError(f"Template {template!r} needs named placeholders such as {{name}} "
+                         f"(unnamed ones cannot be told apart once reordered)")
+    pieces = []
+    position = 0
+    for match in _NAMED_PLACEHOLDER.finditer(template):
+        pieces.append((template[position:match.start()], _placeholder_name(match)))
+        position = match.end()
+    pieces.append((template[position:], None))
+    return pieces
+
+
+def fill_template(translation: str, values: Dict[str, str]) -> Optional[str]:
+    """
+    Put interpolated values into a translated template.
+
+    Returns:
+        str: The filled translation, or None if the backend lost a placeholder or
+            introduced an unknown one (the text should then be translated as is)
+    """
+    seen = set()
+
+    def replace(match):
+        name = _placeholder_name(match)
+        seen.add(name)
+        return values.get(name, match.group())
+
+    filled = _NAMED_PLACEHOLDER.sub(replace, translation)
+    return filled if seen == values.keys() else None
+
+
+class TemplateRegistry:
+    """Known templates, matched against incoming text, and per-template usage counters."""
+
+    def __init__(self, templates: Iterable[str] = (), max_tracked: int = 10000):
+        """
+        Args:
+            templates (iterable): Templates to recognize, e.g. "Hi {name}, welcome back"
+            max_tracked (int): Templates (registered or from masking) counted in the report;
+                templates first seen beyond this are not counted
+        """
+        self.max_tracked = max_tracked
+        self._templates: Dict[str, List[Tuple[str, Optional[str]]]] = {}
+        # (first word, last word) -> (pattern, branch group -> (template, placeholder groups))
+        self._index = None
+        # template -> [uses, backend calls]
+        self._stats: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+        self.register(templates)
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def register(self, templates: Union[str, Iterable[str]]) -> None:
+        """
+        Add one template or several.
+
+        Raises:
+            ValueError: If a template has no named placeholders
+        """
+        parsed = {}
+        for template in [templates] if isinstance(templates, str) else templates:
+            template = template.strip()
+            if template and template not in self._templates:
+                parsed[template] = _parse(template)
+        with self._lock:
+            self._templates.update(parsed)
+            # Rebuilt on the next match, so registering many templates compiles once
+            self._index = None
+
+    def _compile(self) -> Dict[Tuple[Optional[str], Optional[str]], tuple]:
+        """
+        Compile the templates into one anchored alternation per bucket. Templates are
+        bucketed by the first and last words of their literal text (None when a
+        placeholder touches that end), so a lookup only tries the few templates
+        that could match instead of the whole catalogue.
+        """
+        buckets: Dict[Tuple[Optional[str], Optional[str]], list] = {}
+        for i, (template, pieces) in enumerate(self._templates.items()):
+            parts = []
+            names: Dict[str, str] = {}
+            for literal, name in pieces:
+                parts.append(re.escape(literal))
+                if name is None:
+                    continue
+                if name in names:
+                    # A placeholder used twice must carry the same value both times
+                    parts.append(f"(?P={names[name]})")
+                else:
+                    names[name] = f"t{i}_{len(names)}"
+                    parts.append(f"(?P<{names[name]}>.+?)")
+            leading, trailing = pieces[0][0], pieces[-1][0]
+            anchors = (leading.split(" ", 1)[0] if " " in leading else None,
+                       trailing.rsplit(" ", 1)[1] or None if " " in trailing else None)
+            buckets.setdefault(anchors, []).append((f"(?P<t{i}>{''.join(parts)})", f"t{i}", template, names))
+        return {
+            anchors: (re.compile("|".join(branch for branch, _, _, _ in entries), re.DOTALL),
+                      {group: (template, names) for _, group, template, names in entries})
+            for anchors, entries in buckets.items()
+        }
+
+    def match(self, text: str) -> Optional[TemplateMatch]:
+        """
+        Return the registered template text is an instance of, or None. Templates
+        anchored on both ends are preferred, then registration order.
+        """
+        if not self._templates:
+            return None
+        index = self._index
+        if index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index = self._compile()
+                index = self._index
+        first = text[:text.find(" ")] if " " in text else None
+        last = text[text.rfind(" ") + 1:] or None if first is not None else None
+        for anchors in ((first, last), (first, None), (None, last), (None, None)):
+            bucket = index.get(anchors)
+            if bucket is None:
+                continue
+            pattern, branches = bucket
+            match = pattern.fullmatch(text)
+            if match is not None:
+                template, names = branches[match.lastgroup]
+                return TemplateMatch(template, {name: match.group(group) for name, group in names.items()})
+        return None
+
+    def record(self, template: str, hit: bool) -> None:
+        """Count one use of template, served from the cache (hit) or by a backend call."""
+        with self._lock:
+            counts = self._stats.get(template)
+            if counts is None:
+                if len(self._stats) >= self.max_tracked:
+                    return
+                counts = self._stats[template] = [0, 0]
+            counts[0] += 1
+            if not hit:
+                counts[1] += 1
+
+    def report(self, limit: Optional[int] = None) -> List[dict]:
+        """
+        Return per-template usage, most used first.
+
+        Returns:
+            list: Dicts with template, registered (False for skeletons found by masking),
+                uses, backend_calls, saved_calls and hit_rate
+        """
+        with self._lock:
+            stats = sorted(((template, uses, calls) for template, (uses, calls) in self._stats.items()),
+                           key=lambda row: -row[1])
+        return [
+            {
+                "template": template,
+                "registered": template in self._templates,
+                "uses": uses,
+                "backend_calls": calls,
+                "saved_calls": uses - calls,
+                "hit_rate": round((uses - calls) / uses, 4),
+            }
+            for template, uses, calls in stats[:limit]
+        ]
+
+    def reset_stats(self) -> None:
+        """Clear the usage counters."""
+        with self._lock:
+            self._stats.clear()
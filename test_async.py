@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test script for the async translation API.
+Tests translate_text_async with a stubbed backend (no network needed).
+"""
+
+import sys
+import os
+import asyncio
+import time
+
+# Add the current directory to the Python path to import utils
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import utils
+from utils import translate_text_async
+
+def test_async():
+    """Test concurrency, timeouts and cancellation of translate_text_async."""
+
+    print("⚡ Testing Async Translation")
+    print("=" * 50)
+
+    original_translate = utils._translate_miss
+    original_cache = utils._translation_cache
+    utils._translation_cache = utils.TranslationCache(path=None)
+
+    def slow_translate(source_lang, target_lang, text):
+        time.sleep(0.05)
+        return text.upper()
+
+    utils._translate_miss = slow_translate
+
+    passed_tests = 0
+    total_tests = 0
+
+    # Test 1: many concurrent calls overlap instead of running serially
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Concurrent requests")
+    async def run_many():
+        return await asyncio.gather(*(translate_text_async("en", "es", f"text {i}") for i in range(20)))
+    start = time.monotonic()
+    result = asyncio.run(run_many())
+    elapsed = time.monotonic() - start
+    if result[7] == "TEXT 7" and elapsed < 0.5:
+        print(f"   ✅ PASSED - 20 requests in {elapsed:.2f}s")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - 20 requests took {elapsed:.2f}s")
+
+    # Test 2: per-call timeout maps to the usual timeout error
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Per-call timeout")
+    try:
+        asyncio.run(translate_text_async("en", "es", "slow text", timeout=0.01))
+        print(f"   ❌ FAILED - Should have timed out")
+    except Exception as e:
+        if "timed out" in str(e):
+            print(f"   ✅ PASSED - {str(e)}")
+            passed_tests += 1
+        else:
+            print(f"   ❌ FAILED - Unexpected error: {str(e)}")
+
+    # Test 3: cancelling the task cancels the await
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Cancellation")
+    async def cancel_one():
+        task = asyncio.ensure_future(translate_text_async("en", "es", "cancel me"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            return True
+        return False
+    if asyncio.run(cancel_one()):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Task was not cancelled")
+
+    utils._translate_miss = original_translate
+    utils._translation_cache = original_cache
+
+    # Summary
+    print("\n" + "=" * 50)
+    print(f"📊 Test Summary: {passed_tests}/{total_tests} tests passed")
+
+    if passed_tests == total_tests:
+        print("🎉 All tests passed! Async translation is working correctly.")
+        return True
+    else:
+        print("⚠️  Some tests failed. Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = test_async()
+    sys.exit(0 if success else 1)
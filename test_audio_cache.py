@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test script for the content-addressed audio cache.
+Tests AudioCache and cached text_to_speech with the local TTS backend (no network needed).
+"""
+
+import sys
+import os
+import tempfile
+
+# Add the current directory to the Python path to import utils
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import utils
+import backends
+from backends import LocalTTSBackend
+from audio_cache import AudioCache
+from utils import text_to_speech, text_to_speech_bytes, text_to_speech_stream
+
+def test_audio_cache():
+    """Test audio cache hits, keys, eviction and statistics."""
+
+    print("🎧 Testing Audio Cache")
+    print("=" * 50)
+
+    tmp_dir = tempfile.mkdtemp()
+    original_backend = backends._active_tts
+    original_cache = utils._audio_cache
+    backend = backends.set_tts_backend(LocalTTSBackend())
+    utils.configure_audio_cache(directory=os.path.join(tmp_dir, "audio"))
+
+    passed_tests = 0
+    total_tests = 0
+
+    # Test 1: the second identical request makes no backend call
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Repeat request served from cache")
+    first = text_to_speech("Hola", "es", os.path.join(tmp_dir, "first.mp3"))
+    second = text_to_speech("  Hola ", "es", os.path.join(tmp_dir, "second.mp3"))
+    with open(first, "rb") as f1, open(second, "rb") as f2:
+        same_audio = f1.read() == f2.read()
+    if backend.calls == 1 and same_audio:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {backend.calls} backend requests")
+
+    # Test 2: language and speed are part of the key
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Key includes language and speed")
+    keys = {AudioCache.key("Hola", "es"), AudioCache.key("Hola", "pt"), AudioCache.key("Hola", "es", slow=True)}
+    if len(keys) == 3 and AudioCache.key("Hola  mundo", "es") == AudioCache.key("Hola mundo", "es"):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Keys: {keys}")
+
+    # Test 3: hit-rate statistics
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Hit-rate statistics")
+    stats = utils.get_audio_cache_stats()
+    if stats["hits"] == 1 and stats["misses"] == 1 and stats["entries"] == 1:
+        print(f"   ✅ PASSED - {stats}")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {stats}")
+
+    # Test 4: size-based eviction drops the oldest files
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Size-based eviction")
+    cache = AudioCache(directory=os.path.join(tmp_dir, "small"), max_bytes=1000)
+    for i in range(10):
+        cache.put_bytes(f"text {i}", "en", False, b"x" * 300)
+    cache.evict()
+    stats = cache.stats()
+    if stats["bytes"] <= 1000 and cache.get("text 9", "en") is not None:
+        print(f"   ✅ PASSED - {stats['entries']} files kept")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {stats}")
+
+    # Test 5: in-memory bytes and streaming share the cache
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: In-memory bytes and streaming")
+    backend.calls = 0
+    cached_bytes = text_to_speech_bytes("Hola", "es")
+    streamed = b"".join(text_to_speech_stream("Buenos dias", "es"))
+    streamed_again = b"".join(text_to_speech_stream("Buenos dias", "es"))
+    if cached_bytes == LocalTTSBackend().synthesize("Hola", "es") and streamed == streamed_again and backend.calls == 1:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {backend.calls} backend requests")
+
+    # Test 6: a miss written where a hit was hard-linked leaves the cached clip intact
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Hard-linked output overwritten by a miss")
+    utils.configure_audio_cache(directory=os.path.join(tmp_dir, "linked"), link=True)
+    shared = os.path.join(tmp_dir, "shared.mp3")
+    text_to_speech("Hello there", "en", shared)
+    text_to_speech("Hello there", "en", shared)
+    text_to_speech("Something else", "en", shared)
+    cached_path = utils._audio_cache.get("Hello there", "en")
+    with open(cached_path, "rb") as f:
+        cached = f.read()
+    with open(shared, "rb") as f:
+        written = f.read()
+    expected = LocalTTSBackend().synthesize("Hello there", "en")
+    if cached == expected and written == LocalTTSBackend().synthesize("Something else", "en"):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Cached clip for 'Hello there' was overwritten")
+
+    backends._active_tts = original_backend
+    utils._audio_cache = original_cache
+
+    # Summary
+    print("\n" + "=" * 50)
+    print(f"📊 Test Summary: {passed_tests}/{total_tests} tests passed")
+
+    if passed_tests == total_tests:
+        print("🎉 All tests passed! Audio cache is working correctly.")
+        return True
+    else:
+        print("⚠️  Some tests failed. Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = test_audio_cache()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test script for the batch translation functionality.
+Tests translate_many with the local backend so no network access is needed.
+"""
+
+import sys
+import os
+
+# Add the current directory to the Python path to import utils
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import utils
+import backends
+from backends import LocalTranslationBackend
+from utils import translate_many
+
+def test_batch():
+    """Test translate_many ordering, deduplication and request packing."""
+
+    print("📦 Testing Batch Translation")
+    print("=" * 50)
+
+    original_backend = backends._active_translation
+    original_cache = utils._translation_cache
+    backend = backends.set_translation_backend(LocalTranslationBackend(phrasebook={}))
+    utils._translation_cache = utils.TranslationCache(path=None)
+
+    passed_tests = 0
+    total_tests = 0
+
+    # Test 1: results come back in input order, duplicates included
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Ordering and deduplication")
+    texts = ["hello", "world", "hello", "  world ", ""]
+    result = translate_many("en", "es", texts)
+    expected = ["[es] hello", "[es] world", "[es] hello", "[es] world", ""]
+    if result == expected and backend.calls == 1:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {result}, {backend.calls} requests")
+
+    # Test 2: cache hits are served without a request
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Cache hits skip the backend")
+    backend.calls = 0
+    result = translate_many("en", "es", ["hello", "world"])
+    if result == ["[es] hello", "[es] world"] and backend.calls == 0:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {result}, {backend.calls} requests")
+
+    # Test 3: misses are packed under the character limit
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Request packing")
+    backend.calls = 0
+    texts = [f"item number {i} " + "x" * 80 for i in range(500)]
+    result = translate_many("en", "fr", texts)
+    total_chars = sum(len(text.strip()) + 1 for text in texts)
+    max_requests = total_chars // utils.MAX_REQUEST_CHARS + 1
+    if result[42] == "[fr] " + texts[42].strip() and backend.calls <= max_requests:
+        print(f"   ✅ PASSED - {len(texts)} texts in {backend.calls} requests")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {backend.calls} requests (expected at most {max_requests})")
+
+    backends._active_translation = original_backend
+    utils._translation_cache = original_cache
+
+    # Summary
+    print("\n" + "=" * 50)
+    print(f"📊 Test Summary: {passed_tests}/{total_tests} tests passed")
+
+    if passed_tests == total_tests:
+        print("🎉 All tests passed! Batch translation is working correctly.")
+        return True
+    else:
+        print("⚠️  Some tests failed. Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = test_batch()
+    sys.exit(0 if success else 1)
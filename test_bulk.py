@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Test script for bulk file translation.
+Tests translate_file and the CLI's batch mode with the local backend so no
+network access is needed.
+"""
+
+import sys
+import os
+import csv
+import json
+import tempfile
+
+# Add the current directory to the Python path to import bulk
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import utils
+import backends
+import cli_app
+from backends import LocalTranslationBackend
+from resilience import RetryPolicy
+from bulk import checkpoint_path, translate_file
+
+class CrashingBackend(LocalTranslationBackend):
+    """Local backend that fails once a number of requests has been made."""
+
+    def __init__(self, fail_after):
+        super().__init__(phrasebook={})
+        self.fail_after = fail_after
+
+    def translate(self, source_lang, target_lang, text):
+        if self.fail_after is not None and self.calls >= self.fail_after:
+            raise ConnectionError("backend went away")
+        return super().translate(source_lang, target_lang, text)
+
+class RejectingBackend(LocalTranslationBackend):
+    """Local backend that rejects texts longer than a limit, like Google's request size limit."""
+
+    def __init__(self, max_chars):
+        super().__init__(phrasebook={})
+        self.max_chars = max_chars
+
+    def translate(self, source_lang, target_lang, text):
+        if len(text) > self.max_chars:
+            raise ValueError(f"Text length need to be between 0 and {self.max_chars} characters")
+        return super().translate(source_lang, target_lang, text)
+
+class TooManyRequests(Exception):
+    """Stands in for deep_translator's throttling error (resilience matches it by name)."""
+
+class ThrottledBackend(LocalTranslationBackend):
+    """Local backend that is throttled for texts containing a marker."""
+
+    def translate(self, source_lang, target_lang, text):
+        if "throttled" in text:
+            raise TooManyRequests("Server Error: You made too many requests to the server")
+        return super().translate(source_lang, target_lang, text)
+
+def _label(i):
+    """Distinct letters-only label for record i (masking folds numbers into one cache entry)."""
+    return chr(97 + i // 676) + chr(97 + i // 26 % 26) + chr(97 + i % 26)
+
+def test_bulk():
+    """Test the txt/CSV/JSONL formats, ordering and checkpoint resume."""
+
+    print("📚 Testing Bulk File Translation")
+    print("=" * 50)
+
+    original_backend = backends._active_translation
+    original_cache = utils._translation_cache
+    original_resilience = utils._resilience
+    utils.configure_resilience()
+    backend = backends.set_translation_backend(LocalTranslationBackend(phrasebook={}))
+    utils._translation_cache = utils.TranslationCache(path=None)
+    tmp_dir = tempfile.mkdtemp()
+
+    passed_tests = 0
+    total_tests = 0
+
+    # Test 1: plain text, one translation per line in input order
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Plain text in order")
+    input_path = os.path.join(tmp_dir, "lines.txt")
+    output_path = os.path.join(tmp_dir, "lines.out.txt")
+    with open(input_path, "w") as f:
+        f.write("".join(f"line {i}\n" for i in range(300)))
+    result = translate_file("en", "es", input_path, output_path, workers=8)
+    with open(output_path) as f:
+        lines = f.read().splitlines()
+    if lines == [f"[es] line {i}" for i in range(300)] and result["records"] == 300:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {lines[:3]}..., {result}")
+
+    # Test 2: JSON Lines keep their fields and gain a translation
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: JSON Lines")
+    input_path = os.path.join(tmp_dir, "data.jsonl")
+    output_path = os.path.join(tmp_dir, "out.jsonl")
+    with open(input_path, "w") as f:
+        for i in range(20):
+            f.write(json.dumps({"id": i, "text": f"row {i}"}) + "\n")
+    translate_file("en", "fr", input_path, output_path, workers=4)
+    with open(output_path) as f:
+        records = [json.loads(line) for line in f]
+    if records[7] == {"id": 7, "text": "row 7", "translation": "[fr] row 7"} and len(records) == 20:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {records[7]}")
+
+    # Test 3: CSV through the command line
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: CSV through cli_app arguments")
+    input_path = os.path.join(tmp_dir, "data.csv")
+    output_path = os.path.join(tmp_dir, "out.csv")
+    with open(input_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["sku", "description"])
+        writer.writerows([[f"A{i}", f"blue shirt, size {i}"] for i in range(10)])
+    code = cli_app.main(["--from", "en", "--to", "de", "--input", input_path, "--output", output_path,
+                         "--field", "description", "--workers", "4"])
+    with open(output_path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    if code == 0 and rows[3] == {"sku": "A3", "description": "blue shirt, size 3",
+                                 "translation": "[de] blue shirt, size 3"}:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Exit code {code}, got {rows[3] if rows else rows}")
+
+    # Test 4: a crashed job resumes from its checkpoint without repeating requests
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Resume after a crash")
+    input_path = os.path.join(tmp_dir, "big.txt")
+    output_path = os.path.join(tmp_dir, "big.out.txt")
+    with open(input_path, "w") as f:
+        f.write("".join(f"sentence {_label(i)}\n" for i in range(1000)))
+    crashing = backends.set_translation_backend(CrashingBackend(fail_after=450))
+    utils._translation_cache = utils.TranslationCache(path=None)
+    try:
+        translate_file("en", "it", input_path, output_path, workers=4, checkpoint_every=100)
+        crashed = False
+    except Exception:
+        crashed = True
+    with open(checkpoint_path(output_path)) as f:
+        done = json.load(f)["records"]
+    # A fresh process: empty cache, closed circuits, working backend
+    crashing.fail_after = None
+    crashing.calls = 0
+    utils._translation_cache = utils.TranslationCache(path=None)
+    utils.configure_resilience()
+    result = translate_file("en", "it", input_path, output_path, workers=4, checkpoint_every=100)
+    with open(output_path) as f:
+        lines = f.read().splitlines()
+    if (crashed and done == 400 and result["resumed"] == 400 and crashing.calls == 600
+            and lines == [f"[it] sentence {_label(i)}" for i in range(1000)]
+            and not os.path.exists(checkpoint_path(output_path))):
+        print(f"   ✅ PASSED - Resumed at record {done}")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - crashed={crashed}, checkpoint at {done}, {crashing.calls} requests on resume, "
+              f"{len(lines)} lines")
+
+    # Test 5: bad records are marked and skipped, the rest of the job goes on
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Failed records do not stop the job")
+    input_path = os.path.join(tmp_dir, "mixed.jsonl")
+    output_path = os.path.join(tmp_dir, "mixed.out.jsonl")
+    with open(input_path, "w") as f:
+        f.write(json.dumps({"text": "first row"}) + "\n")
+        f.write(json.dumps({"text": "x" * 80}) + "\n")
+        f.write("[1, 2, 3]\n")
+        f.write("{not json\n")
+        f.write(json.dumps({"text": 42}) + "\n")
+        f.write(json.dumps({"text": "last row"}) + "\n")
+    backends.set_translation_backend(RejectingBackend(max_chars=50))
+    utils._translation_cache = utils.TranslationCache(path=None)
+    try:
+        result = translate_file("en", "es", input_path, output_path, workers=2)
+        with open(output_path) as f:
+            records = [json.loads(line) for line in f]
+    except Exception as e:
+        result, records = str(e), []
+    if (len(records) == 6 and records[0]["translation"] == "[es] first row"
+            and records[5]["translation"] == "[es] last row"
+            and all(record["translation"] == "" and record["error"] for record in records[1:5])
+            and records[2]["line"] == "[1, 2, 3]"
+            and result["records"] == 6 and result["failed"] == 4
+            and not os.path.exists(checkpoint_path(output_path))):
+        print(f"   ✅ PASSED - {result['failed']} records marked as failed")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {result}, {records}")
+
+    # Test 6: --to all is only accepted for --text
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: File mode rejects --to all")
+    try:
+        cli_app.parse_args(["--from", "en", "--to", "all", "--input", input_path, "--output", output_path])
+        rejected = False
+    except SystemExit:
+        rejected = True
+    if rejected:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - --to all was accepted for a file")
+
+    # Test 7: throttling stops the job and keeps its checkpoint instead of failing records
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Throttling is not a record failure")
+    input_path = os.path.join(tmp_dir, "throttled.txt")
+    output_path = os.path.join(tmp_dir, "throttled.out.txt")
+    with open(input_path, "w") as f:
+        f.write("".join(f"fine {_label(i)}\n" for i in range(10)) + "throttled here\n")
+    backends.set_translation_backend(ThrottledBackend(phrasebook={}))
+    utils._translation_cache = utils.TranslationCache(path=None)
+    utils.configure_resilience(retry=RetryPolicy(attempts=2, base_delay=0.001))
+    try:
+        result = translate_file("en", "es", input_path, output_path, workers=2, checkpoint_every=5)
+    except Exception as e:
+        result = e
+    if isinstance(result, Exception) and os.path.exists(checkpoint_path(output_path)):
+        print(f"   ✅ PASSED - {result}")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {result}, checkpoint kept: {os.path.exists(checkpoint_path(output_path))}")
+    utils.configure_resilience()
+
+    # Test 8: checkpoints need a positive interval
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Rejecting --checkpoint-every 0")
+    try:
+        translate_file("en", "es", input_path, os.path.join(tmp_dir, "zero.out.txt"), checkpoint_every=0)
+        rejected_call = False
+    except ValueError:
+        rejected_call = True
+    try:
+        cli_app.parse_args(["--from", "en", "--to", "es", "--input", input_path, "--output", output_path,
+                            "--checkpoint-every", "0"])
+        rejected_cli = False
+    except SystemExit:
+        rejected_cli = True
+    if rejected_call and rejected_cli:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - translate_file rejected: {rejected_call}, CLI rejected: {rejected_cli}")
+
+    backends._active_translation = original_backend
+    utils._translation_cache = original_cache
+    utils._resilience = original_resilience
+
+    # Summary
+    print("\n" + "=" * 50)
+    print(f"📊 Test Summary: {passed_tests}/{total_tests} tests passed")
+
+    if passed_tests == total_tests:
+        print("🎉 All tests passed! Bulk translation is working correctly.")
+        return True
+    else:
+        print("⚠️  Some tests failed. Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = test_bulk()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test script for the persistent translation cache.
+Tests the TranslationCache class without any network access.
+"""
+
+import sys
+import os
+import tempfile
+import time
+
+# Add the current directory to the Python path to import cache
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from cache import TranslationCache
+
+def test_cache():
+    """Test the TranslationCache class with both tiers."""
+
+    print("🗄️  Testing Translation Cache")
+    print("=" * 50)
+
+    passed_tests = 0
+    total_tests = 0
+    tmp_dir = tempfile.mkdtemp()
+    db_path = os.path.join(tmp_dir, "cache.sqlite3")
+
+    # Test 1: miss, then hit from the memory tier
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Miss then memory hit")
+    cache = TranslationCache(path=db_path)
+    first = cache.get("en", "es", "Hello")
+    cache.set("en", "es", "Hello", "Hola")
+    second = cache.get("en", "es", "Hello")
+    if first is None and second == "Hola" and cache.stats()["memory_hits"] == 1:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {first!r}, {second!r}")
+    cache.close()
+
+    # Test 2: a new instance (fresh process) reads from disk
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Persistence across instances")
+    cache = TranslationCache(path=db_path)
+    result = cache.get("en", "es", "Hello")
+    stats = cache.stats()
+    if result == "Hola" and stats["hits"] == 1 and stats["memory_hits"] == 0:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {result!r}, stats {stats}")
+    cache.close()
+
+    # Test 3: TTL expiry
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: TTL expiry")
+    cache = TranslationCache(path=db_path, ttl=0.05)
+    cache.set("en", "fr", "Hello", "Bonjour")
+    time.sleep(0.1)
+    result = cache.get("en", "fr", "Hello")
+    if result is None:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Expired entry returned: {result!r}")
+    cache.close()
+
+    # Test 4: size-based eviction keeps the most recently used rows
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Size-based eviction")
+    cache = TranslationCache(path=os.path.join(tmp_dir, "small.sqlite3"), max_entries=5)
+    for i in range(20):
+        cache.set("en", "de", f"text {i}", f"Text {i}")
+    cache.evict()
+    disk_entries = cache.stats()["disk_entries"]
+    if disk_entries == 5:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Expected 5 rows on disk, found {disk_entries}")
+    cache.close()
+
+    # Test 5: memory-only mode
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Memory-only cache")
+    cache = TranslationCache(path=None, memory_size=2)
+    cache.set("en", "it", "a", "A")
+    cache.set("en", "it", "b", "B")
+    cache.set("en", "it", "c", "C")
+    if cache.get("en", "it", "a") is None and cache.get("en", "it", "c") == "C":
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - LRU order not respected")
+
+    # Summary
+    print("\n" + "=" * 50)
+    print(f"📊 Test Summary: {passed_tests}/{total_tests} tests passed")
+
+    if passed_tests == total_tests:
+        print("🎉 All tests passed! Translation cache is working correctly.")
+        return True
+    else:
+        print("⚠️  Some tests failed. Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = test_cache()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Test script for the compact cache tier.
+Tests hashed lookups, the UTF-8 arena, CLOCK eviction, memory use and the
+compact memory tier of the translation cache (no network needed).
+"""
+
+import sys
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from functools import lru_cache
+
+# Add the current directory to the Python path to import utils
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import utils
+from cache import TranslationCache
+from compact_cache import CompactCache
+
+def _held_bytes(fill) -> int:
+    """Bytes still allocated after running fill()."""
+    tracemalloc.start()
+    fill()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return held
+
+def test_compact_cache():
+    """Test the compact cache on its own and as the translation cache's memory tier."""
+
+    print("🗜️  Testing Compact Cache")
+    print("=" * 50)
+
+    passed_tests = 0
+    total_tests = 0
+
+    # Test 1: entries round-trip, including non-ASCII text, "\0" and overwrites
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Round trip")
+    cache = CompactCache(10)
+    cache.set(("en", "ja", "Thank you"), ("ありがとう", 1.0))
+    cache.set(("en", "es", "a\0b"), ("x", 2.0))
+    cache.set(("en", "es", "Hello"), ("Hola, muy buenos días a todos", 3.0))
+    cache.set(("en", "es", "Hello"), ("Hola", 4.0))
+    results = [cache.get(("en", "ja", "Thank you")), cache.get(("en", "es", "a\0b")), cache.get(("en", "es", "Hello")),
+               cache.get(("en", "fr", "Hello"))]
+    if (results == [("ありがとう", 1.0), ("x", 2.0), ("Hola", 4.0), None] and len(cache) == 3
+            and sorted(key for key, _ in cache.items())[0] == ("en", "es", "Hello")
+            and ("en", "es", "a\0b") in dict(cache.items())):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {results}, {len(cache)} entries")
+
+    # Test 2: CLOCK gives entries used since the hand last passed a second chance
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: CLOCK eviction")
+    cache = CompactCache(4)
+    for i in range(4):
+        cache.set(("en", "es", f"t{i}"), (f"v{i}", 0.0))
+    cache.get(("en", "es", "t0"))
+    cache.get(("en", "es", "t2"))
+    cache.set(("en", "es", "t4"), ("v4", 0.0))
+    cache.set(("en", "es", "t5"), ("v5", 0.0))
+    kept = sorted(key[2] for key, _ in cache.items())
+    if kept == ["t0", "t2", "t4", "t5"] and len(cache) == 4:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Kept {kept}")
+
+    # Test 3: random sets and gets agree with a dict, through evictions and table shifts
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Consistency under churn")
+    rng = random.Random(3)
+    cache = CompactCache(500)
+    expected = {}
+    wrong = 0
+    for i in range(50000):
+        key = ("en", "de", f"text {rng.randrange(2000)}" + "!" * rng.randrange(4))
+        if rng.random() < 0.5:
+            entry = ("ü" * rng.randrange(30) + key[2], float(i))
+            cache.set(key, entry)
+            expected[key] = entry
+        else:
+            found = cache.get(key)
+            wrong += found is not None and found != expected[key]
+    stored = dict(cache.items())
+    if (wrong == 0 and len(cache) == len(stored) == 500
+            and all(cache.get(key) == entry == expected[key] for key, entry in stored.items())):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {wrong} wrong values, {len(cache)} entries")
+
+    # Test 4: overwritten arena bytes are reclaimed
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Arena compaction")
+    cache = CompactCache(100)
+    for round_ in range(50):
+        for i in range(100):
+            cache.set(("en", "es", f"t{i}"), ("x" * (20000 + round_ * 100), float(round_)))
+    live = sum(len("\0".join(key).encode()) + len(value) for key, (value, _) in cache.items())
+    if (cache.memory_bytes() < 2 * live + (1 << 20) + 10000
+            and all(cache.get(("en", "es", f"t{i}")) == ("x" * 24900, 49.0) for i in range(100))):
+        print(f"   ✅ PASSED - {cache.memory_bytes()} bytes for {live} live")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {cache.memory_bytes()} bytes for {live} live")
+
+    # Test 5: well under the memory of functools.lru_cache for the same entries
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Memory against lru_cache (100k entries)")
+    text = lambda i: f"Please confirm the delivery address for order {i}"
+
+    @lru_cache(maxsize=None)
+    def translate(source_lang, target_lang, text):
+        return "[es] " + text
+
+    baseline = _held_bytes(lambda: [translate("en", "es", text(i)) for i in range(100000)] and None)
+    translate.cache_clear()
+    cache = CompactCache(100000)
+    compact = _held_bytes(lambda: [cache.set(("en", "es", text(i)), ("[es] " + text(i), 0.0))
+                                   for i in range(100000)] and None)
+    if compact * 3 < baseline * 2 and cache.get(("en", "es", text(123))) == ("[es] " + text(123), 0.0):
+        print(f"   ✅ PASSED - {compact / 1e5:.0f} vs {baseline / 1e5:.0f} bytes per entry")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {compact / 1e5:.0f} vs {baseline / 1e5:.0f} bytes per entry")
+
+    # Test 6: the translation cache works the same with a compact memory tier
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Compact memory tier of the translation cache")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = TranslationCache(path=os.path.join(tmp_dir, "cache.sqlite3"), memory_size=2, ttl=60, compact=True)
+        for i in range(3):
+            cache.set("en", "es", f"text {i}", f"texto {i}")
+        memory_hit = cache.get("en", "es", "text 2")
+        disk_hit = cache.get("en", "es", "text 0")
+        cache._memory.set(("en", "es", "old"), ("viejo", time.time() - 3600))
+        expired = cache.get("en", "es", "old")
+        stale = cache.get("en", "es", "old", allow_stale=True)
+        hottest = [row[2] for row in cache.hottest(10)]
+        stats = cache.stats()
+        cache.close()
+    if (memory_hit == "texto 2" and disk_hit == "texto 0" and expired is None and stale == "viejo"
+            and stats["memory_hits"] == 1 and stats["memory_entries"] == 2
+            and sorted(hottest) == ["text 0", "text 1", "text 2"]):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {memory_hit!r}, {disk_hit!r}, {expired!r}, {stale!r}, {hottest}, stats {stats}")
+
+    # Test 7: TRANSLATOR_CACHE_COMPACT selects the compact tier
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Enabling from the environment")
+    saved = {name: os.environ.get(name) for name in ("TRANSLATOR_CACHE_COMPACT", "TRANSLATOR_CACHE_PATH")}
+    os.environ.update(TRANSLATOR_CACHE_COMPACT="1", TRANSLATOR_CACHE_PATH="")
+    try:
+        cache = utils._cache_from_env()
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+    if cache.compact and isinstance(cache._memory, CompactCache) and not utils._cache_from_env().compact:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {type(cache._memory).__name__}")
+
+    # Summary
+    print("\n" + "=" * 50)
+    print(f"📊 Test Summary: {passed_tests}/{total_tests} tests passed")
+
+    if passed_tests == total_tests:
+        print("🎉 All tests passed! The compact cache is working correctly.")
+        return True
+    else:
+        print("⚠️  Some tests failed. Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = test_compact_cache()
+    sys.exit(0 if success else 1)
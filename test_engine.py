@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test script for the concurrent translation engine.
+Tests TranslationEngine and RateLimiter with a stub backend (no network needed).
+"""
+
+import sys
+import os
+import threading
+import time
+
+# Add the current directory to the Python path to import engine
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import utils
+import engine as engine_module
+from engine import RateLimiter, TranslationEngine, get_engine
+
+def test_engine():
+    """Test ordering, parallelism and rate limiting of the engine."""
+
+    print("⚙️  Testing Translation Engine")
+    print("=" * 50)
+
+    original_cache = utils._translation_cache
+    utils._translation_cache = utils.TranslationCache(path=None)
+
+    passed_tests = 0
+    total_tests = 0
+    in_flight = [0, 0]  # current, peak
+    lock = threading.Lock()
+
+    def stub_translate(source_lang, target_lang, text):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        return text.upper()
+
+    # Test 1: results arrive in input order while running in parallel
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Ordered results with parallel workers")
+    texts = [f"text {i}" for i in range(50)]
+    with TranslationEngine(max_workers=8, translate_func=stub_translate) as engine:
+        result = engine.translate("en", "es", texts)
+    if result == [text.upper() for text in texts] and in_flight[1] > 1:
+        print(f"   ✅ PASSED - Peak concurrency: {in_flight[1]}")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Peak concurrency {in_flight[1]}, ordered: {result == [t.upper() for t in texts]}")
+
+    # Test 2: the token bucket caps the request rate
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Token-bucket rate limiting")
+    limiter = RateLimiter(rate=50, burst=1)
+    start = time.monotonic()
+    for _ in range(11):
+        limiter.acquire()
+    elapsed = time.monotonic() - start
+    if elapsed >= 0.18:
+        print(f"   ✅ PASSED - 11 requests took {elapsed:.2f}s")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - 11 requests at 50/s took only {elapsed:.2f}s")
+
+    # Test 3: backend errors are mapped like translate_text does
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Error mapping")
+    def failing_translate(source_lang, target_lang, text):
+        raise RuntimeError("connection reset")
+    try:
+        with TranslationEngine(max_workers=2, translate_func=failing_translate) as engine:
+            engine.translate("en", "es", ["boom"])
+        print(f"   ❌ FAILED - Should have raised an exception")
+    except Exception as e:
+        if str(e).startswith("Network connection error"):
+            print(f"   ✅ PASSED - {str(e)}")
+            passed_tests += 1
+        else:
+            print(f"   ❌ FAILED - Unexpected error: {str(e)}")
+
+    # Test 4: the shared engine refuses settings it was not created with
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Shared engine settings")
+    original_engine = engine_module._default_engine
+    engine_module._default_engine = None
+    try:
+        shared = get_engine(max_workers=3, rate_limit=100)
+        same = [get_engine(), get_engine(max_workers=3), get_engine(rate_limit=100)]
+        conflicts = 0
+        for kwargs in ({"max_workers": 16}, {"rate_limit": 5}):
+            try:
+                get_engine(**kwargs)
+            except ValueError:
+                conflicts += 1
+        if all(engine is shared for engine in same) and conflicts == 2 and shared.max_workers == 3:
+            print(f"   ✅ PASSED")
+            passed_tests += 1
+        else:
+            print(f"   ❌ FAILED - {conflicts} of 2 conflicting calls rejected")
+    finally:
+        if engine_module._default_engine is not None:
+            engine_module._default_engine.shutdown()
+        engine_module._default_engine = original_engine
+
+    utils._translation_cache = original_cache
+
+    # Summary
+    print("\n" + "=" * 50)
+    print(f"📊 Test Summary: {passed_tests}/{total_tests} tests passed")
+
+    if passed_tests == total_tests:
+        print("🎉 All tests passed! Translation engine is working correctly.")
+        return True
+    else:
+        print("⚠️  Some tests failed. Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = test_engine()
+    sys.exit(0 if success else 1)
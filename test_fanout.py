@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test script for multi-target translation.
+Tests translate_fanout and the CLI's --text mode with the local backend so no
+network access is needed.
+"""
+
+import sys
+import os
+import io
+import json
+import time
+from contextlib import redirect_stdout
+
+# Add the current directory to the Python path to import utils
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import utils
+import backends
+import cli_app
+from backends import LocalTranslationBackend
+from languages import LANGUAGE_CODES
+from utils import translate_fanout
+
+def test_fanout():
+    """Test that fan-out translates concurrently, reuses the cache and keys results by language."""
+
+    print("🌐 Testing Multi-Target Translation")
+    print("=" * 50)
+
+    original_backend = backends._active_translation
+    original_cache = utils._translation_cache
+    backend = backends.set_translation_backend(LocalTranslationBackend(latency=0.05))
+    utils._translation_cache = utils.TranslationCache(path=None)
+
+    passed_tests = 0
+    total_tests = 0
+    targets = [code for code in LANGUAGE_CODES if code != "en"]
+
+    # Test 1: every language at once, concurrently
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: All languages concurrently")
+    start = time.perf_counter()
+    result = translate_fanout("en", targets, "Hello")
+    elapsed = time.perf_counter() - start
+    sequential = backend.latency * len(targets)
+    if (list(result) == targets and result["es"] == "Hola" and result["fi"] == "[fi] Hello"
+            and elapsed < sequential / 2):
+        print(f"   ✅ PASSED - {len(targets)} languages in {elapsed:.2f}s ({sequential:.2f}s sequentially)")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {result} in {elapsed:.2f}s")
+
+    # Test 2: cached targets skip the backend, the source language is returned as is
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Cache hits and source language")
+    backend.calls = 0
+    result = translate_fanout("en", ["es", "en", "fr"], "  Hello ")
+    if result == {"es": "Hola", "en": "Hello", "fr": "Bonjour"} and backend.calls == 0:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {result}, {backend.calls} requests")
+
+    # Test 3: empty text is rejected like translate_text
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Empty text")
+    try:
+        translate_fanout("en", ["es"], "   ")
+        print(f"   ❌ FAILED - Should have raised ValueError")
+    except ValueError:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+
+    # Test 4: the CLI prints a JSON object keyed by language code
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: CLI --text mode")
+    output = io.StringIO()
+    with redirect_stdout(output):
+        code = cli_app.main(["--from", "en", "--to", "de,es", "--text", "Hello"])
+    if code == 0 and json.loads(output.getvalue()) == {"de": "Hallo", "es": "Hola"}:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Exit code {code}, output {output.getvalue()!r}")
+
+    backends._active_translation = original_backend
+    utils._translation_cache = original_cache
+
+    # Summary
+    print("\n" + "=" * 50)
+    print(f"📊 Test Summary: {passed_tests}/{total_tests} tests passed")
+
+    if passed_tests == total_tests:
+        print("🎉 All tests passed! Multi-target translation is working correctly.")
+        return True
+    else:
+        print("⚠️  Some tests failed. Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = test_fanout()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Test script for fuzzy translation-memory matches.
+Tests the n-gram index and the translation memory's fuzzy mode without any
+network access.
+"""
+
+import sys
+import os
+import random
+import tempfile
+import threading
+
+# Add the current directory to the Python path to import fuzzy_index
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import utils
+import backends
+from backends import LocalTranslationBackend
+from fuzzy_index import FuzzyIndex, bounded_edit_distance, similarity
+from translation_memory import TranslationMemory
+
+def test_fuzzy_index():
+    """Test fuzzy lookups against a brute-force scan and through the translation memory."""
+
+    print("🔎 Testing Fuzzy Matching")
+    print("=" * 50)
+
+    passed_tests = 0
+    total_tests = 0
+
+    # Test 1: banded edit distance agrees with the full distance
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Bounded edit distance")
+    cases = [("kitten", "sitting", 3), ("flaw", "lawn", 2), ("shipped", "shiped", 1)]
+    results = [(bounded_edit_distance(a, b, 5), bounded_edit_distance(a, b, expected - 1)) for a, b, expected in cases]
+    if results == [(expected, None) for _, _, expected in cases]:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {results}")
+
+    # Test 2: the index finds exactly what a full scan finds
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Index matches a brute-force scan")
+    rng = random.Random(3)
+    words = ["order", "shipped", "your", "the", "invoice", "payment", "received", "today", "account", "thanks"]
+    sources = list(dict.fromkeys(" ".join(rng.choice(words) for _ in range(rng.randint(4, 9))) for _ in range(2000)))
+    index = FuzzyIndex()
+    for i, source in enumerate(sources):
+        index.add(source, i)
+    mismatches = 0
+    for source in rng.sample(sources, 50):
+        position = rng.randrange(len(source))
+        query = source[:position] + "#" + source[position + 1:]
+        # A generous edit budget, so the reference does not share the index's rounding
+        distances = [(bounded_edit_distance(query, s, max(len(s), len(query)) // 5), s) for s in sources]
+        expected = max((similarity(query, s) for d, s in distances if d is not None), default=0)
+        found = index.search(query, threshold=0.9)
+        if expected >= 0.9 - 1e-9 and (not found or abs(found[0][2] - expected) > 1e-9):
+            mismatches += 1
+        if expected < 0.9 - 1e-9 and found:
+            mismatches += 1
+    if mismatches == 0:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {mismatches} lookups disagree with the full scan")
+
+    # Test 3: matches exactly at the threshold are returned
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Matches exactly at the threshold")
+    missed = []
+    for length in (10, 20, 30, 40):
+        for threshold in (0.9, 0.8):
+            stored = "abcdefghij" * (length // 10)
+            edits = round((1 - threshold) * length)
+            query = stored[:length - edits] + "X" * edits
+            boundary = FuzzyIndex()
+            boundary.add(stored, length)
+            found = boundary.search(query, threshold=threshold)
+            if not found or abs(found[0][2] - threshold) > 1e-9:
+                missed.append((length, threshold))
+    if not missed:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Missed (length, threshold) {missed}")
+
+    # Test 4: dissimilar text is not matched
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: No match below the threshold")
+    if index.search("completely unrelated sentence", threshold=0.95) == []:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Unexpected match")
+
+    # Test 5: the translation memory serves near-matches without a backend call
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Fuzzy translation-memory hit")
+    calls = []
+    def translate_segments(source_lang, target_lang, segments):
+        calls.append(list(segments))
+        return [f"[es] {segment}" for segment in segments]
+    memory = TranslationMemory(fuzzy_threshold=0.95)
+    memory.translate("en", "es", "Your order has been shipped to the billing address.", translate_segments)
+    result = memory.translate("en", "es", "Your order has been shipped to the billing adress.", translate_segments)
+    match = memory.recent_fuzzy_matches[-1] if memory.recent_fuzzy_matches else None
+    if (len(calls) == 1 and result == "[es] Your order has been shipped to the billing address."
+            and match is not None and match.score >= 0.95 and memory.stats()["segments_fuzzy"] == 1):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {result!r} after {len(calls)} backend calls")
+
+    # Test 6: the on-disk memory builds its index from stored rows
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Fuzzy lookup on a reopened memory")
+    path = os.path.join(tempfile.mkdtemp(), "tm.sqlite3")
+    memory = TranslationMemory(path=path)
+    memory.put_many("en", "fr", [("Thank you for your payment today.", "Merci pour votre paiement aujourd'hui.")])
+    memory.close()
+    memory = TranslationMemory(path=path, fuzzy_threshold=0.9)
+    match = memory.find_fuzzy("en", "fr", "Thank you for your payment today!")
+    other_pair = memory.find_fuzzy("en", "de", "Thank you for your payment today!")
+    if match is not None and match.translation.startswith("Merci") and other_pair is None:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {match!r}, {other_pair!r}")
+    memory.close()
+
+    # Test 7: the index is built when the memory opens and stays current under concurrent stores
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Index built at open, kept current")
+    memory = TranslationMemory(path=path, fuzzy_threshold=0.9)
+    built = len(memory._indexes.get("en-fr", ()))
+    writers = [threading.Thread(target=memory.put_many, args=("en", "fr", [(f"Your parcel {name} is on its way.", name)]))
+               for name in ("Alpha", "Bravo", "Delta", "Hotel")]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+    found = [memory.find_fuzzy("en", "fr", f"Your parcel {name} is on its way!") for name in ("Alpha", "Bravo", "Delta", "Hotel")]
+    if built == 1 and [match.translation if match else None for match in found] == ["Alpha", "Bravo", "Delta", "Hotel"]:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {built} segments indexed at open, found {found}")
+    memory.close()
+
+    # Test 8: near-matches served by the memory are not cached as exact translations
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Fuzzy results stay out of the translation cache")
+    saved = (backends._active_translation, utils._translation_cache, utils._translation_memory)
+    backends.set_translation_backend(LocalTranslationBackend(phrasebook={}))
+    utils._translation_cache = utils.TranslationCache(path=None)
+    utils.configure_translation_memory(fuzzy_threshold=0.95)
+    try:
+        original = "Your order has been shipped to the billing address."
+        near = "Your order has been shipped to the billing adress."
+        utils.translate_text("en", "es", original)
+        served = utils.translate_text("en", "es", near)
+        batch = utils.translate_many("en", "es", [near.replace("billing", "biling")])
+        cached = [utils._translation_cache.get("en", "es", text) for text in (original, near, near.replace("billing", "biling"))]
+    finally:
+        utils._translation_memory.close()
+        backends._active_translation, utils._translation_cache, utils._translation_memory = saved
+    if served == f"[es] {original}" and batch == [f"[es] {original}"] and cached == [f"[es] {original}", None, None]:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Served {served!r}, {batch}, cache holds {cached}")
+
+    # Summary
+    print("\n" + "=" * 50)
+    print(f"📊 Test Summary: {passed_tests}/{total_tests} tests passed")
+
+    if passed_tests == total_tests:
+        print("🎉 All tests passed! Fuzzy matching is working correctly.")
+        return True
+    else:
+        print("⚠️  Some tests failed. Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = test_fuzzy_index()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Test script for offline language detection.
+Tests the detector on every supported language, the "auto" source mode and
+skipped no-op translations with the local backend (no network needed).
+"""
+
+import sys
+import os
+import time
+
+# Add the current directory to the Python path to import utils
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import utils
+import backends
+from backends import LocalTranslationBackend
+from language_detection import LanguageDetector, detect_language
+from languages import LANGUAGE_CODES
+
+# Sentences that are not part of the detector's samples
+SENTENCES = {
+    "en": "Please enter your password to continue",
+    "es": "No entiendo lo que quieres decir",
+    "fr": "Je ne sais pas ce que tu veux dire",
+    "de": "Ich habe leider keine Zeit für so etwas",
+    "it": "Non ho capito cosa vuoi dire",
+    "pt": "Não sei o que você quer dizer",
+    "ru": "Я не знаю, что ты имеешь в виду",
+    "ja": "何を言っているのかわかりません",
+    "ko": "무슨 뜻인지 모르겠어요",
+    "zh": "我不知道你是什么意思",
+    "ar": "لا أعرف ماذا تقصد",
+    "hi": "मुझे नहीं पता कि आपका क्या मतलब है",
+    "nl": "Ik begrijp niet wat je bedoelt",
+    "sv": "Jag förstår inte vad du menar",
+    "no": "Jeg forstår ikke hva du mener",
+    "da": "Jeg forstår ikke, hvad du mener",
+    "fi": "En ymmärrä mitä tarkoitat",
+    "pl": "Nie rozumiem, co masz na myśli",
+    "tr": "Ne demek istediğini anlamıyorum",
+    "el": "Δεν καταλαβαίνω τι εννοείς",
+}
+
+def test_language_detection():
+    """Test detection accuracy and speed, auto mode and skipped no-op translations."""
+
+    print("🔍 Testing Language Detection")
+    print("=" * 50)
+
+    original_backend = backends._active_translation
+    original_cache = utils._translation_cache
+    backend = backends.set_translation_backend(LocalTranslationBackend(phrasebook={}))
+    utils._translation_cache = utils.TranslationCache(path=None)
+
+    passed_tests = 0
+    total_tests = 0
+
+    # Test 1: every supported language is recognized
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: All supported languages")
+    wrong = {lang: detect_language(text) for lang, text in SENTENCES.items()
+             if detect_language(text).language != lang}
+    if set(SENTENCES) == set(LANGUAGE_CODES) and not wrong:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Misdetected: {wrong}")
+
+    # Test 2: detection takes microseconds, even without the memo
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Detection speed")
+    detector = LanguageDetector()
+    texts = list(SENTENCES.values()) * 50
+    start = time.perf_counter()
+    for text in texts:
+        detector.detect(text)
+    per_text = (time.perf_counter() - start) / len(texts)
+    if per_text < 0.001:
+        print(f"   ✅ PASSED - {per_text * 1e6:.0f}µs per text")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {per_text * 1e6:.0f}µs per text")
+
+    # Test 3: numbers, URLs and punctuation never reach the backend
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Texts without language")
+    inputs = ["12,345.67", "https://example.com/orders?id=42", "support@example.com", "!!! ... ???", "+1 (555) 010-9999"]
+    results = [utils.translate_text("en", "es", text) for text in inputs]
+    if results == inputs and backend.calls == 0 and all(detect_language(text) is None for text in inputs):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {results}, {backend.calls} backend calls")
+
+    # Test 4: "auto" text already in the target language is returned as is
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Text already in the target language")
+    spanish = "Me gustaría reservar una mesa para dos personas"
+    skipped = utils.translate_text("auto", "es", spanish)
+    short = utils.translate_text("auto", "es", "Hola amigo")
+    if skipped == spanish and short == "[es] Hola amigo" and backend.calls == 1:
+        print(f"   ✅ PASSED - Short texts still go to the backend")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {skipped!r} and {short!r}, {backend.calls} backend calls")
+
+    # Test 5: "auto" detects the source and caches under it
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Auto source language")
+    backend.calls = 0
+    translated = utils.translate_text("auto", "en", SENTENCES["fr"])
+    cached = utils._translation_cache.get("fr", "en", SENTENCES["fr"])
+    same = utils.translate_text("auto", "fr", SENTENCES["fr"])
+    if (translated == f"[en] {SENTENCES['fr']}" and cached == translated and same == SENTENCES["fr"]
+            and backend.calls == 1 and utils.detect_source_language(SENTENCES["de"]) == "de"):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {translated!r}, cached {cached!r}, {backend.calls} backend calls")
+
+    # Test 6: batches with "auto" are translated per detected language
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Auto source language in batches")
+    backend.calls = 0
+    texts = [SENTENCES["de"], SENTENCES["nl"], SENTENCES["en"], "2024"]
+    results = utils.translate_many("auto", "en", texts)
+    if (results == [f"[en] {SENTENCES['de']}", f"[en] {SENTENCES['nl']}", SENTENCES["en"], "2024"]
+            and backend.calls == 2 and utils._translation_cache.get("nl", "en", SENTENCES["nl"]) is not None):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {results}, {backend.calls} backend calls")
+
+    # Test 7: short or uncertain detections are left to the backend, not cached under a guess
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Uncertain detections go to the backend as auto")
+    backend.calls = 0
+    texts = ["Your session expired", "Import data from CSV", "Video tutorial available", "Hotel Grand Central",
+             SENTENCES["it"]]
+    detected = [utils.detect_source_language(text) for text in texts]
+    results = [utils.translate_text("auto", "de", text) for text in texts]
+    guessed = [text for text in texts
+               if any(utils._translation_cache.get(lang, "de", text) for lang in ("fr", "pt", "it", "es"))]
+    if (detected == ["auto"] * len(texts) and results == [f"[de] {text}" for text in texts] and not guessed
+            and utils._translation_cache.get("auto", "de", texts[0]) == results[0]):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Detected {detected}, cached under a guess: {guessed}")
+
+    # Test 8: the same-language skip can be turned off
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Disabling the same-language skip")
+    backend.calls = 0
+    utils.configure_language_detection(skip_same_language=False)
+    try:
+        result = utils.translate_text("auto", "pl", SENTENCES["pl"])
+    finally:
+        utils.configure_language_detection(skip_same_language=True)
+    if result == f"[pl] {SENTENCES['pl']}" and backend.calls == 1:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {result!r}, {backend.calls} backend calls")
+
+    # Test 9: an explicit source language is never second-guessed by detection
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: English that looks like the target language")
+    backend.calls = 0
+    lookalikes = [("Content not available", "fr"), ("Excellent communication", "fr"),
+                  ("Restaurant reservation confirmed", "fr"), ("General conditions apply", "fr"),
+                  ("Service temporarily unavailable", "it"), (spanish, "es")]
+    results = [utils.translate_text("en", target, text) for text, target in lookalikes]
+    expected = [f"[{target}] {text}" for text, target in lookalikes]
+    batch = utils.translate_many("en", "fr", [text for text, target in lookalikes if target == "fr"])
+    fanout = utils.translate_fanout("en", ["fr", "it"], "Service temporarily unavailable")
+    if (results == expected and batch == [f"[fr] {text}" for text, target in lookalikes if target == "fr"]
+            and fanout == {"fr": "[fr] Service temporarily unavailable", "it": "[it] Service temporarily unavailable"}):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {results}, {batch}, {fanout}")
+
+    backends._active_translation = original_backend
+    utils._translation_cache = original_cache
+
+    # Summary
+    print("\n" + "=" * 50)
+    print(f"📊 Test Summary: {passed_tests}/{total_tests} tests passed")
+
+    if passed_tests == total_tests:
+        print("🎉 All tests passed! Language detection is working correctly.")
+        return True
+    else:
+        print("⚠️  Some tests failed. Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = test_language_detection()
+    sys.exit(0 if success else 1)
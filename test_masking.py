@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Test script for passthrough masking.
+Tests that code, URLs, e-mail addresses, placeholders and numbers bypass the
+local backend and come back unchanged (no network needed).
+"""
+
+import sys
+import os
+import asyncio
+import time
+
+# Add the current directory to the Python path to import utils
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import utils
+import backends
+from backends import LocalTranslationBackend
+from engine import TranslationEngine
+from masking import PassthroughMasker, renumber_sentinels, restore_sentinel_numbers
+
+class RecordingBackend(LocalTranslationBackend):
+    """Local backend that remembers what it was sent and can drop sentinels."""
+
+    def __init__(self, drop_sentinels=False):
+        super().__init__(phrasebook={})
+        self.sent = []
+        self.drop_sentinels = drop_sentinels
+
+    def translate(self, source_lang, target_lang, text):
+        self.sent.append(text)
+        result = super().translate(source_lang, target_lang, text)
+        return result.replace("⟦0⟧", "") if self.drop_sentinels else result
+
+def _fresh(**kwargs):
+    """Use a new recording backend and an empty memory-only cache."""
+    backend = backends.set_translation_backend(RecordingBackend(**kwargs))
+    utils._translation_cache = utils.TranslationCache(path=None)
+    return backend
+
+def test_masking():
+    """Test span extraction, restoration, shared cache entries and the unmasked fallback."""
+
+    print("🎭 Testing Passthrough Masking")
+    print("=" * 50)
+
+    original_backend = backends._active_translation
+    original_cache = utils._translation_cache
+    original_masker = utils._masker
+    utils.configure_masking()
+    masker = PassthroughMasker()
+
+    passed_tests = 0
+    total_tests = 0
+
+    # Test 1: every span kind is extracted and restored verbatim
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Span extraction and restoration")
+    text = ("Hi {name}, run `pip install -U app` or see https://example.com/docs?id=7, "
+            "mail help@example.com; %d items cost 1,299.50 at 10:30")
+    masked, spans = masker.mask(text)
+    expected = ["{name}", "`pip install -U app`", "https://example.com/docs?id=7", "help@example.com",
+                "%d", "1,299.50", "10:30"]
+    if spans == expected and masker.unmask(masked, spans) == text and masker.mask("mp3 files") == ("mp3 files", []):
+        print(f"   ✅ PASSED - {masked!r}")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {masked!r} with spans {spans}")
+
+    # Test 2: lost, duplicated or invented sentinels are detected
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Damaged sentinels")
+    masked, spans = masker.mask("Call 555 or 777")
+    results = [masker.unmask(damaged, spans) for damaged in
+               ("Llama ⟦0⟧", "Llama ⟦0⟧ o ⟦0⟧", "Llama ⟦0⟧ o ⟦1⟧ ⟦2⟧")]
+    spaced = masker.unmask("Llama ⟦ 0 ⟧ o ⟦1 ⟧", spans)
+    if results == [None, None, None] and spaced == "Llama 555 o 777":
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {results} and {spaced!r}")
+
+    # Test 3: texts differing only in protected spans share one cache entry
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Shared cache entries")
+    backend = _fresh()
+    first = utils.translate_text("en", "es", "Order 1234 shipped")
+    second = utils.translate_text("en", "es", "Order 5678 shipped")
+    if (first == "[es] Order 1234 shipped" and second == "[es] Order 5678 shipped"
+            and backend.sent == ["Order ⟦0⟧ shipped"]):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {first!r} and {second!r}, backend saw {backend.sent}")
+
+    # Test 4: the backend receives a smaller payload
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Smaller payloads")
+    backend = _fresh()
+    text = "Reset your password at https://accounts.example.com/reset?token=abcdef0123456789 within 24 hours"
+    result = utils.translate_text("en", "fr", text)
+    if result == f"[fr] {text}" and len(backend.sent[0]) < len(text) - 50:
+        print(f"   ✅ PASSED - {len(text)} -> {len(backend.sent[0])} characters")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {result!r}, backend saw {backend.sent}")
+
+    # Test 5: texts that are nothing but protected spans skip the backend
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Nothing left to translate")
+    backend = _fresh()
+    inputs = ["{count}: 42", "`make test`", "{{ user }} - 10:30"]
+    results = [utils.translate_text("en", "de", text) for text in inputs]
+    if results == inputs and not backend.sent:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {results}, backend saw {backend.sent}")
+
+    # Test 6: a translation that loses a sentinel is redone unmasked
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Fallback when a sentinel is lost")
+    backend = _fresh(drop_sentinels=True)
+    single = utils.translate_text("en", "it", "Room 12 is ready")
+    batch = utils.translate_many("en", "it", ["Gate 7 is open", "Hello there"])
+    if (single == "[it] Room 12 is ready" and batch == ["[it] Gate 7 is open", "[it] Hello there"]
+            and "Room 12 is ready" in backend.sent and "Gate 7 is open" in backend.sent):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {single!r} and {batch}, backend saw {backend.sent}")
+
+    # Test 7: batches translate each masked text once
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Masked batches")
+    backend = _fresh()
+    texts = [f"Invoice {i} is due" for i in range(20)] + ["Write to billing@example.com"]
+    results = utils.translate_many("en", "pt", texts)
+    if (results == [f"[pt] {text}" for text in texts]
+            and backend.sent == ["Invoice ⟦0⟧ is due\nWrite to ⟦0⟧"]):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {results[:2]}..., backend saw {backend.sent}")
+
+    # Test 8: sentinels are renumbered per segment and back
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Sentinel renumbering")
+    local, numbers = renumber_sentinels("Pay ⟦3⟧ by ⟦4⟧.")
+    restored = restore_sentinel_numbers("Paga ⟦0⟧ antes del ⟦1⟧.", numbers)
+    if local == "Pay ⟦0⟧ by ⟦1⟧." and numbers == [3, 4] and restored == "Paga ⟦3⟧ antes del ⟦4⟧.":
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {local!r}, {numbers}, {restored!r}")
+
+    # Test 9: masking costs microseconds and can be narrowed or disabled
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Speed and configuration")
+    texts = ["Your order 4821 ships to {city} on 12.05, track it at https://example.com/t/4821",
+             "Thank you for shopping with us, we hope to see you again soon"] * 500
+    start = time.perf_counter()
+    for text in texts:
+        masker.unmask(*masker.mask(text))
+    per_text = (time.perf_counter() - start) / len(texts)
+    backend = _fresh()
+    utils.configure_masking(kinds=["url"])
+    narrowed = utils.translate_text("en", "es", "Order 99 at www.example.com")
+    utils.configure_masking(kinds=None)
+    utils.translate_text("en", "es", "Order 99 shipped")
+    try:
+        PassthroughMasker(["numbers"])
+        rejected = False
+    except ValueError:
+        rejected = True
+    if (per_text < 0.0001 and narrowed == "[es] Order 99 at www.example.com" and rejected
+            and backend.sent == ["Order 99 at ⟦0⟧", "Order 99 shipped"]):
+        print(f"   ✅ PASSED - {per_text * 1e6:.1f}µs per mask and unmask")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {per_text * 1e6:.1f}µs per text, backend saw {backend.sent}")
+
+    # Test 10: the async, engine and fan-out fast paths find the masked cache entry
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Masked keys in every entry point")
+    backend = _fresh()
+    utils.configure_masking()
+    first = utils.translate_text("en", "es", "Order 1 shipped")
+    awaited = asyncio.run(utils.translate_text_async("en", "es", "Order 2 shipped"))
+    with TranslationEngine(max_workers=2, rate_limit=1, burst=1) as engine:
+        start = time.perf_counter()
+        parallel = engine.translate("en", "es", [f"Order {i} shipped" for i in range(3, 10)])
+        fanned = engine.fanout("en", ["es"], "Order 10 shipped")
+        elapsed = time.perf_counter() - start
+        tokens = engine.rate_limiter._tokens
+    if (first == "[es] Order 1 shipped" and awaited == "[es] Order 2 shipped"
+            and parallel == [f"[es] Order {i} shipped" for i in range(3, 10)] and fanned == {"es": "[es] Order 10 shipped"}
+            and backend.sent == ["Order ⟦0⟧ shipped"] and tokens == 1 and elapsed < 0.5):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {awaited!r}, {parallel[:2]}, {fanned}, backend saw {backend.sent}, {tokens} tokens left")
+
+    backends._active_translation = original_backend
+    utils._translation_cache = original_cache
+    utils._masker = original_masker
+
+    # Summary
+    print("\n" + "=" * 50)
+    print(f"📊 Test Summary: {passed_tests}/{total_tests} tests passed")
+
+    if passed_tests == total_tests:
+        print("🎉 All tests passed! Passthrough masking is working correctly.")
+        return True
+    else:
+        print("⚠️  Some tests failed. Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = test_masking()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test script for hot-path metrics.
+Tests counters, histograms and exports with the local backends (no network needed).
+"""
+
+import sys
+import os
+import json
+
+# Add the current directory to the Python path to import utils
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import utils
+import backends
+import metrics
+from backends import LocalTranslationBackend, LocalTTSBackend
+
+def test_metrics():
+    """Test metric recording, the disabled fast path and both export formats."""
+
+    print("📈 Testing Metrics")
+    print("=" * 50)
+
+    saved = (backends._active_translation, backends._active_tts, utils._translation_cache, utils._audio_cache)
+    backends.set_translation_backend(LocalTranslationBackend())
+    backends.set_tts_backend(LocalTTSBackend())
+    utils._translation_cache = utils.TranslationCache(path=None)
+    utils._audio_cache = None
+    was_enabled = metrics.registry.enabled
+    metrics.registry.reset()
+
+    passed_tests = 0
+    total_tests = 0
+
+    # Test 1: nothing is recorded while disabled
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Disabled metrics record nothing")
+    metrics.disable()
+    utils.translate_text("en", "es", "Hello")
+    if not metrics.snapshot()["translator_translate_seconds"]["values"]:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Values recorded while disabled")
+
+    # Test 2: hits, misses, errors and TTS bytes by label
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Counters by language pair")
+    metrics.enable()
+    utils.translate_text("en", "fr", "Hello")
+    utils.translate_text("en", "fr", "Hello")
+    try:
+        utils.translate_text("en", "xx", "Hello")
+    except Exception:
+        pass
+    audio_bytes = utils.text_to_speech_bytes("Hola", "es")
+    snapshot = metrics.snapshot()
+    value = lambda name, **labels: sum(v["value"] for v in snapshot[name]["values"] if v["labels"] == labels)
+    checks = [
+        value("translator_cache_hits_total", pair="en-fr") == 1,
+        value("translator_cache_misses_total", pair="en-fr") == 1,
+        value("translator_translate_errors_total", pair="other") == 1,
+        value("translator_tts_bytes_total", lang="es") == len(audio_bytes),
+        value("translator_translate_in_flight") == 0,
+    ]
+    if all(checks):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Checks: {checks}")
+
+    # Test 3: exports
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: JSON and Prometheus exports")
+    text = metrics.prometheus_text()
+    json.dumps(metrics.snapshot())
+    if ('translator_translate_seconds_bucket{pair="en-fr",le="+Inf"} 2' in text
+            and "# TYPE translator_tts_bytes_total counter" in text):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Unexpected Prometheus output:\n{text}")
+
+    # Test 4: user-supplied label values are bounded and escaped
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Label cardinality and escaping")
+    metrics.registry.reset()
+    for i in range(50):
+        metrics.CACHE_MISSES.inc(pair=f"en-x{i}")
+    metrics.TTS_ERRORS.inc(lang='es"}\nfake_metric 1')
+    counter = metrics.Counter("translator_test_total", "Escaping test")
+    counter.inc(source='C:\\path "quoted"\nnext')
+    text = metrics.prometheus_text()
+    lines = counter.prometheus()
+    if (len(metrics.CACHE_MISSES.snapshot()) == 1
+            and 'translator_cache_misses_total{pair="other"} 50' in text
+            and 'translator_tts_errors_total{lang="other"} 1' in text
+            and not any(line.startswith("fake_metric") for line in text.splitlines())
+            and lines == ['translator_test_total{source="C:\\\\path \\"quoted\\"\\nnext"} 1']):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {metrics.CACHE_MISSES.snapshot()}, {lines}")
+
+    metrics.registry.enabled = was_enabled
+    metrics.registry.reset()
+    backends._active_translation, backends._active_tts, utils._translation_cache, utils._audio_cache = saved
+
+    # Summary
+    print("\n" + "=" * 50)
+    print(f"📊 Test Summary: {passed_tests}/{total_tests} tests passed")
+
+    if passed_tests == total_tests:
+        print("🎉 All tests passed! Metrics are working correctly.")
+        return True
+    else:
+        print("⚠️  Some tests failed. Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = test_metrics()
+    sys.exit(0 if success else 1)
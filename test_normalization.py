@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test script for text normalization.
+Tests TextNormalizer and its effect on translate_text caching (no network needed).
+"""
+
+import sys
+import os
+
+# Add the current directory to the Python path to import utils
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import utils
+import backends
+from backends import LocalTranslationBackend
+from normalization import TextNormalizer, measure_hit_ratio
+
+def test_normalization():
+    """Test NFC, whitespace collapsing, case folding and casing restoration."""
+
+    print("🔤 Testing Text Normalization")
+    print("=" * 50)
+
+    passed_tests = 0
+    total_tests = 0
+    normalizer = TextNormalizer(case_fold=True)
+
+    # Test 1: near-duplicates share one key
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Near-duplicates share a key")
+    variants = ["Hello world", "hello world", "Hello\u00a0world", "HELLO   WORLD", "hello world "]
+    keys = {normalizer.normalize(text.strip())[0] for text in variants}
+    nfc = TextNormalizer().normalize("Cafe\u0301")[0] == "Caf\u00e9"
+    if keys == {"hello world"} and nfc:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Keys: {keys}, NFC: {nfc}")
+
+    # Test 2: casing is restored on the translation, mixed case is kept
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Casing restoration")
+    restored = [
+        normalizer.restore("hola mundo", normalizer.normalize("Hello world")[1]),
+        normalizer.restore("hola mundo", normalizer.normalize("HELLO WORLD")[1]),
+        normalizer.restore("hola mundo", normalizer.normalize("hello world")[1]),
+    ]
+    mixed_key = normalizer.normalize("iPhone sale")[0]
+    if restored == ["Hola mundo", "HOLA MUNDO", "hola mundo"] and mixed_key == "iPhone sale":
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Restored: {restored}, mixed key: {mixed_key!r}")
+
+    # Test 3: newlines survive whitespace collapsing
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Newlines are preserved")
+    key = TextNormalizer().normalize("line  one \n\tline two")[0]
+    if key == "line one\nline two":
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {key!r}")
+
+    # Test 4: translate_text makes one backend call for all variants
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: One backend call per near-duplicate group")
+    saved = (backends._active_translation, utils._translation_cache, utils._normalizer)
+    backend = backends.set_translation_backend(LocalTranslationBackend(phrasebook={("en", "es", "hello world"): "hola mundo"}))
+    utils._translation_cache = utils.TranslationCache(path=None)
+    utils.configure_normalization(case_fold=True)
+    results = [utils.translate_text("en", "es", text) for text in variants]
+    backends._active_translation, utils._translation_cache, utils._normalizer = saved
+    if backend.calls == 1 and results[0] == "Hola mundo" and results[3] == "HOLA MUNDO":
+        print(f"   ✅ PASSED - {results}")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {backend.calls} calls, results {results}")
+
+    # Test 5: hit ratio report
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Hit ratio improvement")
+    before = measure_hit_ratio(variants)
+    after = measure_hit_ratio(variants, normalizer)
+    if after == 0.8 and before < after:
+        print(f"   ✅ PASSED - {before:.0%} → {after:.0%}")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {before} → {after}")
+
+    # Summary
+    print("\n" + "=" * 50)
+    print(f"📊 Test Summary: {passed_tests}/{total_tests} tests passed")
+
+    if passed_tests == total_tests:
+        print("🎉 All tests passed! Text normalization is working correctly.")
+        return True
+    else:
+        print("⚠️  Some tests failed. Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = test_normalization()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Test script for retries, deadlines and circuit breaking.
+Tests translate_text against the fault-injecting local backend so no network
+access is needed.
+"""
+
+import sys
+import os
+import time
+
+# Add the current directory to the Python path to import utils
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import utils
+import backends
+from backends import LocalTranslationBackend
+from resilience import CircuitBreaker, RetryPolicy
+
+def _fresh(**kwargs):
+    """Use a new local backend, an empty memory-only cache and new circuits."""
+    backend = backends.set_translation_backend(LocalTranslationBackend(phrasebook={}))
+    utils._translation_cache = utils.TranslationCache(path=None)
+    kwargs.setdefault("retry", RetryPolicy(attempts=3, base_delay=0.01))
+    utils.configure_resilience(**kwargs)
+    return backend
+
+def test_resilience():
+    """Test retries with backoff, deadlines, circuit breaking and stale cache fallback."""
+
+    print("🛡️ Testing Retries and Circuit Breaking")
+    print("=" * 50)
+
+    original_backend = backends._active_translation
+    original_cache = utils._translation_cache
+    original_resilience = utils._resilience
+
+    passed_tests = 0
+    total_tests = 0
+
+    # Test 1: transient failures are retried transparently
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Transient failures are retried")
+    backend = _fresh()
+    backend.fail_next(2)
+    try:
+        result = utils.translate_text("en", "es", "Good night")
+    except Exception as e:
+        result = e
+    if result == "[es] Good night" and backend.calls == 3 and utils.get_resilience_stats()["retries"] == 2:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {result!r} after {backend.calls} calls")
+
+    # Test 2: backoff is jittered and capped
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Jittered exponential backoff")
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.5, multiplier=2)
+    first = [policy.delay(0) for _ in range(200)]
+    late = [policy.delay(10) for _ in range(200)]
+    if max(first) <= 0.1 and max(late) <= 0.5 and max(late) > 0.2 and len(set(first)) > 100:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - first retry up to {max(first):.3f}s, late retries up to {max(late):.3f}s")
+
+    # Test 3: a slow backend is cut off at the deadline
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Per-call deadline")
+    backend = _fresh(deadline=0.2)
+    backend.latency = 1.0
+    start = time.perf_counter()
+    try:
+        utils.translate_text("en", "es", "Slow request")
+        message = ""
+    except Exception as e:
+        message = str(e)
+    elapsed = time.perf_counter() - start
+    if "timed out" in message and elapsed < 0.5:
+        print(f"   ✅ PASSED - Gave up after {elapsed:.2f}s")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {message!r} after {elapsed:.2f}s")
+
+    # Test 4: an outage opens the circuit and later calls fail fast
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Circuit opens during an outage")
+    backend = _fresh(retry=RetryPolicy(attempts=1), failure_threshold=3)
+    backend.down = True
+    for i in range(3):
+        try:
+            utils.translate_text("en", "fr", f"Request {i}")
+        except Exception:
+            pass
+    calls_when_open = backend.calls
+    start = time.perf_counter()
+    try:
+        utils.translate_text("en", "fr", "One more")
+        message = ""
+    except Exception as e:
+        message = str(e)
+    elapsed = time.perf_counter() - start
+    circuits = utils.get_resilience_stats()["circuits"]
+    if (calls_when_open == 3 and backend.calls == 3 and "temporarily unavailable" in message
+            and circuits == {"local:en-fr": CircuitBreaker.OPEN} and elapsed < 0.05):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {backend.calls} calls, got {message!r}, circuits {circuits}")
+
+    # Test 5: expired cache entries are served while the circuit is open
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Stale entries while the circuit is open")
+    utils._translation_cache = utils.TranslationCache(path=None, ttl=0.05)
+    utils._translation_cache.set("en", "fr", "Hello", "Bonjour")
+    time.sleep(0.1)
+    try:
+        result = utils.translate_text("en", "fr", "Hello")
+    except Exception as e:
+        result = e
+    if result == "Bonjour" and backend.calls == 3 and utils.get_cache_stats()["stale_hits"] == 1:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {result!r}")
+
+    # Test 6: after the reset timeout one probe closes the circuit again
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Half-open probe recovers")
+    backend = _fresh(retry=RetryPolicy(attempts=1), failure_threshold=1, reset_timeout=0.1)
+    backend.fail_next(1)
+    try:
+        utils.translate_text("en", "de", "First")
+    except Exception:
+        pass
+    opened = utils.get_resilience_stats()["circuits"]["local:en-de"]
+    time.sleep(0.15)
+    try:
+        result = utils.translate_text("en", "de", "Second")
+    except Exception as e:
+        result = e
+    closed = utils.get_resilience_stats()["circuits"]["local:en-de"]
+    if opened == CircuitBreaker.OPEN and result == "[de] Second" and closed == CircuitBreaker.CLOSED:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {opened} -> {closed}, got {result!r}")
+
+    # Test 7: client errors are neither retried nor held against the circuit
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Unsupported languages are not retried")
+    backend = _fresh(failure_threshold=1)
+    try:
+        utils.translate_text("en", "xx", "Hello")
+        message = ""
+    except Exception as e:
+        message = str(e)
+    stats = utils.get_resilience_stats()
+    if "No support" in message and stats["retries"] == 0 and stats["circuits"]["local:en-xx"] == CircuitBreaker.CLOSED:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {message!r}, stats {stats}")
+
+    # Test 8: a flaky backend is smoothed over for batches too
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Random failures with translate_many")
+    backend = _fresh(retry=RetryPolicy(attempts=6, base_delay=0.001), failure_threshold=100)
+    backend.failure_rate = 0.3
+    backend._random.seed(7)
+    # Letters rather than numbers, which masking would fold into one cache entry
+    texts = [f"Line {chr(97 + i // 26)}{chr(97 + i % 26)}" for i in range(50)]
+    try:
+        results = [utils.translate_text("en", "it", text) for text in texts[:25]]
+        results += utils.translate_many("en", "it", texts[25:])
+    except Exception as e:
+        results = e
+    if results == [f"[it] {text}" for text in texts] and backend.failures > 0:
+        print(f"   ✅ PASSED - {backend.failures} injected failures retried")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {results!r}")
+
+    backends._active_translation = original_backend
+    utils._translation_cache = original_cache
+    utils._resilience = original_resilience
+
+    # Summary
+    print("\n" + "=" * 50)
+    print(f"📊 Test Summary: {passed_tests}/{total_tests} tests passed")
+
+    if passed_tests == total_tests:
+        print("🎉 All tests passed! Retries and circuit breaking are working correctly.")
+        return True
+    else:
+        print("⚠️  Some tests failed. Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = test_resilience()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Test script for the HTTP translation service.
+Runs the server on a free local port with the local backends (no network needed).
+"""
+
+import sys
+import os
+import json
+import threading
+import http.client
+
+# Add the current directory to the Python path to import server
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import utils
+import backends
+from backends import LocalTranslationBackend, LocalTTSBackend
+from server import create_server
+
+def _request(conn, method, path, payload=None):
+    body = json.dumps(payload).encode("utf-8") if payload is not None else None
+    headers = {"Content-Type": "application/json"} if body is not None else {}
+    conn.request(method, path, body=body, headers=headers)
+    response = conn.getresponse()
+    return response, response.read()
+
+def _raw_request(port, path, headers):
+    """POST with exactly the given headers (http.client would add a Content-Length)."""
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    conn.putrequest("POST", path, skip_accept_encoding=True)
+    for name, value in headers.items():
+        conn.putheader(name, value)
+    conn.endheaders()
+    response = conn.getresponse()
+    response.read()
+    conn.close()
+    return response.status
+
+def test_server():
+    """Test the endpoints, keep-alive, chunked audio and the concurrency limit."""
+
+    print("🛰️  Testing HTTP Translation Service")
+    print("=" * 50)
+
+    original_backend = backends._active_translation
+    original_tts = backends._active_tts
+    original_cache = utils._translation_cache
+    original_audio_cache = utils._audio_cache
+    backends.set_translation_backend(LocalTranslationBackend())
+    backends.set_tts_backend(LocalTTSBackend())
+    utils._translation_cache = utils.TranslationCache(path=None)
+    utils._audio_cache = None
+
+    server = create_server(port=0, max_concurrency=4)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_port
+
+    passed_tests = 0
+    total_tests = 0
+
+    # Test 1: several requests over one kept-alive connection
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: /translate with keep-alive")
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    first, first_body = _request(conn, "POST", "/translate", {"source": "en", "target": "es", "text": "Hello"})
+    sock = conn.sock
+    second, second_body = _request(conn, "POST", "/translate", {"source": "en", "target": "fr", "text": "Hello"})
+    if (first.status == 200 and json.loads(first_body) == {"translation": "Hola"}
+            and json.loads(second_body) == {"translation": "Bonjour"} and conn.sock is sock):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {first.status} {first_body!r}, {second_body!r}")
+
+    # Test 2: batch and fan-out
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: /translate/batch and multiple targets")
+    batch, batch_body = _request(conn, "POST", "/translate/batch",
+                                 {"source": "en", "target": "de", "texts": ["Hello", "cat", ""]})
+    fanout, fanout_body = _request(conn, "POST", "/translate",
+                                   {"source": "en", "targets": ["es", "de"], "text": "Hello"})
+    if (json.loads(batch_body) == {"translations": ["Hallo", "[de] cat", ""]}
+            and json.loads(fanout_body) == {"translations": {"es": "Hola", "de": "Hallo"}}):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {batch_body!r}, {fanout_body!r}")
+
+    # Test 3: client errors
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Error statuses")
+    missing, _ = _request(conn, "POST", "/translate", {"source": "en", "text": "Hello"})
+    unsupported, _ = _request(conn, "POST", "/translate", {"source": "en", "target": "xx", "text": "Hello"})
+    unknown, _ = _request(conn, "GET", "/nope")
+    if (missing.status, unsupported.status, unknown.status) == (400, 400, 404):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {missing.status}, {unsupported.status}, {unknown.status}")
+
+    # Test 4: audio is streamed with chunked transfer encoding
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Chunked /tts")
+    text = "Hola, esto es una prueba de audio. " * 10
+    audio, audio_body = _request(conn, "POST", "/tts", {"text": text, "lang": "es"})
+    expected = LocalTTSBackend().synthesize(text.strip(), "es")
+    if (audio.status == 200 and audio.getheader("Transfer-Encoding") == "chunked"
+            and audio.getheader("Content-Type") == "audio/mpeg" and audio_body == expected):
+        print(f"   ✅ PASSED - {len(audio_body)} bytes")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {audio.status}, {len(audio_body)} bytes")
+    conn.close()
+
+    # Test 5: requests over the concurrency limit get 503
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Concurrency limit")
+    backends.set_translation_backend(LocalTranslationBackend(latency=0.3))
+    statuses = []
+    lock = threading.Lock()
+
+    def call(i):
+        c = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+        response, _ = _request(c, "POST", "/translate", {"source": "en", "target": "it", "text": f"slow {i}"})
+        with lock:
+            statuses.append((response.status, response.getheader("Retry-After")))
+        c.close()
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    ok = sum(1 for status, _ in statuses if status == 200)
+    busy = [retry for status, retry in statuses if status == 503]
+    if ok >= 4 and busy and all(retry == "1" for retry in busy):
+        print(f"   ✅ PASSED - {ok} served, {len(busy)} rejected")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Statuses {statuses}")
+
+    # Test 6: malformed fields and lengths are client errors, not backend failures
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Field types and Content-Length")
+    backends.set_translation_backend(LocalTranslationBackend())
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    statuses = [
+        _request(conn, "POST", "/translate", {"source": "en", "target": "es", "text": 42})[0].status,
+        _request(conn, "POST", "/translate", {"source": ["en"], "target": "es", "text": "Hello"})[0].status,
+        _request(conn, "POST", "/translate", {"source": "en", "targets": ["es", 1], "text": "Hello"})[0].status,
+        _request(conn, "POST", "/translate/batch", {"source": "en", "target": "es", "texts": "Hello"})[0].status,
+        _request(conn, "POST", "/tts", {"text": "Hola", "lang": {"code": "es"}})[0].status,
+    ]
+    conn.close()
+    statuses += [
+        _raw_request(port, "/translate", {"Content-Length": "abc"}),
+        _raw_request(port, "/translate", {"Content-Length": "-5"}),
+        _raw_request(port, "/translate", {}),
+    ]
+    if statuses == [400, 400, 400, 400, 400, 400, 400, 411]:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Statuses {statuses}")
+
+    # Test 7: unsupported languages are client errors, backend failures stay 502
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Unsupported languages and upstream failures")
+    backend = backends.set_translation_backend(LocalTranslationBackend())
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    responses = [
+        _request(conn, "POST", "/translate", {"source": "xx", "target": "es", "text": "Hello"}),
+        _request(conn, "POST", "/translate", {"source": "en", "targets": ["es", "xx"], "text": "Hello"}),
+        _request(conn, "POST", "/translate/batch", {"source": "en", "target": "qq", "texts": ["Hello"]}),
+        _request(conn, "POST", "/tts", {"text": "Hola", "lang": "xx"}),
+        _request(conn, "GET", "/tts?text=Hola&lang=xx"),
+        _request(conn, "POST", "/translate", {"source": "auto", "target": "es", "text": "Hello"}),
+    ]
+    backend.fail_next(10, ValueError("Upstream returned an unexpected page"))
+    upstream, _ = _request(conn, "POST", "/translate", {"source": "en", "target": "it", "text": "upstream trouble"})
+    conn.close()
+    statuses = [response.status for response, _ in responses] + [upstream.status]
+    if statuses == [400, 400, 400, 400, 400, 200, 502] and b"Unsupported language" in responses[1][1]:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Statuses {statuses}")
+
+    server.shutdown()
+    server.server_close()
+    backends._active_translation = original_backend
+    backends._active_tts = original_tts
+    utils._translation_cache = original_cache
+    utils._audio_cache = original_audio_cache
+
+    # Summary
+    print("\n" + "=" * 50)
+    print(f"📊 Test Summary: {passed_tests}/{total_tests} tests passed")
+
+    if passed_tests == total_tests:
+        print("🎉 All tests passed! HTTP service is working correctly.")
+        return True
+    else:
+        print("⚠️  Some tests failed. Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = test_server()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Test script for request coalescing.
+Tests that concurrent identical translations and TTS requests share one backend
+call, from threads and from asyncio (no network needed).
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+import threading
+
+# Add the current directory to the Python path to import utils
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import utils
+import backends
+from backends import LocalTranslationBackend, LocalTTSBackend
+from resilience import RetryPolicy
+from singleflight import SingleFlight
+
+class FailingBackend(LocalTranslationBackend):
+    """Local backend whose requests always fail after the latency."""
+
+    def translate(self, source_lang, target_lang, text):
+        super().translate(source_lang, target_lang, text)
+        raise ConnectionError("backend unavailable")
+
+def _run_threads(count, target):
+    results = [None] * count
+    def worker(i):
+        try:
+            results[i] = target()
+        except Exception as e:
+            results[i] = e
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+def test_singleflight():
+    """Test coalescing of threaded and asyncio callers, including shared errors."""
+
+    print("🪢 Testing Request Coalescing")
+    print("=" * 50)
+
+    original_backend = backends._active_translation
+    original_tts = backends._active_tts
+    original_cache = utils._translation_cache
+    original_audio_cache = utils._audio_cache
+    original_resilience = utils._resilience
+    utils._audio_cache = None
+    utils.configure_resilience(retry=RetryPolicy(attempts=2, base_delay=0.01))
+
+    passed_tests = 0
+    total_tests = 0
+
+    # Test 1: threads asking for the same text share one backend call
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Concurrent threads, one backend call")
+    backend = backends.set_translation_backend(LocalTranslationBackend(latency=0.2))
+    utils._translation_cache = utils.TranslationCache(path=None)
+    results = _run_threads(20, lambda: utils.translate_text("en", "es", "Hello"))
+    if results == ["Hola"] * 20 and backend.calls == 1:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {backend.calls} backend calls, results {set(map(str, results))}")
+
+    # Test 2: every waiter receives the shared error (the leader's retries included)
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Errors are shared")
+    backend = backends.set_translation_backend(FailingBackend(latency=0.2))
+    results = _run_threads(10, lambda: utils.translate_text("en", "fr", "Unreachable"))
+    if backend.calls == 2 and all(isinstance(r, Exception) and "Network connection error" in str(r) for r in results):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {backend.calls} backend calls, results {results}")
+
+    # Test 3: asyncio callers share one call without tying up executor threads
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Concurrent coroutines, one backend call")
+    backend = backends.set_translation_backend(LocalTranslationBackend(latency=0.2))
+    utils._translation_cache = utils.TranslationCache(path=None)
+
+    async def many():
+        return await asyncio.gather(*(utils.translate_text_async("en", "de", "Hello") for _ in range(50)))
+
+    results = asyncio.run(many())
+    if results == ["Hallo"] * 50 and backend.calls == 1:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {backend.calls} backend calls")
+
+    # Test 4: identical text-to-speech requests share one synthesis
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Concurrent text-to-speech")
+    tts = backends.set_tts_backend(LocalTTSBackend(latency=0.2))
+    tmp_dir = tempfile.mkdtemp()
+    results = _run_threads(8, lambda: utils.text_to_speech_bytes("Hola a todos", "es"))
+    paths = [os.path.join(tmp_dir, f"{i}.mp3") for i in range(8)]
+
+    async def speak():
+        return await asyncio.gather(*(utils.text_to_speech_async("Buenos días", "es", path) for path in paths))
+
+    asyncio.run(speak())
+    same_files = len({open(path, "rb").read() for path in paths}) == 1
+    if len(set(results)) == 1 and same_files and tts.calls == 2:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {tts.calls} synthesis calls")
+
+    # Test 5: a caller that times out does not cancel the shared call
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Timeouts leave the shared call running")
+    flight = SingleFlight()
+
+    async def slow():
+        await asyncio.sleep(0.1)
+        return "done"
+
+    async def scenario():
+        impatient = flight.do_async("key", slow, timeout=0.01)
+        patient = flight.do_async("key", slow)
+        return await asyncio.gather(impatient, patient, return_exceptions=True)
+
+    impatient, patient = asyncio.run(scenario())
+    if isinstance(impatient, asyncio.TimeoutError) and patient == "done" and flight.stats() == {"calls": 1, "shared": 1}:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {impatient!r}, {patient!r}, {flight.stats()}")
+
+    backends._active_translation = original_backend
+    backends._active_tts = original_tts
+    utils._translation_cache = original_cache
+    utils._audio_cache = original_audio_cache
+    utils._resilience = original_resilience
+
+    # Summary
+    print("\n" + "=" * 50)
+    print(f"📊 Test Summary: {passed_tests}/{total_tests} tests passed")
+
+    if passed_tests == total_tests:
+        print("🎉 All tests passed! Request coalescing is working correctly.")
+        return True
+    else:
+        print("⚠️  Some tests failed. Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = test_singleflight()
+    sys.exit(0 if success else 1)
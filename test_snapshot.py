@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Test script for warm-start snapshots.
+Tests the memory-mapped snapshot format, the snapshot tier of the caches, the
+export tool and a warm start in a fresh process (no network needed).
+"""
+
+import sys
+import os
+import json
+import shutil
+import subprocess
+import tempfile
+import time
+import warnings
+
+# Add the current directory to the Python path to import utils
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import utils
+from audio_cache import AudioCache
+from cache import TranslationCache
+from snapshot import Snapshot, write_snapshot
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def test_snapshot():
+    """Test the snapshot format, the cache tier, exporting and warm starts."""
+
+    print("🔥 Testing Warm-Start Snapshots")
+    print("=" * 50)
+
+    original_cache = utils._translation_cache
+    original_audio_cache = utils._audio_cache
+    original_snapshot = utils._snapshot
+    tmp_dir = tempfile.mkdtemp()
+
+    passed_tests = 0
+    total_tests = 0
+
+    # Test 1: translations and clips round-trip through the file
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Round trip")
+    path = os.path.join(tmp_dir, "small.snap")
+    clip_key = AudioCache.key("Hola", "es")
+    info = write_snapshot(path, [("en", "es", "Hello", "Hola", 100.0), ("en", "ja", "Thank you", "ありがとう", 200.0),
+                                 ("en", "es", "Hello", "Buenas", 300.0)],
+                          [(clip_key, b"ID3 fake mp3", 400.0)])
+    snap = Snapshot(path)
+    results = [snap.get_translation("en", "es", "Hello"), snap.get_translation("en", "ja", "Thank you"),
+               snap.get_translation("en", "fr", "Hello"), snap.get_clip("Hola", "es"), snap.get_clip("Hola", "es", True)]
+    if (info["translations"] == 2 and info["clips"] == 1
+            and results == [("Hola", 100.0), ("ありがとう", 200.0), None, b"ID3 fake mp3", None]):
+        print(f"   ✅ PASSED - {info['bytes']} bytes")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {info}, {results}")
+    snap.close()
+
+    # Test 2: opening is independent of size and lookups take microseconds
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Mapping 200k entries")
+    path = os.path.join(tmp_dir, "large.snap")
+    write_snapshot(path, ((("en", "de", f"sentence {i}", f"Satz {i}", 0.0)) for i in range(200000)))
+    start = time.perf_counter()
+    snap = Snapshot(path)
+    opened = time.perf_counter() - start
+    start = time.perf_counter()
+    found = [snap.get_translation("en", "de", f"sentence {i}") for i in range(0, 200000, 20)]
+    per_lookup = (time.perf_counter() - start) / len(found)
+    if (opened < 0.01 and per_lookup < 0.0001 and snap.translations == 200000
+            and all(result == (f"Satz {i * 20}", 0.0) for i, result in enumerate(found))):
+        print(f"   ✅ PASSED - opened in {opened * 1000:.2f}ms, {per_lookup * 1e6:.1f}µs per lookup")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - opened in {opened * 1000:.2f}ms, {per_lookup * 1e6:.1f}µs per lookup")
+    snap.close()
+
+    # Test 3: the cache consults the snapshot after memory (and disk)
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Snapshot tier of the translation cache")
+    path = os.path.join(tmp_dir, "tier.snap")
+    now = time.time()
+    write_snapshot(path, [("en", "es", "Hello", "Hola", now), ("en", "es", "Old", "Viejo", now - 3600)])
+    cache = TranslationCache(path=None, ttl=60, snapshot=Snapshot(path))
+    first = cache.get("en", "es", "Hello")
+    second = cache.get("en", "es", "Hello")
+    expired = cache.get("en", "es", "Old")
+    stale = cache.get("en", "es", "Old", allow_stale=True)
+    stats = cache.stats()
+    if (first == second == "Hola" and expired is None and stale == "Viejo"
+            and stats["snapshot_hits"] == 1 and stats["memory_hits"] == 1 and stats["memory_entries"] == 1):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {first!r}, {second!r}, {expired!r}, {stale!r}, stats {stats}")
+
+    # Test 4: exporting keeps the most used translations and most recent clips
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Exporting the hottest entries")
+    cache = TranslationCache(path=os.path.join(tmp_dir, "cache.sqlite3"), memory_size=1)
+    for i in range(20):
+        cache.set("en", "fr", f"phrase {i}", f"phrase fr {i}")
+    for i in range(5):
+        for _ in range(i + 1):
+            cache._memory.clear()
+            cache.get("en", "fr", f"phrase {i}")
+    audio_cache = AudioCache(directory=os.path.join(tmp_dir, "audio"))
+    for i in range(4):
+        audio_cache.put_bytes(f"clip {i}", "en", False, f"mp3 {i}".encode())
+        os.utime(audio_cache.path_for(AudioCache.key(f"clip {i}", "en")), (1000 + i, 1000 + i))
+    utils._translation_cache = cache
+    utils._audio_cache = audio_cache
+    path = os.path.join(tmp_dir, "export.snap")
+    info = utils.export_snapshot(path, translations=5, clips=2)
+    snap = Snapshot(path)
+    hottest = [text for text in (f"phrase {i}" for i in range(20)) if snap.get_translation("en", "fr", text)]
+    clips = [text for text in (f"clip {i}" for i in range(4)) if snap.get_clip(text, "en")]
+    if (info["translations"] == 5 and info["clips"] == 2 and hottest == [f"phrase {i}" for i in range(5)]
+            and clips == ["clip 2", "clip 3"] and snap.get_clip("clip 3", "en") == b"mp3 3"):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {info}, translations {hottest}, clips {clips}")
+    snap.close()
+
+    # Test 5: a fresh process maps the snapshot at import and serves it without a backend call
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Warm start in a new process")
+    path = os.path.join(tmp_dir, "warm.snap")
+    write_snapshot(path, [("en", "es", "Good morning", "Buenos días", time.time())],
+                   [(AudioCache.key("Buenos días", "es"), b"warm mp3", time.time())])
+    script = ("import json, backends, utils; "
+              "result = [utils.translate_text('en', 'es', 'Good morning'), "
+              "utils.text_to_speech_bytes('Buenos días', 'es').decode(), "
+              "backends.get_translation_backend().calls, backends.get_tts_backend().calls, "
+              "utils.get_cache_stats()['snapshot_hits']]; print(json.dumps(result))")
+    env = dict(os.environ, TRANSLATOR_BACKEND="local", TRANSLATOR_SNAPSHOT=path, TRANSLATOR_CACHE_PATH="",
+               TRANSLATOR_AUDIO_CACHE_DIR="")
+    completed = subprocess.run([sys.executable, "-c", script], cwd=HERE, env=env, capture_output=True, text=True)
+    try:
+        result = json.loads(completed.stdout)
+    except ValueError:
+        result = completed.stderr
+    if result == ["Buenos días", "warm mp3", 0, 0, 1]:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {result}")
+
+    # Test 6: a damaged snapshot is rejected, and only means a cold start at import
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Damaged snapshots")
+    path = os.path.join(tmp_dir, "damaged.snap")
+    with open(path, "wb") as f:
+        f.write(b"not a snapshot")
+    try:
+        Snapshot(path)
+        rejected = False
+    except ValueError:
+        rejected = True
+    os.environ["TRANSLATOR_SNAPSHOT"] = path
+    try:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            loaded = utils._snapshot_from_env()
+    finally:
+        del os.environ["TRANSLATOR_SNAPSHOT"]
+    if rejected and loaded is None and len(caught) == 1:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - rejected={rejected}, loaded={loaded}, {len(caught)} warnings")
+
+    # Test 7: the export tool writes a snapshot from the configured caches
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Export command")
+    path = os.path.join(tmp_dir, "cli.snap")
+    env = dict(os.environ, TRANSLATOR_CACHE_PATH=os.path.join(tmp_dir, "cache.sqlite3"),
+               TRANSLATOR_AUDIO_CACHE_DIR=os.path.join(tmp_dir, "audio"))
+    completed = subprocess.run([sys.executable, "snapshot.py", "export", path, "--translations", "3", "--clips", "1"],
+                               cwd=HERE, env=env, capture_output=True, text=True)
+    snap = Snapshot(path) if completed.returncode == 0 else None
+    if snap is not None and snap.translations == 3 and snap.clips == 1 and snap.get_translation("en", "fr", "phrase 4"):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {completed.stderr.strip()}")
+    if snap is not None:
+        snap.close()
+
+    # Test 8: newer disk rows win over the snapshot, clear() detaches it and loading a new one closes the old
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Snapshot precedence and replacement")
+    path = os.path.join(tmp_dir, "precedence.snap")
+    write_snapshot(path, [("en", "es", "Save", "Guardar (old)", time.time())])
+    snap = Snapshot(path)
+    disk_cache = TranslationCache(path=os.path.join(tmp_dir, "precedence.sqlite3"), snapshot=snap)
+    disk_cache.set("en", "es", "Save", "Guardar")
+    disk_cache._memory.clear()
+    newer = disk_cache.get("en", "es", "Save")
+    disk_cache.clear()
+    cleared = disk_cache.get("en", "es", "Save")
+    utils._translation_cache = TranslationCache(path=None)
+    # Keep a snapshot mapped from the environment open for the restore below
+    utils._snapshot = None
+    first = utils.load_snapshot(path)
+    second = utils.load_snapshot(path)
+    try:
+        first.get_translation("en", "es", "Save")
+        first_closed = False
+    except ValueError:
+        first_closed = True
+    served = utils._translation_cache.get("en", "es", "Save")
+    utils.load_snapshot(None)
+    if (newer == "Guardar" and cleared is None and disk_cache.snapshot is None
+            and first_closed and served == "Guardar (old)" and utils._snapshot is None):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {newer!r}, {cleared!r} after clear(), first closed={first_closed}, {served!r}")
+    disk_cache.close()
+    snap.close()
+
+    cache.close()
+    utils._translation_cache = original_cache
+    utils._audio_cache = original_audio_cache
+    utils._snapshot = original_snapshot
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    # Summary
+    print("\n" + "=" * 50)
+    print(f"📊 Test Summary: {passed_tests}/{total_tests} tests passed")
+
+    if passed_tests == total_tests:
+        print("🎉 All tests passed! Warm-start snapshots are working correctly.")
+        return True
+    else:
+        print("⚠️  Some tests failed. Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = test_snapshot()
+    sys.exit(0 if success else 1)
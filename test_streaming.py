@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test script for chunking and streaming translation.
+Tests split_chunks and translate_stream with a stubbed backend (no network needed).
+"""
+
+import sys
+import os
+import io
+
+# Add the current directory to the Python path to import utils
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import utils
+from chunking import split_chunks
+from utils import translate_stream
+
+SAMPLE = (
+    "The quick brown fox jumps over the lazy dog. It was a sunny day!\n"
+    "Was it really?  Nobody knows.\n\n"
+    "   A second paragraph starts here, with some indentation.\n"
+    "And   irregular    spacing that must survive.\n\n\n"
+    "Last line without a newline"
+)
+
+def test_streaming():
+    """Test chunk boundaries and ordered streaming translation."""
+
+    print("🌊 Testing Streaming Translation")
+    print("=" * 50)
+
+    original_translate = utils._translate_miss
+    original_cache = utils._translation_cache
+    utils._translation_cache = utils.TranslationCache(path=None)
+    utils._translate_miss = lambda source_lang, target_lang, text: text.upper()
+
+    passed_tests = 0
+    total_tests = 0
+
+    # Test 1: chunks respect the limit and reassemble exactly
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Chunks reassemble the original text")
+    chunks = split_chunks(SAMPLE, 40)
+    if "".join(chunks) == SAMPLE and all(len(chunk) <= 40 for chunk in chunks):
+        print(f"   ✅ PASSED - {len(chunks)} chunks")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Chunks: {chunks}")
+
+    # Test 2: chunks end on sentence boundaries where possible
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Sentence-aware boundaries")
+    chunks = split_chunks("One sentence here. Another sentence follows. And a third.", 30)
+    if chunks[0] == "One sentence here. ":
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - First chunk: {chunks[0]!r}")
+
+    # Test 3: streaming a file preserves whitespace and order
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Sequential streaming from a file")
+    result = "".join(translate_stream("en", "es", io.StringIO(SAMPLE), max_chars=40))
+    if result == SAMPLE.upper():
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {result!r}")
+
+    # Test 4: parallel streaming gives the same output
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Parallel streaming")
+    result = "".join(translate_stream("en", "es", io.StringIO(SAMPLE * 20), max_chars=40, workers=4))
+    if result == (SAMPLE * 20).upper():
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Output differs from the input")
+
+    utils._translate_miss = original_translate
+    utils._translation_cache = original_cache
+
+    # Summary
+    print("\n" + "=" * 50)
+    print(f"📊 Test Summary: {passed_tests}/{total_tests} tests passed")
+
+    if passed_tests == total_tests:
+        print("🎉 All tests passed! Streaming translation is working correctly.")
+        return True
+    else:
+        print("⚠️  Some tests failed. Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = test_streaming()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Test script for template-aware translation.
+Tests template matching, local filling of interpolated values and the
+per-template report with the local backend (no network needed).
+"""
+
+import sys
+import os
+import tempfile
+import time
+
+# Add the current directory to the Python path to import utils
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import utils
+import backends
+from backends import LocalTranslationBackend
+from templates import TemplateRegistry, fill_template
+
+TEMPLATE = "Hi {name}, your order {order} has shipped"
+
+class RecordingBackend(LocalTranslationBackend):
+    """Local backend that remembers what it was sent and can drop placeholders."""
+
+    def __init__(self, drop=None):
+        super().__init__(phrasebook={})
+        self.sent = []
+        self.drop = drop
+
+    def translate(self, source_lang, target_lang, text):
+        self.sent.append(text)
+        result = super().translate(source_lang, target_lang, text)
+        return result.replace(self.drop, "") if self.drop else result
+
+def _fresh(templates=(), **kwargs):
+    """Use a new recording backend, an empty memory-only cache and a new registry."""
+    backend = backends.set_translation_backend(RecordingBackend(**kwargs))
+    utils._translation_cache = utils.TranslationCache(path=None)
+    utils.configure_templates(templates=templates)
+    return backend
+
+def test_templates():
+    """Test template matching, local filling, fallbacks and the hit report."""
+
+    print("🧩 Testing Template-Aware Translation")
+    print("=" * 50)
+
+    original_backend = backends._active_translation
+    original_cache = utils._translation_cache
+    original_templates = utils._templates
+    original_masker = utils._masker
+    utils.configure_masking()
+
+    passed_tests = 0
+    total_tests = 0
+
+    # Test 1: templates are recognized and their values extracted
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Template matching")
+    registry = TemplateRegistry([TEMPLATE, "Welcome back, {{ user }}!", "%(count)s new messages for {name}, {name}"])
+    first = registry.match("Hi Ana María, your order A-17 has shipped")
+    second = registry.match("Welcome back, Jo!")
+    repeated = registry.match("3 new messages for Li, Li")
+    mismatched = registry.match("3 new messages for Li, Bo")
+    try:
+        TemplateRegistry(["Hello %s"])
+        rejected = False
+    except ValueError:
+        rejected = True
+    if (first.values == {"name": "Ana María", "order": "A-17"} and second.values == {"user": "Jo"}
+            and repeated.values == {"count": "3", "name": "Li"} and mismatched is None
+            and registry.match("Your order has shipped") is None and rejected):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {first}, {second}, {repeated}, {mismatched}")
+
+    # Test 2: values are filled into reordered translations, damaged ones are rejected
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Filling translated templates")
+    values = {"name": "Ana", "order": "17"}
+    filled = fill_template("Tu pedido {order} ha sido enviado, {name}", values)
+    lost = fill_template("Tu pedido ha sido enviado, {name}", values)
+    invented = fill_template("{greeting} {name}, pedido {order}", values)
+    if filled == "Tu pedido 17 ha sido enviado, Ana" and lost is None and invented is None:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {filled!r}, {lost!r}, {invented!r}")
+
+    # Test 3: personalized notifications cost one backend call per template
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: One backend call per template")
+    backend = _fresh([TEMPLATE])
+    names = [f"Customer {chr(65 + i % 26)}{chr(97 + i // 26 % 26)}" for i in range(1000)]
+    messages = [TEMPLATE.format(name=name, order=f"X{i}") for i, name in enumerate(names)]
+    results = [utils.translate_text("en", "es", message) for message in messages]
+    report = utils.get_template_report()
+    if (results == [f"[es] {message}" for message in messages] and backend.sent == ["Hi ⟦0⟧, your order ⟦1⟧ has shipped"]
+            and report[0]["template"] == TEMPLATE and report[0]["uses"] == 1000
+            and report[0]["backend_calls"] == 1 and report[0]["hit_rate"] == 0.999):
+        print(f"   ✅ PASSED - {report[0]['saved_calls']} backend calls saved")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {results[:2]}..., backend saw {backend.sent[:3]}, report {report[:1]}")
+
+    # Test 4: skeletons found by masking are reported too
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Masked skeletons in the report")
+    backend = _fresh()
+    for order in (101, 202, 303):
+        utils.translate_text("en", "fr", f"Order {order} is ready")
+    utils.translate_text("en", "fr", "Good morning")
+    report = utils.get_template_report()
+    if report == [{"template": "Order ⟦0⟧ is ready", "registered": False, "uses": 3, "backend_calls": 1,
+                   "saved_calls": 2, "hit_rate": 0.6667}]:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {report}")
+
+    # Test 5: batches fill templates locally as well
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Templates in translate_many")
+    backend = _fresh([TEMPLATE, "Welcome back, {user}!"])
+    texts = messages[:50] + ["Welcome back, Jo!", "Welcome back, Sam!", "Thanks"]
+    results = utils.translate_many("en", "de", texts)
+    uses = {row["template"]: (row["uses"], row["backend_calls"]) for row in utils.get_template_report()}
+    if (results == [f"[de] {text}" for text in texts] and backend.calls == 1
+            and uses == {TEMPLATE: (50, 1), "Welcome back, {user}!": (2, 1)}):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {results[-3:]}, {backend.calls} backend calls, report {uses}")
+
+    # Test 6: a translation that loses a placeholder is redone with the full text
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Fallback when a placeholder is lost")
+    backend = _fresh([TEMPLATE], drop="{name}")
+    utils.configure_masking(kinds=None)
+    try:
+        single = utils.translate_text("en", "it", messages[0])
+        batch = utils.translate_many("en", "it", [messages[1]])
+    finally:
+        utils.configure_masking()
+    if (single == f"[it] {messages[0]}" and batch == [f"[it] {messages[1]}"]
+            and backend.sent[0] == TEMPLATE and messages[0] in backend.sent and messages[1] in backend.sent):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {single!r} and {batch}, backend saw {backend.sent}")
+
+    # Test 7: templates can be loaded from TRANSLATOR_TEMPLATES
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Templates from a file")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "templates.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"{TEMPLATE}\n\nWelcome back, {{user}}!\n")
+        os.environ["TRANSLATOR_TEMPLATES"] = path
+        try:
+            loaded = utils._templates_from_env()
+        finally:
+            del os.environ["TRANSLATOR_TEMPLATES"]
+    if len(loaded) == 2 and loaded.match("Welcome back, Jo!").values == {"user": "Jo"}:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Loaded {len(loaded)} templates")
+
+    # Test 8: matching stays in microseconds with a large catalogue
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Matching speed with 2000 templates")
+    words = ["order", "account", "payment", "invoice", "reminder", "delivery", "review", "refund"]
+    catalogue = [f"{words[i % 8].capitalize()} {words[i // 8 % 8]} {{name}} step {i} {{value}} {words[i // 64 % 8]}"
+                 for i in range(2000)]
+    registry = TemplateRegistry(catalogue)
+    texts = [template.replace("{name}", "Bob").replace("{value}", "7") for template in catalogue[::20]]
+    texts += ["Something that is not a template at all"] * len(texts)
+    registry.match(texts[0])
+    start = time.perf_counter()
+    matched = [registry.match(text) for text in texts]
+    per_text = (time.perf_counter() - start) / len(texts)
+    if per_text < 0.0001 and [match.template for match in matched if match] == catalogue[::20]:
+        print(f"   ✅ PASSED - {per_text * 1e6:.1f}µs per lookup")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {per_text * 1e6:.1f}µs per lookup")
+
+    backends._active_translation = original_backend
+    utils._translation_cache = original_cache
+    utils._templates = original_templates
+    utils._masker = original_masker
+
+    # Summary
+    print("\n" + "=" * 50)
+    print(f"📊 Test Summary: {passed_tests}/{total_tests} tests passed")
+
+    if passed_tests == total_tests:
+        print("🎉 All tests passed! Template-aware translation is working correctly.")
+        return True
+    else:
+        print("⚠️  Some tests failed. Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = test_templates()
+    sys.exit(0 if success else 1)
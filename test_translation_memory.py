@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test script for the segment-level translation memory.
+Tests TranslationMemory and its use by translate_text with the local backend (no network needed).
+"""
+
+import sys
+import os
+import tempfile
+import time
+
+# Add the current directory to the Python path to import utils
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import utils
+import backends
+from backends import LocalTranslationBackend
+from translation_memory import TranslationMemory
+
+DOC_A = "Welcome to our store. Shipping is free over $50.\n\nReturns are accepted within 30 days."
+DOC_B = "Welcome to our store. New arrivals every week!\n\nReturns are accepted within 30 days."
+
+def test_translation_memory():
+    """Test segment reuse across documents, reassembly and persistence."""
+
+    print("🧠 Testing Translation Memory")
+    print("=" * 50)
+
+    tmp_dir = tempfile.mkdtemp()
+    db_path = os.path.join(tmp_dir, "tm.sqlite3")
+    saved = (backends._active_translation, utils._translation_cache, utils._translation_memory)
+    backend = backends.set_translation_backend(LocalTranslationBackend(phrasebook={}))
+    utils._translation_cache = utils.TranslationCache(path=None)
+    memory = utils.configure_translation_memory(path=db_path)
+
+    passed_tests = 0
+    total_tests = 0
+
+    # Test 1: the first document is translated segment by segment and reassembled
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Segment translation and reassembly")
+    result = utils.translate_text("en", "es", DOC_A)
+    expected = ("[es] Welcome to our store. [es] Shipping is free over $50.\n\n"
+                "[es] Returns are accepted within 30 days.")
+    if result == expected and backend.calls == 1:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {result!r} with {backend.calls} backend calls")
+
+    # Test 2: a second document only sends its unseen segment
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Shared segments are reused")
+    backend.phrasebook[("en", "es", "New arrivals every week!")] = "¡Novedades cada semana!"
+    utils.translate_text("en", "es", DOC_B)
+    stats = memory.stats()
+    if stats["segments"] == 4 and stats["segments_reused"] == 2:
+        print(f"   ✅ PASSED - {stats}")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - {stats}")
+
+    # Test 3: a reopened store serves segments without the backend
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Persistence")
+    memory.close()
+    reopened = TranslationMemory(path=db_path)
+    found = reopened.get_many("en", "es", ["New arrivals every week!", "Unknown sentence."])
+    if found == {"New arrivals every week!": "¡Novedades cada semana!"}:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {found}")
+    reopened.close()
+
+    # Test 4: a large store opens instantly and looks up by hash
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Large store open and lookup time")
+    large_path = os.path.join(tmp_dir, "large.sqlite3")
+    large = TranslationMemory(path=large_path)
+    large.put_many("en", "de", [(f"sentence {i}.", f"Satz {i}.") for i in range(100000)])
+    large.close()
+    start = time.perf_counter()
+    large = TranslationMemory(path=large_path)
+    found = large.get_many("en", "de", ["sentence 98765."])
+    elapsed = time.perf_counter() - start
+    large.close()
+    if found == {"sentence 98765.": "Satz 98765."} and elapsed < 0.5:
+        print(f"   ✅ PASSED - Open + lookup in {elapsed * 1000:.1f} ms")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {found} in {elapsed:.3f}s")
+
+    # Test 5: batch translation reuses and fills the memory as well
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Translation memory in translate_many")
+    memory = utils.configure_translation_memory()
+    utils._translation_cache = utils.TranslationCache(path=None)
+    backend.calls = 0
+    utils.translate_text("en", "fr", "Welcome to our store. Shipping is free.")
+    sent = []
+    original_translate = backend.translate
+    backend.translate = lambda source_lang, target_lang, text: sent.append(text) or original_translate(
+        source_lang, target_lang, text)
+    try:
+        results = utils.translate_many("en", "fr", ["Welcome to our store. Returns are easy.",
+                                                    "Shipping is free. Welcome to our store."])
+        stored = memory.get_many("en", "fr", ["Returns are easy."])
+    finally:
+        del backend.translate
+    if (results == ["[fr] Welcome to our store. [fr] Returns are easy.", "[fr] Shipping is free. [fr] Welcome to our store."]
+            and sent == ["Returns are easy."] and stored == {"Returns are easy.": "[fr] Returns are easy."}):
+        print(f"   ✅ PASSED - {memory.stats()['segments_reused']} segments reused")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {results}, backend saw {sent}, stored {stored}")
+    memory.close()
+
+    backends._active_translation, utils._translation_cache, utils._translation_memory = saved
+
+    # Summary
+    print("\n" + "=" * 50)
+    print(f"📊 Test Summary: {passed_tests}/{total_tests} tests passed")
+
+    if passed_tests == total_tests:
+        print("🎉 All tests passed! Translation memory is working correctly.")
+        return True
+    else:
+        print("⚠️  Some tests failed. Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = test_translation_memory()
+    sys.exit(0 if success else 1)
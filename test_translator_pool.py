@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test script for translator pooling.
+Tests that pooled GoogleTranslators send their requests through the pool's
+session without patching deep_translator for the rest of the process. A fake
+session answers the requests, so no network access is needed.
+"""
+
+import sys
+import os
+
+# Add the current directory to the Python path to import translator_pool
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import requests
+import deep_translator.google
+from translator_pool import TranslatorPool
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, text):
+        self.text = f'<div class="t0">{text}</div>'
+
+    def close(self):
+        pass
+
+class FakeSession:
+    """Session stand-in that answers every GET with a canned translation."""
+
+    def __init__(self, answer):
+        self.answer = answer
+        self.calls = []
+        self.closed = False
+
+    def get(self, url, **kwargs):
+        self.calls.append(kwargs)
+        return FakeResponse(self.answer)
+
+    def close(self):
+        self.closed = True
+
+def test_translator_pool():
+    """Test session routing and that deep_translator's module stays untouched."""
+
+    print("🔌 Testing Translator Pool")
+    print("=" * 50)
+
+    passed_tests = 0
+    total_tests = 0
+
+    # Test 1: translations go through the pool's session, with a timeout
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Requests use the pool's session")
+    session = FakeSession("hola")
+    pool = TranslatorPool(session=session)
+    translation = pool.get("en", "es").translate("hello")
+    if (translation == "hola" and len(session.calls) == 1 and session.calls[0]["timeout"] > 0
+            and session.calls[0]["params"]["q"] == "hello"):
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {translation!r}, {session.calls}")
+
+    # Test 2: deep_translator itself is not patched
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: deep_translator.google keeps the requests module")
+    if deep_translator.google.requests is requests:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - deep_translator.google.requests is {deep_translator.google.requests!r}")
+
+    # Test 3: each pool keeps its own session, however many pools exist
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: Pools do not share sessions")
+    other_session = FakeSession("bonjour")
+    other_pool = TranslatorPool(session=other_session)
+    first = pool.get("en", "fr").translate("hello")
+    second = other_pool.get("en", "fr").translate("hello")
+    if first == "hola" and second == "bonjour" and len(session.calls) == 2 and len(other_session.calls) == 1:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - Got {first!r} and {second!r}")
+
+    # Test 4: closing a pool closes its session only
+    total_tests += 1
+    print(f"\n📝 Test {total_tests}: close() closes the pool's session")
+    pool.close()
+    if session.closed and not other_session.closed and deep_translator.google.requests is requests:
+        print(f"   ✅ PASSED")
+        passed_tests += 1
+    else:
+        print(f"   ❌ FAILED - closed={session.closed}, other closed={other_session.closed}")
+    other_pool.close()
+
+    # Summary
+    print("\n" + "=" * 50)
+    print(f"📊 Test Summary: {passed_tests}/{total_tests} tests passed")
+
+    if passed_tests == total_tests:
+        print("🎉 All tests passed! Translator pooling is working correctly.")
+        return True
+    else:
+        print("⚠️  Some tests failed. Please check the implementation.")
+        return False
+
+if __name__ == "__main__":
+    success = test_translator_pool()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,295 @@
+"""
+Segment-level translation memory for the Language Translation Tool.
+Splits inputs into sentence segments, reuses stored translations of segments
+seen before (in any document) and sends only unseen segments to the backend.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict, deque, namedtuple
+from typing import Callable, Dict, List, Optional, Tuple
+
+from chunking import split_segments, split_whitespace
+from fuzzy_index import FuzzyIndex
+from masking import renumber_sentinels, restore_sentinel_numbers
+
+# A stored segment served in place of a segment that was not in the memory
+FuzzyMatch = namedtuple("FuzzyMatch", ["segment", "matched_source", "translation", "score"])
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS segments (
+    key INTEGER PRIMARY KEY,
+    pair TEXT NOT NULL DEFAULT '',
+    source TEXT NOT NULL,
+    translation TEXT NOT NULL
+)
+"""
+
+# SQLite limits the number of bound parameters per statement
+_LOOKUP_BATCH = 500
+
+
+def segment_key(source_lang: str, target_lang: str, segment: str) -> int:
+    """Return the signed 64-bit hash identifying a segment for a language pair."""
+    digest = hashlib.blake2b(
+        f"{source_lang}\0{target_lang}\0{segment}".encode("utf-8"), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class TranslationMemory:
+    """
+    Hash-indexed store of segment translations.
+
+    Each row is just the 64-bit segment hash (the table's integer primary key,
+    so lookups never scan) plus the source and translated text. The source is
+    kept to rule out hash collisions. Opening a store does not read it into
+    memory, so million-segment memories are available immediately; a small
+    LRU tier keeps the hottest segments in memory.
+    """
+
+    def __init__(self, path: Optional[str] = None, memory_size: int = 10000,
+                 fuzzy_threshold: Optional[float] = None):
+        """
+        Args:
+            path (str): SQLite file path, or None for a memory-only store
+            memory_size (int): Number of segments kept in the in-memory tier
+                (unbounded for a memory-only store)
+            fuzzy_threshold (float): Serve stored segments at least this similar
+                (e.g. 0.95) to an unseen segment instead of calling the backend
+                (None = exact matches only). The fuzzy index of an on-disk store is
+                built here, once, rather than on the first lookup
+        """
+        self.path = path
+        self.memory_size = memory_size
+        self.fuzzy_threshold = fuzzy_threshold
+        self._indexes: Dict[str, FuzzyIndex] = {}
+        self.recent_fuzzy_matches = deque(maxlen=100)
+        self.segments_fuzzy = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        self.segments_seen = 0
+        self.segments_reused = 0
+
+        if self.path:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._connection()
+            if self.fuzzy_threshold is not None:
+                self._load_indexes()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's SQLite connection, creating it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(segments)")]
+            if "pair" not in columns:
+                conn.execute("ALTER TABLE segments ADD COLUMN pair TEXT NOT NULL DEFAULT ''")
+            self._local.conn = conn
+        return conn
+
+    def _remember(self, key: int, source: str, translation: str) -> None:
+        """Insert into the memory tier (caller holds the lock)."""
+        self._memory[key] = (source, translation)
+        self._memory.move_to_end(key)
+        if self.path:
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def get_many(self, source_lang: str, target_lang: str, segments: List[str]) -> Dict[str, str]:
+        """
+        Look up several segments at once.
+
+        Returns:
+            dict: Stored translations keyed by segment (misses are absent)
+        """
+        found = {}
+        pending = {}
+        with self._lock:
+            for segment in segments:
+                key = segment_key(source_lang, target_lang, segment)
+                entry = self._memory.get(key)
+                if entry is not None and entry[0] == segment:
+                    self._memory.move_to_end(key)
+                    found[segment] = entry[1]
+                else:
+                    pending[key] = segment
+
+        if self.path and pending:
+            conn = self._connection()
+            keys = list(pending)
+            for i in range(0, len(keys), _LOOKUP_BATCH):
+                batch = keys[i:i + _LOOKUP_BATCH]
+                rows = conn.execute(
+                    f"SELECT key, source, translation FROM segments WHERE key IN ({','.join('?' * len(batch))})",
+                    batch,
+                ).fetchall()
+                with self._lock:
+                    for key, source, translation in rows:
+                        if pending[key] == source:
+                            found[source] = translation
+                            self._remember(key, source, translation)
+        return found
+
+    def put_many(self, source_lang: str, target_lang: str, pairs: List[Tuple[str, str]]) -> None:
+        """Store (segment, translation) pairs."""
+        pair = f"{source_lang}-{target_lang}"
+        rows = [(segment_key(source_lang, target_lang, source), pair, source, translation)
+                for source, translation in pairs if translation is not None]
+        with self._lock:
+            index = self._indexes.get(pair)
+            if index is None and self.fuzzy_threshold is not None:
+                index = self._indexes[pair] = FuzzyIndex()
+            for key, _, source, translation in rows:
+                self._remember(key, source, translation)
+                if index is not None:
+                    index.add(source, translation)
+        if self.path and rows:
+            conn = self._connection()
+            with conn:
+                conn.execute("BEGIN")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO segments (key, pair, source, translation) VALUES (?, ?, ?, ?)", rows
+                )
+
+    def _load_indexes(self) -> None:
+        """Index every stored segment for fuzzy lookups; put_many keeps the indexes current after this."""
+        rows = self._connection().execute("SELECT pair, source, translation FROM segments WHERE pair != ''")
+        # Under the lock, so segments stored meanwhile are not lost from the index
+        with self._lock:
+            for pair, source, translation in rows:
+                index = self._indexes.get(pair)
+                if index is None:
+                    index = self._indexes[pair] = FuzzyIndex()
+                index.add(source, translation)
+
+    def find_fuzzy(self, source_lang: str, target_lang: str, segment: str,
+                   threshold: Optional[float] = None) -> Optional[FuzzyMatch]:
+        """
+        Return the most similar stored segment at or above threshold
+        (default: the memory's fuzzy_threshold), or None. Only memories opened
+        with a fuzzy_threshold keep the index this searches.
+        """
+        threshold = threshold if threshold is not None else self.fuzzy_threshold
+        if threshold is None:
+            return None
+        with self._lock:
+            index = self._indexes.get(f"{source_lang}-{target_lang}")
+            matches = index.search(segment, threshold) if index is not None else []
+        if not matches:
+            return None
+        source, translation, score = matches[0]
+        return FuzzyMatch(segment, source, translation, score)
+
+    def translate(self, source_lang: str, target_lang: str, text: str,
+                  translate_segments: Callable[[str, str, List[str]], List[str]]) -> str:
+        """
+        Translate text segment by segment, calling translate_segments only for
+        segments that are not in the memory yet. With a fuzzy_threshold, unseen
+        segments close enough to a stored one reuse its translation; those
+        matches are listed in recent_fuzzy_matches for review.
+
+        Args:
+            source_lang (str): Source language code
+            target_lang (str): Target language code
+            text (str): Text to translate
+            translate_segments (callable): Backend call taking (source_lang, target_lang, segments)
+                and returning their translations in order
+
+        Returns:
+            str: Translated text with the original whitespace between segments
+        """
+        return self.translate_many(source_lang, target_lang, [text], translate_segments)[0]
+
+    def translate_many(self, source_lang: str, target_lang: str, texts: List[str],
+                       translate_segments: Callable[[str, str, List[str]], List[str]]) -> List[str]:
+        """
+        Translate several texts like translate(), with one memory lookup and a single
+        translate_segments call for the unseen segments of all of them.
+
+        Returns:
+            list: Translated texts in input order
+        """
+        return [translation for translation, _ in self.translate_many_flagged(
+            source_lang, target_lang, texts, translate_segments)]
+
+    def translate_many_flagged(self, source_lang: str, target_lang: str, texts: List[str],
+                               translate_segments: Callable[[str, str, List[str]], List[str]]) -> List[Tuple[str, bool]]:
+        """
+        Translate several texts like translate_many(), also telling whether each
+        translation is exact: False when any of its segments came from a fuzzy match,
+        so it should not be cached as the translation of the text.
+
+        Returns:
+            list: (translation, exact) tuples in input order
+        """
+        texts_parts = [[split_whitespace(segment) for segment in split_segments(text)] for text in texts]
+        # Masking sentinels are numbered per segment so segments match across texts
+        keys = {core: renumber_sentinels(core) for parts in texts_parts for _, core, _ in parts if core}
+        cores = list(dict.fromkeys(key for key, _ in keys.values()))
+
+        found = self.get_many(source_lang, target_lang, cores)
+        misses = [core for core in cores if core not in found]
+        approximate = set()
+        if misses and self.fuzzy_threshold is not None:
+            remaining = []
+            for core in misses:
+                match = self.find_fuzzy(source_lang, target_lang, core)
+                if match is None:
+                    remaining.append(core)
+                else:
+                    found[core] = match.translation
+                    self.recent_fuzzy_matches.append(match)
+                    approximate.add(core)
+            misses = remaining
+        fuzzy = len(approximate)
+        if misses:
+            translations = translate_segments(source_lang, target_lang, misses)
+            found.update(zip(misses, translations))
+            self.put_many(source_lang, target_lang, list(zip(misses, translations)))
+
+        with self._lock:
+            self.segments_seen += len(cores)
+            self.segments_reused += len(cores) - len(misses) - fuzzy
+            self.segments_fuzzy += fuzzy
+
+        return [
+            ("".join(
+                leading + (restore_sentinel_numbers(found[keys[core][0]], keys[core][1]) if core else "") + trailing
+                for leading, core, trailing in parts
+            ), not any(core and keys[core][0] in approximate for _, core, _ in parts))
+            for parts in texts_parts
+        ]
+
+    def __len__(self) -> int:
+        if self.path:
+            return self._connection().execute("SELECT COUNT(*) FROM segments").fetchone()[0]
+        return len(self._memory)
+
+    def stats(self) -> dict:
+        """Return segment reuse counters and the store size."""
+        with self._lock:
+            seen, reused, fuzzy = self.segments_seen, self.segments_reused, self.segments_fuzzy
+        return {
+            "segments": len(self),
+            "segments_seen": seen,
+            "segments_reused": reused,
+            "segments_fuzzy": fuzzy,
+            "reuse_ratio": reused / seen if seen else 0.0,
+        }
+
+    def close(self) -> None:
+        """Close this thread's SQLite connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
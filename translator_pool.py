@@ -0,0 +1,101 @@
+"""
+Translator pooling for the Language Translation Tool.
+Reuses GoogleTranslator instances per language pair and routes their HTTP
+requests through one shared keep-alive session.
+"""
+
+import threading
+import types
+
+import requests
+from requests.adapters import HTTPAdapter
+from deep_translator import GoogleTranslator
+
+from resilience import time_remaining
+
+# Seconds a request may take when no deadline applies
+DEFAULT_TIMEOUT = 10.0
+
+
+class _SessionRequests:
+    """
+    Stand-in for the `requests` module seen by GoogleTranslator.translate.
+    GoogleTranslator calls `requests.get` directly and offers no way to pass
+    a session, so SessionGoogleTranslator runs it against this shim, which also
+    gives every request a timeout (the time left before the call's deadline).
+    """
+
+    def __init__(self, session: requests.Session, timeout: float = DEFAULT_TIMEOUT):
+        self.session = session
+        self.timeout = timeout
+
+    def get(self, *args, **kwargs):
+        remaining = time_remaining()
+        kwargs.setdefault("timeout", self.timeout if remaining is None else min(self.timeout, max(remaining, 0.01)))
+        return self.session.get(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+
+def _with_requests(function, requests_module):
+    """Return a copy of function that resolves the global name `requests` to requests_module."""
+    namespace = dict(function.__globals__, requests=requests_module)
+    bound = types.FunctionType(function.__code__, namespace, function.__name__,
+                               function.__defaults__, function.__closure__)
+    bound.__kwdefaults__ = function.__kwdefaults__
+    return bound
+
+
+class SessionGoogleTranslator(GoogleTranslator):
+    """
+    GoogleTranslator whose requests go through a pool's session. deep_translator's
+    own translate() is reused with `requests` bound to the session, so the
+    deep_translator.google module (and every other GoogleTranslator) is untouched.
+    """
+
+    def __init__(self, translate_func, **kwargs):
+        super().__init__(**kwargs)
+        self._translate_func = translate_func
+
+    def translate(self, text: str, **kwargs) -> str:
+        return self._translate_func(self, text, **kwargs)
+
+
+def create_session(pool_size: int = 32) -> requests.Session:
+    """Create a session whose connection pool can serve pool_size concurrent requests."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class TranslatorPool:
+    """
+    Thread-safe pool of GoogleTranslator instances keyed by language pair.
+
+    GoogleTranslator keeps per-request state on the instance, so each thread
+    gets its own translator per pair; the underlying HTTP connections are
+    shared by every thread through the session.
+    """
+
+    def __init__(self, session: requests.Session = None, pool_size: int = 32):
+        self.session = session or create_session(pool_size)
+        self._local = threading.local()
+        self._translate_func = _with_requests(GoogleTranslator.translate, _SessionRequests(self.session))
+
+    def get(self, source_lang: str, target_lang: str) -> GoogleTranslator:
+        """Return this thread's translator for the language pair, creating it on first use."""
+        translators = getattr(self._local, "translators", None)
+        if translators is None:
+            translators = self._local.translators = {}
+        translator = translators.get((source_lang, target_lang))
+        if translator is None:
+            translator = SessionGoogleTranslator(self._translate_func, source=source_lang, target=target_lang)
+            translators[(source_lang, target_lang)] = translator
+        return translator
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self.session.close()
@@ -1,23 +1,454 @@
-from deep_translator import GoogleTranslator
-from typing import Optional
-from gtts import gTTS
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
 import os
 import time
-from functools import lru_cache
+import asyncio
+import warnings
+import weakref
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from cache import TranslationCache, DEFAULT_CACHE_PATH
+from backends import get_translation_backend, get_tts_backend
+import metrics
+from normalization import TextNormalizer
+from translation_memory import TranslationMemory
+from chunking import iter_chunks, split_whitespace
+from audio_cache import AudioCache, DEFAULT_AUDIO_CACHE_DIR
+from singleflight import SingleFlight
+from resilience import CircuitOpenError, Resilience, RetryPolicy, is_retryable
+from language_detection import detect_language, has_language
+from masking import KINDS as MASK_KINDS, PassthroughMasker
+from templates import TemplateRegistry, fill_template
+import snapshot as snapshots
+from snapshot import Snapshot
+
+def _snapshot_from_env() -> Optional[Snapshot]:
+    """
+    Map the warm-start snapshot named by TRANSLATOR_SNAPSHOT. A missing or unreadable
+    file only means a cold start, so it is reported as a warning.
+    """
+    path = os.environ.get("TRANSLATOR_SNAPSHOT")
+    if not path:
+        return None
+    try:
+        return Snapshot(path)
+    except (OSError, ValueError) as e:
+        warnings.warn(f"Starting without the warm-start snapshot: {e}")
+        return None
+
+# Mapped at import, so new worker processes and Streamlit reruns start warm
+_snapshot = _snapshot_from_env()
+
+def _cache_from_env() -> TranslationCache:
+    """Build the translation cache from TRANSLATOR_CACHE_* environment variables."""
+    # An empty TRANSLATOR_CACHE_PATH disables the on-disk tier
+    path = os.environ.get("TRANSLATOR_CACHE_PATH", DEFAULT_CACHE_PATH) or None
+    ttl = os.environ.get("TRANSLATOR_CACHE_TTL")
+    return TranslationCache(
+        path=path,
+        max_entries=int(os.environ.get("TRANSLATOR_CACHE_SIZE", "100000")),
+        ttl=float(ttl) if ttl else None,
+        memory_size=int(os.environ.get("TRANSLATOR_CACHE_MEMORY_SIZE", "1000")),
+        stale_ttl=float(os.environ.get("TRANSLATOR_CACHE_STALE_TTL", "0")),
+        snapshot=_snapshot,
+        compact=os.environ.get("TRANSLATOR_CACHE_COMPACT", "0") not in ("", "0"),
+    )
+
+_translation_cache = _cache_from_env()
+
+def configure_cache(**kwargs) -> TranslationCache:
+    """
+    Replace the translation cache (see cache.TranslationCache for options).
+    The warm-start snapshot, if one is loaded, is kept unless snapshot is given.
+    
+    Returns:
+        TranslationCache: The new cache
+    """
+    global _translation_cache
+    _translation_cache.close()
+    kwargs.setdefault("snapshot", _snapshot)
+    _translation_cache = TranslationCache(**kwargs)
+    return _translation_cache
+
+def get_cache_stats() -> dict:
+    """Return hit/miss counters for the translation cache."""
+    return _translation_cache.stats()
+
+def load_snapshot(path: Optional[str]) -> Optional[Snapshot]:
+    """
+    Map a warm-start snapshot (see snapshot.py) behind the translation and audio
+    caches, replacing (and closing) the current one; None detaches it.
+    
+    Returns:
+        Snapshot: The mapped snapshot, or None
+    
+    Raises:
+        OSError: If the file cannot be opened
+        ValueError: If it is not a snapshot
+    """
+    global _snapshot
+    previous = _snapshot
+    _snapshot = Snapshot(path) if path else None
+    _translation_cache.snapshot = _snapshot
+    if previous is not None:
+        previous.close()
+    return _snapshot
+
+def export_snapshot(path: str, translations: int = 50000, clips: int = 500) -> dict:
+    """
+    Write the hottest translations and TTS clips of this process's caches to a
+    snapshot file for the next process to load with TRANSLATOR_SNAPSHOT.
+    
+    Returns:
+        dict: Number of translations and clips written and the file size in bytes
+    """
+    return snapshots.export_snapshot(path, _translation_cache, _audio_cache, translations, clips)
+
+def _normalizer_from_env() -> TextNormalizer:
+    """Build the text normalizer from TRANSLATOR_* environment variables."""
+    return TextNormalizer(
+        unicode_form=os.environ.get("TRANSLATOR_UNICODE_FORM", "NFC") or None,
+        collapse_whitespace=os.environ.get("TRANSLATOR_COLLAPSE_WHITESPACE", "1") != "0",
+        case_fold=os.environ.get("TRANSLATOR_CASE_FOLD", "0") not in ("", "0"),
+    )
+
+# Normalization applied to every text before cache lookup
+_normalizer = _normalizer_from_env()
+
+def configure_normalization(**kwargs) -> TextNormalizer:
+    """
+    Replace the text normalizer (see normalization.TextNormalizer for options).
+    
+    Returns:
+        TextNormalizer: The new normalizer
+    """
+    global _normalizer
+    _normalizer = TextNormalizer(**kwargs)
+    return _normalizer
+
+def _masker_from_env() -> PassthroughMasker:
+    """Build the passthrough masker from TRANSLATOR_MASK (comma-separated span kinds, empty to disable)."""
+    kinds = os.environ.get("TRANSLATOR_MASK", ",".join(MASK_KINDS))
+    return PassthroughMasker([kind.strip() for kind in kinds.split(",") if kind.strip()])
+
+# Code, URLs, e-mail addresses, placeholders and numbers bypass the backend
+_masker = _masker_from_env()
+
+def configure_masking(**kwargs) -> PassthroughMasker:
+    """
+    Replace the passthrough masker (see masking.PassthroughMasker for options),
+    e.g. configure_masking(kinds=["url", "placeholder"]) or kinds=None to disable it.
+    
+    Returns:
+        PassthroughMasker: The new masker
+    """
+    global _masker
+    _masker = PassthroughMasker(**kwargs)
+    return _masker
+
+def _templates_from_env() -> TemplateRegistry:
+    """Build the template registry from TRANSLATOR_TEMPLATES (a file with one template per line)."""
+    path = os.environ.get("TRANSLATOR_TEMPLATES")
+    if not path:
+        return TemplateRegistry()
+    with open(path, encoding="utf-8") as f:
+        return TemplateRegistry(line for line in f.read().splitlines() if line.strip())
+
+# Registered i18n templates are translated once and filled in locally
+_templates = _templates_from_env()
+
+def configure_templates(**kwargs) -> TemplateRegistry:
+    """
+    Replace the template registry (see templates.TemplateRegistry for options),
+    e.g. configure_templates(templates=["Hi {name}, your order {order} has shipped"]).
+    
+    Returns:
+        TemplateRegistry: The new registry
+    """
+    global _templates
+    _templates = TemplateRegistry(**kwargs)
+    return _templates
+
+def register_templates(templates: Union[str, Iterable[str]]) -> None:
+    """
+    Recognize one or more i18n templates ("Hi {name}, welcome back") in translated
+    text: the template is translated once and the values are filled in locally.
+    
+    Raises:
+        ValueError: If a template has no named placeholders
+    """
+    _templates.register(templates)
+
+def get_template_report(limit: Optional[int] = None) -> List[dict]:
+    """Return uses, backend calls and hit rate per template, most used first."""
+    return _templates.report(limit)
+
+def _translation_memory_from_env() -> Optional[TranslationMemory]:
+    """
+    Build the translation memory from TRANSLATOR_TM_PATH (unset = disabled, ":memory:" = in-process)
+    and TRANSLATOR_TM_FUZZY (similarity threshold for fuzzy matches, unset = exact only).
+    """
+    path = os.environ.get("TRANSLATOR_TM_PATH")
+    if not path:
+        return None
+    fuzzy = os.environ.get("TRANSLATOR_TM_FUZZY")
+    return TranslationMemory(path=None if path == ":memory:" else path,
+                             fuzzy_threshold=float(fuzzy) if fuzzy else None)
+
+_translation_memory = _translation_memory_from_env()
+
+def configure_translation_memory(enabled: bool = True, **kwargs) -> Optional[TranslationMemory]:
+    """
+    Enable segment-level translation memory (see translation_memory.TranslationMemory
+    for options), or disable it with enabled=False.
+    
+    Returns:
+        TranslationMemory: The new memory, or None if disabled
+    """
+    global _translation_memory
+    if _translation_memory is not None:
+        _translation_memory.close()
+    _translation_memory = TranslationMemory(**kwargs) if enabled else None
+    return _translation_memory
+
+def find_fuzzy_match(source_lang: str, target_lang: str, text: str, threshold: float = 0.95):
+    """
+    Find the stored translation-memory segment most similar to text.
+    
+    Args:
+        source_lang (str): Source language code
+        target_lang (str): Target language code
+        text (str): Segment to look up
+        threshold (float): Minimum similarity (0-1)
+        
+    Returns:
+        FuzzyMatch: (segment, matched_source, translation, score), or None if the
+            memory is disabled, has no fuzzy index (configured without fuzzy_threshold)
+            or nothing is similar enough
+    """
+    if _translation_memory is None:
+        return None
+    return _translation_memory.find_fuzzy(source_lang, target_lang, text.strip(), threshold)
+
+def _cache_lookup(source_lang: str, target_lang: str, text: str) -> Optional[str]:
+    """Return a cached translation without calling the backend, or None on a miss."""
+    if not metrics.registry.enabled:
+        return _translation_cache.get(source_lang, target_lang, text)
+    
+    start = time.perf_counter()
+    cached = _translation_cache.get(source_lang, target_lang, text)
+    pair = f"{source_lang}-{target_lang}"
+    metrics.CACHE_LOOKUP_SECONDS.observe(time.perf_counter() - start)
+    (metrics.CACHE_HITS if cached is not None else metrics.CACHE_MISSES).inc(pair=pair)
+    return cached
+
+def _resilience_from_env() -> Resilience:
+    """Build the retry/circuit-breaker settings from TRANSLATOR_* environment variables."""
+    # An empty (or zero) TRANSLATOR_DEADLINE lets retries run unbounded
+    deadline = os.environ.get("TRANSLATOR_DEADLINE", "30")
+    return Resilience(
+        retry=RetryPolicy(
+            attempts=int(os.environ.get("TRANSLATOR_RETRIES", "3")),
+            base_delay=float(os.environ.get("TRANSLATOR_RETRY_BASE_DELAY", "0.2")),
+            max_delay=float(os.environ.get("TRANSLATOR_RETRY_MAX_DELAY", "5")),
+        ),
+        deadline=float(deadline) if deadline and float(deadline) > 0 else None,
+        attempt_timeout=float(os.environ.get("TRANSLATOR_ATTEMPT_TIMEOUT", "10")),
+        failure_threshold=int(os.environ.get("TRANSLATOR_BREAKER_THRESHOLD", "5")),
+        reset_timeout=float(os.environ.get("TRANSLATOR_BREAKER_RESET", "30")),
+    )
+
+# Retries, deadlines and circuit breakers around every translation backend call
+_resilience = _resilience_from_env()
+
+def configure_resilience(**kwargs) -> Resilience:
+    """
+    Replace the retry and circuit-breaker settings (see resilience.Resilience for
+    options), e.g. configure_resilience(retry=RetryPolicy(attempts=5), deadline=10).
+    Circuits start closed again.
+    
+    Returns:
+        Resilience: The new settings
+    """
+    global _resilience
+    _resilience = Resilience(**kwargs)
+    return _resilience
+
+def get_resilience_stats() -> dict:
+    """Return retry/rejection counters and the state of each backend circuit."""
+    return _resilience.stats()
+
+def _call_backend(backend, source_lang: str, target_lang: str, func: Callable, *args):
+    """Call func(*args) with retries under the circuit breaker of the backend and language pair."""
+    return _resilience.call(f"{backend.name}:{source_lang}-{target_lang}", func, *args)
+
+def _backend_unavailable(e: Exception) -> bool:
+    """Whether a failure means the backend cannot be reached (so stale cache entries may be served)."""
+    return isinstance(e, CircuitOpenError) or is_retryable(e)
+
+# A detected source language is only trusted this confidently, on texts this long;
+# otherwise "auto" goes to the backend (the trigram profiles are small, and short
+# English strings like "Your session expired" can look French to them)
+AUTO_DETECT_CONFIDENCE = 0.99
+AUTO_DETECT_MIN_CHARS = 30
+
+# Return "auto" texts detected as the target language unchanged instead of calling the backend
+_skip_same_language = os.environ.get("TRANSLATOR_SKIP_SAME_LANGUAGE", "1") != "0"
+
+def configure_language_detection(skip_same_language: bool = True) -> None:
+    """
+    Enable or disable skipping texts detected as already being in the target language
+    (only when the source language is "auto"). Texts without letters (numbers, URLs,
+    punctuation) are always returned unchanged.
+    """
+    global _skip_same_language
+    _skip_same_language = skip_same_language
+
+def detect_source_language(text: str) -> str:
+    """
+    Detect the language of text offline (see language_detection.py).
+    
+    Returns:
+        str: Language code, or "auto" (left to the backend) if the text is ambiguous
+    """
+    return _trusted_language(text, detect_language(text))
+
+def _trusted_language(text: str, detection) -> str:
+    """Return the detected language if it is reliable enough to key the cache on, else "auto"."""
+    if detection is None or detection.confidence < AUTO_DETECT_CONFIDENCE or len(text) < AUTO_DETECT_MIN_CHARS:
+        return "auto"
+    return detection.language
+
+def _resolve_source(source_lang: str, target_lang: str, text: str) -> Optional[str]:
+    """
+    Return the source language to translate text from ("auto" replaced by the detected
+    language if it is trusted), or None if translating would leave it unchanged: the
+    source is the target, the text has no letters, or the source is "auto" and the text
+    is confidently detected as already being in the target language. An explicitly
+    chosen source language is never overridden by detection.
+    """
+    if source_lang == target_lang or not has_language(text):
+        return None
+    if source_lang != "auto":
+        return source_lang
+    detected = _trusted_language(text, detect_language(text))
+    if _skip_same_language and detected == target_lang:
+        return None
+    return detected
+
+# Identical translations or TTS requests in flight at the same time share one backend call
+_translate_flight = SingleFlight()
+_tts_flight = SingleFlight()
+
+# How a normalized text is translated: the resolved source language, the cache key
+# (the text, masked and/or replaced by its template) and what rebuilds the translation
+_Prepared = namedtuple("Prepared", ["source", "key", "spans", "match"])
+
+def _prepare(source_lang: str, target_lang: str, text: str) -> Optional[_Prepared]:
+    """
+    Derive the source language and cache key of a normalized text. Every entry point
+    (sync, async, engine, batch) goes through this, so they all share cache entries.
+    
+    Returns:
+        Prepared: The source language, cache key, masked spans and template match, or
+            None if translating would leave the text unchanged
+    """
+    source_lang = _resolve_source(source_lang, target_lang, text)
+    if source_lang is None:
+        return None
+    # A known template is translated as the template itself and filled in locally
+    match = _templates.match(text)
+    masked, spans = _masker.mask(match.template if match else text)
+    if (spans or match) and not has_language(masked):
+        return None
+    return _Prepared(source_lang, masked, spans, match)
+
+def _record_template(prepared: _Prepared, hit: bool) -> None:
+    """Count a use of the template (or masked skeleton) behind a prepared text in the report."""
+    if prepared.spans or prepared.match:
+        _templates.record(prepared.match.template if prepared.match else prepared.key, hit)
+
+def _lookup_prepared(target_lang: str, prepared: _Prepared) -> Optional[str]:
+    """Return the cached translation of a prepared key, or None on a miss."""
+    cached = _cache_lookup(prepared.source, target_lang, prepared.key)
+    _record_template(prepared, hit=cached is not None)
+    return cached
+
+def _restore_prepared(prepared: _Prepared, translated_text: str) -> Optional[str]:
+    """
+    Put masked spans and template values back into the translation of a prepared key.
+    
+    Returns:
+        str: The translation, or None if the backend lost a sentinel or placeholder
+    """
+    if not (prepared.spans or prepared.match):
+        return translated_text
+    restored = _masker.unmask(translated_text, prepared.spans)
+    if restored is not None and prepared.match is not None:
+        restored = fill_template(restored, prepared.match.values)
+    return restored
+
+def _translate_prepared(target_lang: str, text: str, prepared: _Prepared, cached: Optional[str] = None) -> str:
+    """Translate a prepared text after its cache lookup (cached is the hit, or None on a miss)."""
+    translated_text = cached
+    if translated_text is None:
+        translated_text = _translate_flight.do((prepared.source, target_lang, prepared.key), _translate_miss,
+                                               prepared.source, target_lang, prepared.key)
+    restored = _restore_prepared(prepared, translated_text) if translated_text is not None else None
+    if restored is not None or not (prepared.spans or prepared.match):
+        return restored
+    # The backend lost a sentinel or placeholder; translate the text as is
+    return _translate_key(prepared.source, target_lang, text)
 
-@lru_cache(maxsize=100)
 def _cached_translate(source_lang: str, target_lang: str, text: str) -> str:
     """Cached translation function for better performance."""
-    translator = GoogleTranslator(source=source_lang, target=target_lang)
-    return translator.translate(text)
+    prepared = _prepare(source_lang, target_lang, text)
+    if prepared is None:
+        return text
+    return _translate_prepared(target_lang, text, prepared, _lookup_prepared(target_lang, prepared))
+
+def _translate_key(source_lang: str, target_lang: str, text: str) -> str:
+    """Translate a normalized (and masked) text through the cache and the coalesced backend call."""
+    cached = _cache_lookup(source_lang, target_lang, text)
+    if cached is not None:
+        return cached
+    return _translate_flight.do((source_lang, target_lang, text), _translate_miss, source_lang, target_lang, text)
+
+def _translate_miss(source_lang: str, target_lang: str, text: str) -> str:
+    """
+    Translate a cache miss with the backend (or translation memory) and cache the result.
+    While the backend is unavailable, an expired cache entry is served if one is left.
+    """
+    try:
+        exact = True
+        if _translation_memory is not None:
+            # Reuse stored sentence translations, only unseen segments reach the backend
+            (translated_text, exact), = _translation_memory.translate_many_flagged(
+                source_lang, target_lang, [text], _backend_translate_many)
+        else:
+            backend = get_translation_backend()
+            with metrics.track(metrics.TRANSLATE_BACKEND_SECONDS, pair=f"{source_lang}-{target_lang}"):
+                translated_text = _call_backend(backend, source_lang, target_lang,
+                                                backend.translate, source_lang, target_lang, text)
+    except Exception as e:
+        stale = _translation_cache.get(source_lang, target_lang, text, allow_stale=True) if _backend_unavailable(e) else None
+        if stale is None:
+            raise
+        return stale
+    # Fuzzy translation-memory matches are approximate and are not cached as the exact translation
+    if translated_text is not None and exact:
+        _translation_cache.set(source_lang, target_lang, text, translated_text)
+    return translated_text
 
 def translate_text(source_lang: str, target_lang: str, text: str) -> str:
     """
-    Translate text from source language to target language using Google Translator.
-    Optimized with caching for better performance.
+    Translate text from source language to target language using the active
+    backend (Google Translator by default, see backends.py).
+    Optimized with caching for better performance. Text that translating would
+    not change (no letters, or already in the target language) is returned
+    without a backend call.
     
     Args:
-        source_lang (str): Source language code (e.g., 'en', 'es', 'fr')
+        source_lang (str): Source language code (e.g., 'en', 'es', 'fr'), or 'auto' to detect it
         target_lang (str): Target language code (e.g., 'en', 'es', 'fr')
         text (str): Text to translate
     
@@ -37,27 +468,306 @@ def translate_text(source_lang: str, target_lang: str, text: str) -> str:
     
     try:
         # Use cached translation for better performance
-        translated_text = _cached_translate(source_lang, target_lang, clean_text)
+        with metrics.track(metrics.TRANSLATE_SECONDS, metrics.TRANSLATE_IN_FLIGHT, metrics.TRANSLATE_ERRORS,
+                           pair=f"{source_lang}-{target_lang}"):
+            key, case = _normalizer.normalize(clean_text)
+            translated_text = _normalizer.restore(_cached_translate(source_lang, target_lang, key), case)
         return translated_text
         
     except Exception as e:
         # Raise a clear error if translation fails
-        error_msg = str(e)
-        if "timeout" in error_msg.lower() or "timed out" in error_msg.lower():
-            raise Exception("Translation request timed out. Please check your internet connection and try again.")
-        elif "connection" in error_msg.lower() or "network" in error_msg.lower():
-            raise Exception("Network connection error. Please check your internet connection and try again.")
+        raise _translation_error(e)
+
+def _translation_error(e: Exception) -> Exception:
+    """Map a backend exception to a user-facing translation error."""
+    error_msg = str(e)
+    if isinstance(e, CircuitOpenError):
+        return Exception(f"Translation service is temporarily unavailable. Please try again in {e.retry_in:.0f} seconds.")
+    elif isinstance(e, TimeoutError) or "timeout" in error_msg.lower() or "timed out" in error_msg.lower():
+        return Exception("Translation request timed out. Please check your internet connection and try again.")
+    elif isinstance(e, ConnectionError) or "connection" in error_msg.lower() or "network" in error_msg.lower():
+        return Exception("Network connection error. Please check your internet connection and try again.")
+    else:
+        return Exception(f"Translation failed: {error_msg}")
+
+# Google Translate rejects requests longer than this many characters
+MAX_REQUEST_CHARS = 5000
+
+# Texts are packed into one request separated by newlines, which the backend preserves
+_BATCH_SEPARATOR = "\n"
+
+def _pack_batches(texts: List[str], max_chars: int = MAX_REQUEST_CHARS) -> List[List[str]]:
+    """
+    Group texts into batches whose joined length stays under max_chars.
+    Texts that contain the separator or are too long on their own get a batch of their own.
+    """
+    batches = []
+    current = []
+    current_len = 0
+    for text in texts:
+        if _BATCH_SEPARATOR in text or len(text) > max_chars:
+            batches.append([text])
+            continue
+        added_len = len(text) + (len(_BATCH_SEPARATOR) if current else 0)
+        if current and current_len + added_len > max_chars:
+            batches.append(current)
+            current = []
+            current_len = 0
+            added_len = len(text)
+        current.append(text)
+        current_len += added_len
+    if current:
+        batches.append(current)
+    return batches
+
+def _translate_batch(backend, source_lang: str, target_lang: str, batch: List[str]) -> List[str]:
+    """Translate a packed batch with one request, falling back to one request per text."""
+    if len(batch) > 1:
+        joined = backend.translate(source_lang, target_lang, _BATCH_SEPARATOR.join(batch))
+        parts = joined.split(_BATCH_SEPARATOR) if joined else []
+        if len(parts) == len(batch):
+            return [part.strip() for part in parts]
+    return [backend.translate(source_lang, target_lang, text) for text in batch]
+
+def _backend_translate_many(source_lang: str, target_lang: str, texts: List[str]) -> List[str]:
+    """
+    Translate texts with the backend (no caching), packing them into as few requests as possible.
+    Each request is retried under the circuit breaker of the backend and language pair.
+    """
+    backend = get_translation_backend()
+    translated = []
+    for batch in _pack_batches(texts, backend.max_chars):
+        with metrics.track(metrics.TRANSLATE_BACKEND_SECONDS, pair=f"{source_lang}-{target_lang}"):
+            translated.extend(_call_backend(backend, source_lang, target_lang,
+                                            _translate_batch, backend, source_lang, target_lang, batch))
+    return translated
+
+def _translate_misses(source_lang: str, target_lang: str, texts: List[str]) -> List[tuple]:
+    """
+    Translate cache misses (no caching), reusing and filling the translation memory when it is enabled.
+    
+    Returns:
+        list: (translation, exact) tuples; exact is False for fuzzy translation-memory matches
+    """
+    if _translation_memory is not None:
+        return _translation_memory.translate_many_flagged(source_lang, target_lang, texts, _backend_translate_many)
+    return [(translated_text, True) for translated_text in _backend_translate_many(source_lang, target_lang, texts)]
+
+def translate_many(source_lang: str, target_lang: str, texts: List[str]) -> List[str]:
+    """
+    Translate many texts with as few backend requests as possible.
+    Duplicate inputs are translated once, cache hits are served first and the
+    remaining misses are packed into requests up to MAX_REQUEST_CHARS long.
+    
+    Args:
+        source_lang (str): Source language code (e.g., 'en', 'es', 'fr')
+        target_lang (str): Target language code (e.g., 'en', 'es', 'fr')
+        texts (list): Texts to translate
+    
+    Returns:
+        list: Translated texts in the same order as the input (empty inputs map to "")
+    
+    Raises:
+        Exception: If translation fails
+    """
+    normalized = [_normalizer.normalize(text.strip()) if text else ("", None) for text in texts]
+    results = {"": ""}
+    # text -> Prepared
+    keys = {}
+    # (source language, masked text) -> translation
+    translations = {}
+    # Masked misses grouped by source language (texts differ with source_lang="auto")
+    misses: Dict[str, Dict[str, None]] = {}
+    
+    for text in dict.fromkeys(key for key, _ in normalized):
+        if text in results:
+            continue
+        prepared = _prepare(source_lang, target_lang, text)
+        if prepared is None:
+            results[text] = text
+            continue
+        keys[text] = prepared
+        source, masked = prepared.source, prepared.key
+        if (source, masked) in translations or masked in misses.get(source, ()):
+            _record_template(prepared, hit=True)
+            continue
+        cached = _lookup_prepared(target_lang, prepared)
+        if cached is not None:
+            translations[(source, masked)] = cached
         else:
-            raise Exception(f"Translation failed: {error_msg}")
+            misses.setdefault(source, {})[masked] = None
+    
+    for source, source_misses in misses.items():
+        source_misses = list(source_misses)
+        try:
+            for text, (translated_text, exact) in zip(source_misses, _translate_misses(source, target_lang, source_misses)):
+                translations[(source, text)] = translated_text
+                if translated_text is not None and exact:
+                    _translation_cache.set(source, target_lang, text, translated_text)
+        except Exception as e:
+            # Serve expired entries while the backend is unavailable, if every miss has one
+            stale = [_translation_cache.get(source, target_lang, text, allow_stale=True)
+                     for text in source_misses] if _backend_unavailable(e) else [None]
+            if None in stale:
+                raise _translation_error(e)
+            translations.update(((source, text), translated_text) for text, translated_text in zip(source_misses, stale))
+    
+    for text, prepared in keys.items():
+        translated_text = translations[(prepared.source, prepared.key)]
+        if translated_text is not None:
+            try:
+                translated_text = _translate_prepared(target_lang, text, prepared, translated_text)
+            except Exception as e:
+                raise _translation_error(e)
+        results[text] = translated_text
+    
+    return [_normalizer.restore(results[key], case) for key, case in normalized]
 
-def text_to_speech(text: str, lang: str, output_file: str = "output.mp3") -> str:
+def translate_fanout(source_lang: str, target_langs: Iterable[str], text: str) -> Dict[str, str]:
     """
-    Convert text to speech using Google Text-to-Speech (gTTS).
+    Translate one text into several languages at once, e.g. to localize a UI
+    string into every supported language. Targets are translated concurrently on
+    the shared engine after a single normalization pass; cached targets never
+    reach the backend, and a target equal to the source returns the text as is.
+    
+    Args:
+        source_lang (str): Source language code (e.g., 'en')
+        target_langs (iterable): Target language codes (e.g., ['es', 'fr', 'de'])
+        text (str): Text to translate
+    
+    Returns:
+        dict: Translations keyed by target language code
+    
+    Raises:
+        ValueError: If text is empty or None
+        Exception: If any translation fails
+    """
+    if not text or text.strip() == "":
+        raise ValueError("Text cannot be empty or None")
+    
+    from engine import get_engine
+    
+    return get_engine().fanout(source_lang, target_langs, text)
+
+def translate_stream(source_lang: str, target_lang: str, source: Union[str, Iterable[str]],
+                     max_chars: int = MAX_REQUEST_CHARS, workers: int = 1) -> Iterator[str]:
+    """
+    Translate a large document chunk by chunk, yielding translated chunks in order.
+    The input is split on paragraph/sentence boundaries under max_chars and only a
+    bounded number of chunks is held in memory, whatever the document size.
+    Whitespace around each chunk is preserved, so "".join(...) reassembles the document.
+    
+    Args:
+        source_lang (str): Source language code (e.g., 'en', 'es', 'fr')
+        target_lang (str): Target language code (e.g., 'en', 'es', 'fr')
+        source (str or iterable): Text, or an iterable of text such as an open file
+        max_chars (int): Maximum characters per backend request
+        workers (int): Number of chunks translated in parallel
+    
+    Yields:
+        str: Translated chunks
+    
+    Raises:
+        Exception: If translation fails
+    """
+    if isinstance(source, str):
+        source = [source]
+    chunks = iter_chunks(source, max_chars)
+    
+    if workers <= 1:
+        for chunk in chunks:
+            leading, core, trailing = split_whitespace(chunk)
+            if not core:
+                yield chunk
+                continue
+            try:
+                translated_text = _cached_translate(source_lang, target_lang, core)
+            except Exception as e:
+                raise _translation_error(e)
+            yield leading + translated_text + trailing
+        return
+    
+    from engine import TranslationEngine
+    
+    pending = deque()
+    
+    def cores():
+        for chunk in chunks:
+            leading, core, trailing = split_whitespace(chunk)
+            pending.append((leading, trailing))
+            yield core
+    
+    # Chunks are not normalized: their internal whitespace is part of the document
+    with TranslationEngine(max_workers=workers, normalize=False) as engine:
+        for translated_text in engine.imap(source_lang, target_lang, cores()):
+            leading, trailing = pending.popleft()
+            yield leading + translated_text + trailing
+
+def _audio_cache_from_env() -> Optional[AudioCache]:
+    """Build the audio cache from TRANSLATOR_AUDIO_CACHE_* environment variables."""
+    # An empty TRANSLATOR_AUDIO_CACHE_DIR disables audio caching
+    directory = os.environ.get("TRANSLATOR_AUDIO_CACHE_DIR", DEFAULT_AUDIO_CACHE_DIR)
+    if not directory:
+        return None
+    return AudioCache(
+        directory=directory,
+        max_bytes=int(os.environ.get("TRANSLATOR_AUDIO_CACHE_MAX_BYTES", str(200 * 1024 * 1024))),
+    )
+
+_audio_cache = _audio_cache_from_env()
+
+def configure_audio_cache(**kwargs) -> Optional[AudioCache]:
+    """
+    Replace the audio cache (see audio_cache.AudioCache for options).
+    Passing directory=None disables audio caching.
+    
+    Returns:
+        AudioCache: The new cache, or None if caching is disabled
+    """
+    global _audio_cache
+    _audio_cache = AudioCache(**kwargs) if kwargs.get("directory", DEFAULT_AUDIO_CACHE_DIR) else None
+    return _audio_cache
+
+def get_audio_cache_stats() -> dict:
+    """Return hit/miss counters for the audio cache."""
+    return _audio_cache.stats() if _audio_cache else {}
+
+def _snapshot_clip(text: str, lang: str, slow: bool) -> Optional[bytes]:
+    """Return MP3 data from the warm-start snapshot, or None."""
+    snapshot = _snapshot
+    return snapshot.get_clip(text, lang, slow) if snapshot is not None else None
+
+def _synthesize(text: str, lang: str, slow: bool) -> bytes:
+    """Generate MP3 bytes with the active TTS backend, entirely in memory."""
+    with metrics.track(metrics.TTS_BACKEND_SECONDS, lang=lang):
+        audio_bytes = get_tts_backend().synthesize(text, lang, slow)
+    if not audio_bytes:
+        raise Exception("Audio file is empty")
+    if metrics.registry.enabled:
+        metrics.TTS_BYTES.inc(len(audio_bytes), lang=lang)
+    return audio_bytes
+
+def _synthesize_shared(text: str, lang: str, slow: bool) -> bytes:
+    """Synthesize an audio cache miss and store it; identical concurrent requests share the call."""
+    return _tts_flight.do((text, lang, slow), _synthesize_and_store, text, lang, slow)
+
+def _synthesize_and_store(text: str, lang: str, slow: bool) -> bytes:
+    audio_bytes = _synthesize(text, lang, slow)
+    audio_cache = _audio_cache
+    if audio_cache:
+        audio_cache.put_bytes(text, lang, slow, audio_bytes)
+    return audio_bytes
+
+def text_to_speech(text: str, lang: str, output_file: str = "output.mp3", slow: bool = False) -> str:
+    """
+    Convert text to speech using the active TTS backend (Google Text-to-Speech by default).
+    Audio is cached by content, so repeated text is copied from the cache without a network call.
     
     Args:
         text (str): Text to convert to speech
         lang (str): Language code (e.g., 'en', 'es', 'fr')
         output_file (str): Output MP3 file path (default: "output.mp3")
+        slow (bool): Read the text slowly (default: False)
     
     Returns:
         str: Path to the saved MP3 file
@@ -70,27 +780,305 @@ def text_to_speech(text: str, lang: str, output_file: str = "output.mp3") -> str
     if not text or text.strip() == "":
         raise ValueError("Text cannot be empty or None")
     
+    clean_text = text.strip()
+    audio_cache = _audio_cache
+    
     try:
-        # Create gTTS object
-        tts = gTTS(text=text.strip(), lang=lang, slow=False)
+        with metrics.track(metrics.TTS_SECONDS, metrics.TTS_IN_FLIGHT, metrics.TTS_ERRORS, lang=lang):
+            # Serve repeated requests from the warm-start snapshot or the audio cache
+            audio_bytes = _snapshot_clip(clean_text, lang, slow)
+            if audio_bytes is None and audio_cache:
+                cached_path = audio_cache.get(clean_text, lang, slow)
+                if cached_path:
+                    return audio_cache.copy_to(cached_path, output_file)
         
-        # Save the audio file
-        tts.save(output_file)
+            if audio_bytes is None:
+                audio_bytes = _synthesize_shared(clean_text, lang, slow)
         
-        # Verify the file was created and is not empty
-        if not os.path.exists(output_file):
-            raise Exception("Audio file was not created")
+            # Save the audio file
+            _write_file(output_file, audio_bytes)
         
-        file_size = os.path.getsize(output_file)
-        if file_size == 0:
-            raise Exception("Audio file is empty")
+            # Verify the file was created and is not empty
+            if not os.path.exists(output_file):
+                raise Exception("Audio file was not created")
         
-        return output_file
+            file_size = os.path.getsize(output_file)
+            if file_size == 0:
+                raise Exception("Audio file is empty")
+        
+            return output_file
         
     except Exception as e:
         # Raise a clear error if TTS conversion fails
         raise Exception(f"Text-to-speech conversion failed: {str(e)}")
 
+def text_to_speech_bytes(text: str, lang: str, slow: bool = False) -> bytes:
+    """
+    Convert text to speech and return the MP3 data without touching the filesystem
+    (apart from the audio cache, if enabled).
+    
+    Args:
+        text (str): Text to convert to speech
+        lang (str): Language code (e.g., 'en', 'es', 'fr')
+        slow (bool): Read the text slowly (default: False)
+    
+    Returns:
+        bytes: MP3 audio data
+    
+    Raises:
+        ValueError: If text is empty or None
+        Exception: If TTS conversion fails
+    """
+    if not text or text.strip() == "":
+        raise ValueError("Text cannot be empty or None")
+    
+    clean_text = text.strip()
+    audio_cache = _audio_cache
+    
+    try:
+        with metrics.track(metrics.TTS_SECONDS, metrics.TTS_IN_FLIGHT, metrics.TTS_ERRORS, lang=lang):
+            audio_bytes = _snapshot_clip(clean_text, lang, slow)
+            if audio_bytes is not None:
+                return audio_bytes
+            if audio_cache:
+                cached_path = audio_cache.get(clean_text, lang, slow)
+                if cached_path:
+                    with open(cached_path, "rb") as f:
+                        return f.read()
+        
+            return _synthesize_shared(clean_text, lang, slow)
+        
+    except Exception as e:
+        raise Exception(f"Text-to-speech conversion failed: {str(e)}")
+
+# Size of the pieces yielded when streaming cached audio
+AUDIO_STREAM_CHUNK_SIZE = 16 * 1024
+
+def text_to_speech_stream(text: str, lang: str, slow: bool = False) -> Iterator[bytes]:
+    """
+    Convert text to speech, yielding MP3 data as each segment arrives from the backend,
+    so an HTTP response or player can start before synthesis finishes.
+    
+    Args:
+        text (str): Text to convert to speech
+        lang (str): Language code (e.g., 'en', 'es', 'fr')
+        slow (bool): Read the text slowly (default: False)
+    
+    Yields:
+        bytes: Consecutive pieces of MP3 audio data
+    
+    Raises:
+        ValueError: If text is empty or None
+        Exception: If TTS conversion fails
+    """
+    if not text or text.strip() == "":
+        raise ValueError("Text cannot be empty or None")
+    
+    clean_text = text.strip()
+    audio_cache = _audio_cache
+    
+    try:
+        audio_bytes = _snapshot_clip(clean_text, lang, slow)
+        if audio_bytes is not None:
+            for start in range(0, len(audio_bytes), AUDIO_STREAM_CHUNK_SIZE):
+                yield audio_bytes[start:start + AUDIO_STREAM_CHUNK_SIZE]
+            return
+        if audio_cache:
+            cached_path = audio_cache.get(clean_text, lang, slow)
+            if cached_path:
+                with open(cached_path, "rb") as f:
+                    for piece in iter(lambda: f.read(AUDIO_STREAM_CHUNK_SIZE), b""):
+                        yield piece
+                return
+        
+        pieces = []
+        for piece in get_tts_backend().stream(clean_text, lang, slow):
+            pieces.append(piece)
+            yield piece
+        if metrics.registry.enabled:
+            metrics.TTS_BYTES.inc(sum(len(piece) for piece in pieces), lang=lang)
+        if audio_cache and pieces:
+            audio_cache.put_bytes(clean_text, lang, slow, b"".join(pieces))
+        
+    except Exception as e:
+        raise Exception(f"Text-to-speech conversion failed: {str(e)}")
+
+def text_to_speech_long_stream(text: str, lang: str, slow: bool = False, workers: int = 4,
+                               fetch_segment: Optional[Callable[[str, str, bool], bytes]] = None) -> Iterator[bytes]:
+    """
+    Convert long text to speech by fetching its segments concurrently.
+    The text is split on sentence boundaries into gTTS-sized segments, which are
+    synthesized on a bounded pool and yielded in order as soon as each one (and
+    every segment before it) is ready, so playback can start after the first segment.
+    
+    Args:
+        text (str): Text to convert to speech
+        lang (str): Language code (e.g., 'en', 'es', 'fr')
+        slow (bool): Read the text slowly (default: False)
+        workers (int): Number of segments fetched in parallel
+        fetch_segment (callable): Segment synthesizer taking (text, lang, slow) and
+            returning MP3 bytes (defaults to the active TTS backend)
+    
+    Yields:
+        bytes: MP3 audio data for each segment, in order
+    
+    Raises:
+        ValueError: If text is empty or None
+        Exception: If TTS conversion fails
+    """
+    if not text or text.strip() == "":
+        raise ValueError("Text cannot be empty or None")
+    
+    clean_text = text.strip()
+    audio_cache = _audio_cache
+    fetch_segment = fetch_segment or _synthesize
+    
+    try:
+        audio_bytes = _snapshot_clip(clean_text, lang, slow)
+        if audio_bytes is not None:
+            for start in range(0, len(audio_bytes), AUDIO_STREAM_CHUNK_SIZE):
+                yield audio_bytes[start:start + AUDIO_STREAM_CHUNK_SIZE]
+            return
+        if audio_cache:
+            cached_path = audio_cache.get(clean_text, lang, slow)
+            if cached_path:
+                with open(cached_path, "rb") as f:
+                    for piece in iter(lambda: f.read(AUDIO_STREAM_CHUNK_SIZE), b""):
+                        yield piece
+                return
+        
+        max_chars = get_tts_backend().max_chars
+        segments = [chunk.strip() for chunk in iter_chunks([clean_text], max_chars)]
+        segments = [segment for segment in segments if segment]
+        pieces = []
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="tts-segment") as executor:
+            futures = [executor.submit(fetch_segment, segment, lang, slow) for segment in segments]
+            try:
+                for future in futures:
+                    piece = future.result()
+                    pieces.append(piece)
+                    yield piece
+            finally:
+                for future in futures:
+                    future.cancel()
+        
+        if audio_cache and pieces:
+            audio_cache.put_bytes(clean_text, lang, slow, b"".join(pieces))
+        
+    except Exception as e:
+        raise Exception(f"Text-to-speech conversion failed: {str(e)}")
+
+# Maximum number of blocking backend calls the async API runs at once
+ASYNC_CONCURRENCY = int(os.environ.get("TRANSLATOR_ASYNC_CONCURRENCY", "32"))
+
+_async_executor = ThreadPoolExecutor(max_workers=ASYNC_CONCURRENCY, thread_name_prefix="translate-async")
+_async_semaphores = weakref.WeakKeyDictionary()
+
+def _get_async_semaphore() -> asyncio.Semaphore:
+    """Return the concurrency semaphore shared by every async call on the running loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _async_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(ASYNC_CONCURRENCY)
+        _async_semaphores[loop] = semaphore
+    return semaphore
+
+async def _run_blocking(timeout: Optional[float], func, *args):
+    """Run a blocking call on the async executor, bounded by the shared semaphore."""
+    loop = asyncio.get_running_loop()
+    async with _get_async_semaphore():
+        return await asyncio.wait_for(loop.run_in_executor(_async_executor, func, *args), timeout)
+
+async def translate_text_async(source_lang: str, target_lang: str, text: str,
+                               timeout: Optional[float] = None) -> str:
+    """
+    Async variant of translate_text sharing its cache and error handling.
+    Cache hits return without leaving the event loop. Cancelling the task
+    stops waiting immediately; the backend call finishes in the background
+    and still populates the cache.
+    
+    Args:
+        source_lang (str): Source language code (e.g., 'en', 'es', 'fr')
+        target_lang (str): Target language code (e.g., 'en', 'es', 'fr')
+        text (str): Text to translate
+        timeout (float): Seconds to wait for the backend (None = no limit)
+    
+    Returns:
+        str: Translated text
+    
+    Raises:
+        ValueError: If text is empty or None
+        Exception: If translation fails or times out
+    """
+    if not text or text.strip() == "":
+        raise ValueError("Text cannot be empty or None")
+    
+    key, case = _normalizer.normalize(text.strip())
+    prepared = _prepare(source_lang, target_lang, key)
+    if prepared is None:
+        return _normalizer.restore(key, case)
+    cached = _lookup_prepared(target_lang, prepared)
+    restored = _restore_prepared(prepared, cached) if cached is not None else None
+    if restored is not None:
+        return _normalizer.restore(restored, case)
+    
+    try:
+        # Identical requests on this loop await one shared executor call
+        translated_text = await _translate_flight.do_async(
+            (prepared.source, target_lang, key),
+            lambda: _run_blocking(None, _translate_prepared, target_lang, key, prepared, cached),
+            timeout,
+        )
+        return _normalizer.restore(translated_text, case)
+    except asyncio.TimeoutError:
+        raise Exception("Translation request timed out. Please check your internet connection and try again.")
+    except Exception as e:
+        raise _translation_error(e)
+
+def _write_file(path: str, data: bytes) -> None:
+    """Write data to path as a new file: a hard link to a cached clip there is removed, not written through."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    with open(path, "wb") as f:
+        f.write(data)
+
+async def text_to_speech_async(text: str, lang: str, output_file: str = "output.mp3",
+                               slow: bool = False, timeout: Optional[float] = None) -> str:
+    """
+    Async variant of text_to_speech.
+    
+    Args:
+        text (str): Text to convert to speech
+        lang (str): Language code (e.g., 'en', 'es', 'fr')
+        output_file (str): Output MP3 file path (default: "output.mp3")
+        slow (bool): Read the text slowly (default: False)
+        timeout (float): Seconds to wait for the backend (None = no limit)
+    
+    Returns:
+        str: Path to the saved MP3 file
+    
+    Raises:
+        ValueError: If text is empty or None
+        Exception: If TTS conversion fails or times out
+    """
+    if not text or text.strip() == "":
+        raise ValueError("Text cannot be empty or None")
+    
+    clean_text = text.strip()
+    try:
+        # Identical requests on this loop await one shared executor call
+        audio_bytes = await _tts_flight.do_async(
+            (clean_text, lang, slow),
+            lambda: _run_blocking(None, text_to_speech_bytes, clean_text, lang, slow),
+            timeout,
+        )
+        await _run_blocking(None, _write_file, output_file, audio_bytes)
+        return output_file
+    except asyncio.TimeoutError:
+        raise Exception("Text-to-speech conversion failed: request timed out")
+
 def placeholder_function():
     """
     Placeholder function - will be replaced with actual utility functions